@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Content-addressed archive of raw documentation pages.
+Pages are stored once as compressed blobs keyed by the SHA-256 of their bytes;
+each scrape run writes a manifest mapping URL -> hash so historical snapshots
+can be replayed through newer extractors without touching the network.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from appian_output import write_json
+
+try:
+    import zstandard
+except ImportError:  # Optional: fall back to gzip
+    zstandard = None
+
+DEFAULT_ARCHIVE_DIR = 'appian-page-archive'
+EXTENSIONS = {'zstd': '.zst', 'gzip': '.gz'}
+
+
+def page_hash(content: bytes) -> str:
+    """SHA-256 of the raw page bytes (independent of the compression used)."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _compress(content: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=10).compress(content)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("Archive blob is zstd-compressed; install 'zstandard' to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def run_label(source: str) -> str:
+    """Run identifier: timestamp plus the docs version taken from the source URL."""
+    match = re.search(r'/help/([\w.]+)/', source or '')
+    stamp = datetime.now().strftime('%Y%m%dT%H%M%S')
+    return f"{stamp}-{match.group(1)}" if match else stamp
+
+
+class PageArchive:
+    def __init__(self, root: str = DEFAULT_ARCHIVE_DIR, compression: Optional[str] = None):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        self.manifest_dir = os.path.join(root, 'manifests')
+        self.compression = compression or ('zstd' if zstandard is not None else 'gzip')
+        if self.compression not in EXTENSIONS:
+            raise ValueError(f"Unknown compression: {self.compression}")
+        if self.compression == 'zstd' and zstandard is None:
+            raise RuntimeError("zstd compression requires the 'zstandard' package")
+
+        self.pages = {}  # URL -> hash for the current run
+        self.replay_pages = None  # URL -> hash when replaying an archived run
+        self.stats = {'stored': 0, 'reused': 0, 'bytes': 0, 'storedBytes': 0}
+        self.lock = threading.Lock()  # Pages may be archived from several fetch workers
+
+    @property
+    def replaying(self) -> bool:
+        return self.replay_pages is not None
+
+    def _blob_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest + EXTENSIONS[codec])
+
+    def _find_blob(self, digest: str) -> Optional[Tuple[str, str]]:
+        for codec in EXTENSIONS:
+            path = self._blob_path(digest, codec)
+            if os.path.exists(path):
+                return path, codec
+        return None
+
+    def has(self, digest: str) -> bool:
+        return self._find_blob(digest) is not None
+
+    def put(self, url: str, content: bytes) -> str:
+        """Archive a page's raw bytes (stored once per unique content) and record it for this run."""
+        digest = page_hash(content)
+        with self.lock:
+            self.pages[url] = digest
+            self.stats['bytes'] += len(content)
+            if self.has(digest):
+                self.stats['reused'] += 1
+                return digest
+
+        path = self._blob_path(digest, self.compression)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = _compress(content, self.compression)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)  # Atomic, so concurrent writers never expose a partial blob
+
+        with self.lock:
+            self.stats['stored'] += 1
+            self.stats['storedBytes'] += len(data)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Raw page bytes for a hash."""
+        found = self._find_blob(digest)
+        if not found:
+            raise KeyError(digest)
+        path, codec = found
+        with open(path, 'rb') as f:
+            return _decompress(f.read(), codec)
+
+    def save_manifest(self, source: str = '', run_id: Optional[str] = None) -> str:
+        """Write the URL -> hash manifest for the current run and return its path."""
+        run_id = run_id or run_label(source)
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        path = os.path.join(self.manifest_dir, f"{run_id}.json")
+        manifest = {
+            'run': run_id,
+            'source': source,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'compression': self.compression,
+            'pages': dict(sorted(self.pages.items()))
+        }
+        write_json(path, manifest)
+        return path
+
+    def list_runs(self) -> List[str]:
+        """Archived run ids, oldest first."""
+        if not os.path.isdir(self.manifest_dir):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.manifest_dir) if name.endswith('.json'))
+
+    def load_manifest(self, run: str = 'latest') -> Dict:
+        """Load a run manifest by id (or 'latest')."""
+        if run == 'latest':
+            runs = self.list_runs()
+            if not runs:
+                raise FileNotFoundError(f"No archived runs in {self.manifest_dir}")
+            run = runs[-1]
+        with open(os.path.join(self.manifest_dir, f"{run}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def start_replay(self, run: str = 'latest') -> Dict:
+        """Serve pages from an archived run instead of the network (see lookup)."""
+        manifest = self.load_manifest(run)
+        self.replay_pages = manifest['pages']
+        return manifest
+
+    def lookup(self, url: str) -> Optional[bytes]:
+        """Raw bytes for a URL in the run being replayed, or None if it was not archived."""
+        digest = (self.replay_pages or {}).get(url)
+        return self.get(digest) if digest else None
+
+    def iter_pages(self, run: str = 'latest') -> Iterator[Tuple[str, bytes]]:
+        """Stream (url, raw bytes) for every page in an archived run."""
+        for url, digest in self.load_manifest(run)['pages'].items():
+            yield url, self.get(digest)
+
+
+def archive_stats(archive: PageArchive) -> Dict:
+    """Blob count, on-disk size and per-run page counts for an archive."""
+    blobs = 0
+    size = 0
+    if os.path.isdir(archive.blob_dir):
+        for directory, _, files in os.walk(archive.blob_dir):
+            for name in files:
+                blobs += 1
+                size += os.path.getsize(os.path.join(directory, name))
+    runs = {run: len(archive.load_manifest(run)['pages']) for run in archive.list_runs()}
+    return {'blobs': blobs, 'bytes': size, 'runs': runs}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Inspect the raw page archive written by the scrapers',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Archived runs and storage used
+  python3 appian_archive.py
+
+  # Pages in the latest run
+  python3 appian_archive.py --run latest
+
+  # Re-run the enhanced extractors against an archived run (no network)
+  python3 scrape_appian_docs_enhanced.py --replay latest
+        """
+    )
+    parser.add_argument('--archive-dir', type=str, default=DEFAULT_ARCHIVE_DIR,
+                        help=f'Archive directory (default: {DEFAULT_ARCHIVE_DIR})')
+    parser.add_argument('--run', type=str, help="List the pages of one run (id or 'latest')")
+    args = parser.parse_args()
+
+    archive = PageArchive(args.archive_dir, compression='gzip')
+    if args.run:
+        manifest = archive.load_manifest(args.run)
+        for url, digest in manifest['pages'].items():
+            print(f"{digest[:16]}  {url}")
+        print(f"\n{len(manifest['pages'])} pages in run {manifest['run']}")
+        return
+
+    stats = archive_stats(archive)
+    for run, pages in stats['runs'].items():
+        print(f"{run}: {pages} pages")
+    print(f"\n{stats['blobs']} unique pages, {stats['bytes'] / 1024 / 1024:.1f} MB on disk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+appian-docs: one command-line entry point for the scraper and its tools.
+Installed as a console script by setup.py (python3 appian_cli.py works too):
+
+    scrape    every output from one pass, as JSON, SQLite and/or columnar tables
+    snippets  the VS Code snippets file only
+    index     compile the editor function index (appian_index.py)
+    diff      semantic diff between scraped releases (appian_diff.py)
+    validate  quality report and release gate (appian_validate.py)
+
+Scrapes show a progress bar (throughput and ETA) and take shared flags for
+workers, rate limits, the page cache (raw page archive) and offline replay.
+Subcommand modules are imported only when their subcommand runs.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+from datetime import date
+from typing import Dict, List, Optional
+
+DOCS_URL = "https://docs.appian.com/suite/help/{version}/Appian_Functions.html"
+DEFAULT_DOCS_VERSION = '25.4'
+JSON_FORMAT = 'json'
+SQLITE_FORMAT = 'sqlite'
+COLUMNAR_FORMATS = ('parquet', 'feather', 'csv')  # Written by appian_export.py
+OUTPUT_FORMATS = (JSON_FORMAT, SQLITE_FORMAT) + COLUMNAR_FORMATS
+
+# Subcommands handled by an existing tool's main(argv); name -> (module, summary)
+DELEGATED = {
+    'index': ('appian_index', 'Compile the scraped docs into the editor function index'),
+    'diff': ('appian_diff', 'Semantic diff and changelog between scraped releases'),
+    'validate': ('appian_validate', 'Score the generated outputs and gate a release (offline)'),
+}
+
+
+def parse_formats(value: str) -> List[str]:
+    """Comma-separated output formats (argparse type)."""
+    formats = [fmt.strip() for fmt in value.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(f"unknown format(s) {', '.join(unknown) or value!r}; "
+                                         f"choose from {', '.join(OUTPUT_FORMATS)}")
+    return formats
+
+
+def parse_codecs(value: str) -> List[str]:
+    """Comma-separated compressions for the JSON outputs (argparse type)."""
+    from appian_output import parse_compressions
+    try:
+        return parse_compressions(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def scrape_options() -> argparse.ArgumentParser:
+    """Flags shared by the scrape and snippets subcommands."""
+    # Imported here so the read-only subcommands do not load the scraper stack
+    from appian_archive import DEFAULT_ARCHIVE_DIR
+    from appian_scheduler import DEFAULT_STATS_FILE
+
+    options = argparse.ArgumentParser(add_help=False)
+    source = options.add_argument_group('source')
+    source.add_argument('--url', type=str, help='Appian Functions page to start from (overrides --docs-version)')
+    source.add_argument('--docs-version', type=str, default=DEFAULT_DOCS_VERSION, metavar='VERSION',
+                        help=f'Appian docs version to scrape (default: {DEFAULT_DOCS_VERSION})')
+    source.add_argument('--toc', type=str, metavar='URL',
+                        help='Docs table of contents (JSON) to discover functions from in one fetch')
+    source.add_argument('--sitemap', type=str, metavar='URL',
+                        help='Sitemap used to keep only listing links to pages that exist')
+    source.add_argument('--limit', type=int, help='Only process the first N functions')
+
+    fetching = options.add_argument_group('fetching')
+    fetching.add_argument('--workers', type=int, default=4, help='Pages fetched in parallel (default: 4)')
+    fetching.add_argument('--rate-limit', type=float, metavar='RPS',
+                          help='Maximum requests per second across all workers (default: unlimited)')
+    fetching.add_argument('--retries', type=int, default=2,
+                          help='Extra attempts for a page that fails to fetch (default: 2)')
+    fetching.add_argument('--cache', action='store_true',
+                          help='Keep fetched pages in --cache-dir for --offline re-runs (off by default; never pruned)')
+    fetching.add_argument('--cache-dir', type=str, default=DEFAULT_ARCHIVE_DIR,
+                          help=f'Raw page cache directory (default: {DEFAULT_ARCHIVE_DIR})')
+    fetching.add_argument('--offline', type=str, nargs='?', const='latest', metavar='RUN',
+                          help="Read pages from a cached run (id, or the latest when omitted) instead of the network")
+    fetching.add_argument('--shared-cache', type=str, metavar='DIR',
+                          help='Fetch cache shared with other scrape jobs on this host: each page is downloaded once '
+                               'and --rate-limit applies to all jobs together')
+    fetching.add_argument('--shared-cache-ttl', type=float, default=24.0, metavar='HOURS',
+                          help='Hours a shared-cache page is reused before it is downloaded again (default: 24)')
+    fetching.add_argument('--stats', type=str, default=DEFAULT_STATS_FILE,
+                          help=f'Per-URL cost history for longest-first scheduling (default: {DEFAULT_STATS_FILE})')
+
+    output = options.add_argument_group('output')
+    output.add_argument('--output-dir', type=str, default='.', help='Directory for the output files (default: .)')
+    output.add_argument('--scraped-date', type=str, metavar='YYYY-MM-DD',
+                        help="Date recorded in the metadata (default: today, or the cached run's date offline)")
+    output.add_argument('--compress', type=parse_codecs, default=[], metavar='CODECS',
+                        help='Also write compressed copies of each JSON file: gzip, zstd or gzip,zstd')
+    output.add_argument('--no-progress', action='store_true',
+                        help='Print a line per page instead of the progress bar')
+    return options
+
+
+def open_source(args) -> Dict:
+    """Base URL, page archive and scraped date for a scrape, replaying the cache when offline."""
+    from appian_archive import PageArchive
+
+    base_url = args.url or DOCS_URL.format(version=args.docs_version)
+    scraped_date = args.scraped_date
+    archive = None
+    if args.offline or args.cache:
+        archive = PageArchive(args.cache_dir)
+        if args.offline:
+            manifest = archive.start_replay(args.offline)
+            base_url = manifest['source'] or base_url
+            scraped_date = scraped_date or manifest.get('created', '')[:10] or None
+            print(f"Offline: replaying cached run {manifest['run']} ({len(manifest['pages'])} pages)")
+    shared_cache = None
+    if args.shared_cache and not args.offline:
+        from appian_fetch_cache import SharedFetchCache
+        shared_cache = SharedFetchCache(args.shared_cache, ttl=args.shared_cache_ttl * 3600, rate_limit=args.rate_limit)
+    return {'base_url': base_url, 'archive': archive, 'shared_cache': shared_cache,
+            'scraped_date': scraped_date or date.today().isoformat()}
+
+
+def run_pipeline(args, source: Dict, emitters: List, docs_scraper) -> Dict[str, Dict]:
+    """Run the single-pass pipeline with the CLI's fetch settings."""
+    from appian_discovery import FunctionDiscovery
+    from appian_pipeline import ScrapePipeline
+
+    base_url = source['base_url']
+    shared_cache = source['shared_cache']
+    docs_scraper.log_fetches = args.no_progress  # The progress bar replaces the per-URL lines
+    if shared_cache:
+        # The cache spaces requests across every job, so no per-process limit on top
+        docs_scraper.session = shared_cache.session(docs_scraper.session)
+    pipeline = ScrapePipeline(base_url, emitters, fetch=docs_scraper.fetch_page, fetch_raw=docs_scraper.fetch_raw,
+                              discovery=FunctionDiscovery(base_url, toc_url=args.toc, sitemap_url=args.sitemap),
+                              archive=source['archive'], workers=args.workers, stats_file=args.stats,
+                              low_memory=getattr(args, 'low_memory', False), retries=args.retries,
+                              rate_limit=None if shared_cache else args.rate_limit, progress=not args.no_progress)
+    outputs = pipeline.run(limit=args.limit)
+    if shared_cache:
+        stats = shared_cache.stats
+        print(f"Shared cache: {stats['downloads']} downloaded, {stats['hits']} reused, {stats['coalesced']} waited "
+              f"for another job's download, {stats['throttled']:.1f}s rate-limited")
+    return outputs
+
+
+def write_formats(outputs: Dict[str, Dict], formats: List[str], output_dir: str,
+                  compressions: List[str] = ()) -> List[str]:
+    """Write the scraped artifacts in each requested format; returns the paths written."""
+    from appian_pipeline import OUTPUT_FILES, write_outputs
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    if JSON_FORMAT in formats:
+        files = {name: os.path.join(output_dir, OUTPUT_FILES[name][0]) for name in outputs}
+        written.extend(write_outputs(outputs, files, compressions))
+
+    docs, syntax = outputs.get('docs', {}), outputs.get('syntax', {})
+    if SQLITE_FORMAT in formats:
+        from appian_store import DEFAULT_STORE_FILE, build_store
+        path = os.path.join(output_dir, DEFAULT_STORE_FILE)
+        build_store(docs, syntax, path)
+        written.append(path)
+
+    columnar = [fmt for fmt in formats if fmt in COLUMNAR_FORMATS]
+    if columnar:
+        from appian_diff import version_label
+        from appian_export import DEFAULT_EXPORT_DIR, export_releases
+        release = {'version': version_label(docs, fallback='unknown'), 'functions': docs.get('functions', {}),
+                   'syntax': syntax.get('functions', {})}
+        path = os.path.join(output_dir, DEFAULT_EXPORT_DIR)
+        for fmt in columnar:
+            export_releases([release], path, fmt)
+            written.append(f"{path}/ ({fmt})")
+    return written
+
+
+def cmd_scrape(args) -> int:
+    """Every output from one fetch per page."""
+    from scrape_appian_docs import AppianDocScraper, SnippetEmitter
+    from scrape_appian_docs_enhanced import DocsEmitter, EnhancedAppianDocScraper
+
+    source = open_source(args)
+    snippet_scraper = AppianDocScraper(base_url=source['base_url'], archive=source['archive'])
+    docs_scraper = EnhancedAppianDocScraper(base_url=source['base_url'], archive=source['archive'])
+    emitters = [SnippetEmitter(snippet_scraper),
+                DocsEmitter(docs_scraper, low_memory=args.low_memory, scraped_date=source['scraped_date'])]
+    outputs = run_pipeline(args, source, emitters, docs_scraper)
+    if not outputs.get('docs', {}).get('functions'):
+        print("No documentation generated")
+        return 1
+
+    for path in write_formats(outputs, args.format, args.output_dir, args.compress):
+        print(f"✓ Saved to: {path}")
+    print(f"\n✓ {len(outputs['snippets'])} snippets and {len(outputs['docs']['functions'])} documented functions "
+          f"from {source['base_url']} (scraped {source['scraped_date']})")
+    return 0
+
+
+def cmd_snippets(args) -> int:
+    """The VS Code snippets file only."""
+    from appian_pipeline import OUTPUT_FILES, write_outputs
+    from scrape_appian_docs import AppianDocScraper, SnippetEmitter
+
+    source = open_source(args)
+    scraper = AppianDocScraper(base_url=source['base_url'], archive=source['archive'])
+    outputs = run_pipeline(args, source, [SnippetEmitter(scraper)], scraper)
+    if not outputs.get('snippets'):
+        print("No snippets generated")
+        return 1
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    path = args.output or os.path.join(args.output_dir, OUTPUT_FILES['snippets'][0])
+    written = write_outputs({'snippets': outputs['snippets']}, {'snippets': path}, args.compress)
+    print(f"\n✓ Generated {len(outputs['snippets'])} snippets")
+    for path in written:
+        print(f"✓ Saved to: {path}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='appian-docs',
+        description='Scrape Appian function documentation and build snippets, docs, indexes and reports',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Every output for Appian 25.4, 8 pages in parallel, at most 5 requests a second
+  appian-docs scrape --workers 8 --rate-limit 5
+
+  # Appian 26.0 into its own directory, as JSON plus SQLite and CSV tables
+  appian-docs scrape --docs-version 26.0 --output-dir 26.0 --format json,sqlite,csv
+
+  # Keep the fetched pages, then rebuild every output from them (no network)
+  appian-docs scrape --cache
+  appian-docs scrape --offline
+
+  # Several jobs on one host share downloads (and a 5 requests/s limit) through one cache
+  appian-docs scrape --output-dir full --shared-cache /tmp/appian-fetch-cache --rate-limit 5 &
+  appian-docs snippets --output-dir lsp --shared-cache /tmp/appian-fetch-cache --rate-limit 5 &
+
+  # Snippets only, first 20 functions, plus a gzip copy for editor clients
+  appian-docs snippets --limit 20 --compress gzip
+
+  # Tools on the generated outputs (each takes its own --help)
+  appian-docs index
+  appian-docs diff 25.4/appian-functions-docs.json 26.0/appian-functions-docs.json
+  appian-docs validate --min-score 50 --fail-on fetch_error
+        """
+    )
+    subcommands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    options = scrape_options()
+
+    scrape = subcommands.add_parser('scrape', parents=[options], help='Scrape every output in one pass',
+                                    description='Scrape snippets, docs, syntax map and examples in one pass')
+    scrape.add_argument('--format', type=parse_formats, default=[JSON_FORMAT], metavar='FORMATS',
+                        help=f"Comma-separated output formats: {', '.join(OUTPUT_FORMATS)} (default: json)")
+    scrape.add_argument('--low-memory', action='store_true',
+                        help='Compact records and free parse trees early; reports peak memory per 100 pages')
+    scrape.set_defaults(handler=cmd_scrape)
+
+    snippets = subcommands.add_parser('snippets', parents=[options], help='Scrape the VS Code snippets file only',
+                                      description='Scrape the VS Code snippets file only')
+    snippets.add_argument('--output', type=str,
+                          help='Snippets file (default: <output-dir>/appian-functions-complete.json)')
+    snippets.set_defaults(handler=cmd_snippets)
+
+    for name, (_, summary) in DELEGATED.items():
+        subcommands.add_parser(name, help=summary, add_help=False)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in DELEGATED:
+        # The tool parses its own flags (so "appian-docs diff --help" shows the diff options)
+        module = importlib.import_module(DELEGATED[argv[0]][0])
+        module.main(argv[1:], prog=f"appian-docs {argv[0]}")
+        return 0
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.command:
+        parser.print_help()
+        return 2
+    if args.command == 'scrape':
+        from appian_export import pyarrow
+        if pyarrow is None and any(fmt in args.format for fmt in ('parquet', 'feather')):
+            parser.error('parquet and feather output require pyarrow (use --format csv)')
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
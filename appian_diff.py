@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Semantic diff between scraped Appian releases.
+Compares appian-functions-docs.json (+ appian-function-syntax.json) from two or
+more releases and emits a structured changelog as JSON and Markdown.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+from appian_output import atomic_write, write_json
+
+# Record fields compared between releases (descriptions are fingerprinted, not diffed)
+COMPARED_FIELDS = ('returnType', 'category')
+# Prose and list fields only reported as updated, with their Markdown wording
+UPDATED_FIELDS = {
+    'description': 'Description',
+    'returnDescription': 'Return description',
+    'useCase': 'Use case',
+    'examples': 'Examples',
+    'relatedFunctions': 'Related functions',
+}
+
+
+def version_label(docs: Dict, fallback: str = '') -> str:
+    """Derive a release label (e.g. '25.4') from the docs metadata source URL."""
+    source = docs.get('metadata', {}).get('source', '')
+    match = re.search(r'/help/([\w.]+)/', source)
+    return match.group(1) if match else (fallback or source)
+
+
+def load_release(docs_file: str, syntax_file: Optional[str] = None) -> Dict:
+    """Load one release's docs (and optional syntax map) into a diffable structure."""
+    with open(docs_file, 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+
+    syntax = {}
+    if syntax_file and os.path.exists(syntax_file):
+        with open(syntax_file, 'r', encoding='utf-8') as f:
+            syntax = json.load(f).get('functions', {})
+
+    return {
+        'version': version_label(docs, fallback=os.path.basename(docs_file)),
+        'functions': docs.get('functions', {}),
+        'syntax': syntax
+    }
+
+
+def fingerprint(record: Dict, syntax_info: Optional[Dict] = None) -> str:
+    """Stable hash of a function record plus its syntax entry."""
+    canonical = json.dumps([record, syntax_info or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _parameters_by_keyword(record: Dict) -> Dict[str, Dict]:
+    """Index a record's parameters by lowercase keyword."""
+    parameters = {}
+    for display_name, param in record.get('parameters', {}).items():
+        keyword = param.get('type') or display_name
+        parameters[keyword.lower()] = dict(param, keyword=keyword)
+    return parameters
+
+
+def _diff_parameters(old: Dict, new: Dict) -> Dict:
+    old_params = _parameters_by_keyword(old)
+    new_params = _parameters_by_keyword(new)
+    changes = {}
+
+    added = [new_params[key]['keyword'] for key in new_params if key not in old_params]
+    removed = [old_params[key]['keyword'] for key in old_params if key not in new_params]
+    changed = {}
+    described = []
+    for key in new_params.keys() & old_params.keys():
+        field_changes = {}
+        for field in ('dataType', 'required'):
+            if old_params[key].get(field) != new_params[key].get(field):
+                field_changes[field] = {'old': old_params[key].get(field), 'new': new_params[key].get(field)}
+        if field_changes:
+            changed[new_params[key]['keyword']] = field_changes
+        if old_params[key].get('description', '') != new_params[key].get('description', ''):
+            described.append(new_params[key]['keyword'])
+
+    if added:
+        changes['added'] = added
+    if removed:
+        changes['removed'] = removed
+    if changed:
+        changes['changed'] = dict(sorted(changed.items()))
+    if described:
+        changes['described'] = sorted(described)
+    return changes
+
+
+def diff_function(old: Dict, new: Dict, old_syntax: Optional[Dict] = None,
+                  new_syntax: Optional[Dict] = None) -> Dict:
+    """Field-level changes between two versions of one function record."""
+    changes = {}
+
+    parameters = _diff_parameters(old, new)
+    if parameters:
+        changes['parameters'] = parameters
+
+    for field in COMPARED_FIELDS:
+        if old.get(field, '') != new.get(field, ''):
+            changes[field] = {'old': old.get(field, ''), 'new': new.get(field, '')}
+
+    old_keyword = (old_syntax or {}).get('keywordSyntax', 'unknown')
+    new_keyword = (new_syntax or {}).get('keywordSyntax', 'unknown')
+    if old_keyword != new_keyword:
+        changes['keywordSyntax'] = {'old': old_keyword, 'new': new_keyword}
+    if any((old_syntax or {}).get(field) != (new_syntax or {}).get(field) for field in ('evidence', 'confidence')):
+        changes['syntaxEvidence'] = True
+
+    for field in UPDATED_FIELDS:
+        if (old.get(field) or None) != (new.get(field) or None):  # Missing and empty are the same
+            changes[field] = True
+
+    return changes
+
+
+def diff_releases(old: Dict, new: Dict) -> Dict:
+    """Compare two loaded releases; runs in time linear in the number of functions.
+
+    Records are matched by name through dict lookups, and records with identical
+    fingerprints are skipped without a field-by-field comparison.
+    """
+    old_functions = old['functions']
+    new_functions = new['functions']
+
+    changelog = {
+        'from': old['version'],
+        'to': new['version'],
+        'added': sorted(name for name in new_functions if name not in old_functions),
+        'removed': sorted(name for name in old_functions if name not in new_functions),
+        'deprecated': [],
+        'undeprecated': [],
+        'changed': {},
+        'unchanged': 0
+    }
+
+    for name in sorted(new_functions.keys() & old_functions.keys()):
+        old_record, new_record = old_functions[name], new_functions[name]
+        old_syntax, new_syntax = old['syntax'].get(name), new['syntax'].get(name)
+        if fingerprint(old_record, old_syntax) == fingerprint(new_record, new_syntax):
+            changelog['unchanged'] += 1
+            continue
+
+        was_deprecated = bool(old_record.get('deprecated', False))
+        is_deprecated = bool(new_record.get('deprecated', False))
+        if is_deprecated and not was_deprecated:
+            changelog['deprecated'].append(name)
+        elif was_deprecated and not is_deprecated:
+            changelog['undeprecated'].append(name)
+
+        changes = diff_function(old_record, new_record, old_syntax, new_syntax)
+        if not changes and is_deprecated == was_deprecated:
+            # The fingerprint differs in a field no comparison covers: still rebuild it
+            changes = {'other': True}
+        if changes:
+            changelog['changed'][name] = changes
+
+    return changelog
+
+
+def diff_history(releases: List[Dict]) -> List[Dict]:
+    """Changelogs between each consecutive pair of releases (oldest first)."""
+    return [diff_releases(old, new) for old, new in zip(releases, releases[1:])]
+
+
+def functions_to_rebuild(changelog: Dict) -> List[str]:
+    """Functions whose derived artifacts (snippets, index entries) need regenerating."""
+    names = set(changelog['added']) | set(changelog['changed']) | set(changelog['deprecated']) | \
+        set(changelog['undeprecated'])
+    return sorted(names)
+
+
+def _format_value(value) -> str:
+    return f"`{value}`" if value not in ('', None) else '_(none)_'
+
+
+def render_markdown(changelogs: List[Dict]) -> str:
+    """Render one or more changelogs as Markdown."""
+    lines = ['# Appian Function Changelog', '']
+    for changelog in reversed(changelogs):  # Newest release first
+        lines.append(f"## {changelog['from']} → {changelog['to']}")
+        lines.append('')
+        lines.append(f"{len(changelog['added'])} added, {len(changelog['removed'])} removed, "
+                     f"{len(changelog['deprecated'])} deprecated, {len(changelog['changed'])} changed, "
+                     f"{changelog['unchanged']} unchanged")
+        lines.append('')
+
+        for title, key in [('Added', 'added'), ('Removed', 'removed'),
+                           ('Deprecated', 'deprecated'), ('No longer deprecated', 'undeprecated')]:
+            if changelog[key]:
+                lines.append(f"### {title}")
+                lines.append('')
+                lines.extend(f"- `{name}`" for name in changelog[key])
+                lines.append('')
+
+        if changelog['changed']:
+            lines.append('### Changed')
+            lines.append('')
+            for name, changes in changelog['changed'].items():
+                lines.append(f"- `{name}`")
+                parameters = changes.get('parameters', {})
+                if parameters.get('added'):
+                    lines.append(f"  - New parameters: {', '.join(f'`{p}`' for p in parameters['added'])}")
+                if parameters.get('removed'):
+                    lines.append(f"  - Removed parameters: {', '.join(f'`{p}`' for p in parameters['removed'])}")
+                for keyword, fields in parameters.get('changed', {}).items():
+                    for field, values in fields.items():
+                        lines.append(f"  - `{keyword}` {field}: {_format_value(values['old'])} → "
+                                     f"{_format_value(values['new'])}")
+                if parameters.get('described'):
+                    lines.append(f"  - Parameter descriptions updated: "
+                                 f"{', '.join(f'`{p}`' for p in parameters['described'])}")
+                for field in COMPARED_FIELDS + ('keywordSyntax',):
+                    if field in changes:
+                        lines.append(f"  - {field}: {_format_value(changes[field]['old'])} → "
+                                     f"{_format_value(changes[field]['new'])}")
+                if changes.get('syntaxEvidence'):
+                    lines.append('  - Keyword syntax evidence updated')
+                for field, label in UPDATED_FIELDS.items():
+                    if changes.get(field):
+                        lines.append(f"  - {label} updated")
+                if changes.get('other'):
+                    lines.append('  - Other fields updated')
+            lines.append('')
+
+    return '\n'.join(lines).rstrip() + '\n'
+
+
+def _parse_release_spec(spec: str) -> Dict:
+    """'docs.json' or 'docs.json,syntax.json' -> loaded release."""
+    docs_file, _, syntax_file = spec.partition(',')
+    return load_release(docs_file, syntax_file or None)
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Semantic diff between scraped Appian releases',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Compare two releases (docs file, optionally ",syntax file")
+  python3 appian_diff.py 25.4/appian-functions-docs.json,25.4/appian-function-syntax.json \\
+                         26.0/appian-functions-docs.json,26.0/appian-function-syntax.json
+
+  # Changelog across a release history, oldest first
+  python3 appian_diff.py 25.2/docs.json 25.3/docs.json 25.4/docs.json --markdown CHANGELOG.md
+        """
+    )
+    parser.add_argument('releases', nargs='+', help='Release docs files, oldest first (docs.json[,syntax.json])')
+    parser.add_argument('--output', type=str, default='appian-changelog.json',
+                        help='Changelog JSON file (default: appian-changelog.json)')
+    parser.add_argument('--markdown', type=str, default='appian-changelog.md',
+                        help='Changelog Markdown file (default: appian-changelog.md)')
+    args = parser.parse_args(argv)
+
+    if len(args.releases) < 2:
+        parser.error('at least two releases are required')
+
+    releases = [_parse_release_spec(spec) for spec in args.releases]
+    changelogs = diff_history(releases)
+
+    write_json(args.output, {'changelogs': changelogs, 'rebuild': functions_to_rebuild(changelogs[-1])})
+    atomic_write(args.markdown, render_markdown(changelogs).encode('utf-8'))
+
+    latest = changelogs[-1]
+    print(f"{latest['from']} → {latest['to']}: {len(latest['added'])} added, {len(latest['removed'])} removed, "
+          f"{len(latest['deprecated'])} deprecated, {len(latest['changed'])} changed")
+    print(f"Saved to: {args.output}, {args.markdown}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Function discovery: which pages the scrape fetches.
+A docs table of contents (JSON) gives names and URLs in one small fetch; a
+sitemap restricts the listing page's links to pages that exist; without
+either, the Appian_Functions.html link heuristic is used. Every source goes
+through the same filter: function-like names only, URLs inside the docs
+version, and each canonical URL once (aliases are kept on the first entry),
+so the fetch stage never sees a duplicate or non-function URL.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Set, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from appian_matchers import docs_version
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# Docs version -> discovery sources, e.g.
+# {'25.4': {'toc': 'https://docs.appian.com/suite/help/25.4/toc.json',
+#           'sitemap': 'https://docs.appian.com/suite/help/25.4/sitemap.xml'}}
+DISCOVERY_SOURCES: Dict[str, Dict[str, str]] = {}
+
+# 'a!forEach()', 'append()', 'a!textField' ('()' optional; the listing adds it)
+FUNCTION_NAME = re.compile(r'^(?:a!)?[A-Za-z][\w.]*(?:\(\))?$')
+DEPRECATED_MARK = '[Deprecated]'
+# Keys a TOC entry may use for its title, link, child entries and summary
+TOC_TITLE_KEYS = ('title', 'name', 'text', 'label')
+TOC_URL_KEYS = ('url', 'href', 'link', 'path')
+TOC_CHILD_KEYS = ('children', 'items', 'entries', 'topics', 'pages')
+TOC_SUMMARY_KEYS = ('summary', 'description')
+
+
+def canonical_url(url: str, base_url: str = '') -> str:
+    """Absolute URL without fragment or query, lowercase scheme and host, '.'/'..' segments resolved."""
+    parts = urlsplit(urljoin(base_url, url.strip()))
+    path = urlsplit(urljoin(f"{parts.scheme}://{parts.netloc}/", parts.path or '/')).path
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+
+
+def docs_root(base_url: str) -> str:
+    """Directory holding the version's pages: '.../help/25.4/Appian_Functions.html' -> '.../help/25.4/'."""
+    canonical = canonical_url(base_url)
+    return canonical[:canonical.rfind('/') + 1]
+
+
+def function_key(text: str) -> Optional[Tuple[str, bool]]:
+    """Link or TOC title -> ('name()', deprecated), or None if it does not name a function."""
+    deprecated = DEPRECATED_MARK in text
+    name = text.replace(DEPRECATED_MARK, '').strip()
+    name = re.sub(r'\s+function$', '', name, flags=re.IGNORECASE)  # 'append() Function'
+    if not FUNCTION_NAME.match(name):
+        return None
+    if not name.endswith('()'):
+        name += '()'
+    return name, deprecated
+
+
+def _listing_description(link) -> str:
+    """Description text near a function link on the listing page."""
+    parent = link.parent
+    if parent:
+        desc = parent.get_text(strip=True)
+        return desc[:200] + "..." if len(desc) > 200 else desc
+    return ""
+
+
+class FunctionSet:
+    """Discovered functions keyed by 'name()', one entry per canonical page URL."""
+
+    def __init__(self, base_url: str, allowed: Optional[Set[str]] = None):
+        self.base_url = base_url
+        self.root = docs_root(base_url)
+        self.listing = canonical_url(base_url)
+        self.allowed = allowed  # Canonical URLs from a sitemap; None accepts any page under the root
+        self.functions = {}
+        self.by_url = {}  # canonical URL -> key of its entry
+        self.stats = {'candidates': 0, 'duplicates': 0, 'rejected': 0}
+
+    def is_function_page(self, url: str) -> bool:
+        return (url.startswith(self.root) and url.endswith('.html') and url != self.listing
+                and (self.allowed is None or url in self.allowed))
+
+    def add(self, text: str, href: str, summary: str = '', deprecated: bool = False) -> None:
+        self.stats['candidates'] += 1
+        parsed = function_key(text)
+        url = canonical_url(href, self.base_url) if href else ''
+        if parsed is None or not self.is_function_page(url):
+            self.stats['rejected'] += 1
+            return
+        key, marked = parsed
+        # Plain words only count when the link clearly targets a function page
+        if not (key.startswith('a!') or '()' in text or '/fnc_' in url):
+            self.stats['rejected'] += 1
+            return
+        entry = {
+            'name': key[:-2],
+            'url': url,
+            'deprecated': deprecated or marked,
+            'summary': summary
+        }
+
+        existing = self.by_url.get(url)
+        if existing is None and key not in self.functions:
+            self.functions[key] = entry
+            self.by_url[url] = key
+            return
+
+        self.stats['duplicates'] += 1
+        if existing is None or existing == key:
+            return
+        # Another name for a page already queued: keep one entry, named after a non-deprecated link if there is one
+        primary = self.functions[existing]
+        if primary['deprecated'] and not entry['deprecated'] and key not in self.functions:
+            entry['aliases'] = primary.pop('aliases', []) + [existing]
+            self.functions = {(key if name == existing else name): (entry if name == existing else info)
+                              for name, info in self.functions.items()}
+            self.by_url[url] = key
+        else:
+            primary.setdefault('aliases', []).append(key)
+
+
+def listing_functions(soup: BeautifulSoup, base_url: str, allowed: Optional[Set[str]] = None) -> FunctionSet:
+    """Function links on the listing page (only those in allowed, when a sitemap gave one)."""
+    found = FunctionSet(base_url, allowed)
+    for link in soup.find_all('a', href=True):
+        found.add(link.get_text(strip=True), link['href'], _listing_description(link))
+    return found
+
+
+def discover_functions(soup: BeautifulSoup, base_url: str) -> Dict[str, Dict]:
+    """Function links on the listing page, keyed by 'name()'.
+
+    Each entry has name (without parentheses), url, deprecated and the listing
+    page summary (plus aliases when several names link to the same page).
+    """
+    return listing_functions(soup, base_url).functions
+
+
+def _toc_entries(node) -> Iterator[Dict]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _toc_entries(item)
+    elif isinstance(node, dict):
+        yield node
+        for key in TOC_CHILD_KEYS:
+            if key in node:
+                yield from _toc_entries(node[key])
+
+
+def parse_toc(content: bytes, base_url: str) -> FunctionSet:
+    """Function entries from a TOC JSON document (any nesting of title/url entries)."""
+    found = FunctionSet(base_url)
+    for entry in _toc_entries(json.loads(content)):
+        title = next((entry[key] for key in TOC_TITLE_KEYS if isinstance(entry.get(key), str)), '')
+        href = next((entry[key] for key in TOC_URL_KEYS if isinstance(entry.get(key), str)), '')
+        summary = next((entry[key] for key in TOC_SUMMARY_KEYS if isinstance(entry.get(key), str)), '')
+        if title and href:
+            found.add(title, href, summary[:200], bool(entry.get('deprecated')))
+    return found
+
+
+def parse_sitemap(content: bytes) -> Set[str]:
+    """Canonical page URLs listed in a sitemap.xml (ValueError if it is not XML)."""
+    # Imported here: only sitemap discovery needs the XML parser, and it slows every startup
+    import xml.etree.ElementTree as ElementTree
+    try:
+        root = ElementTree.fromstring(content)
+    except ElementTree.ParseError as e:
+        raise ValueError(e) from e
+    return {canonical_url(element.text) for element in root.iter()
+            if element.tag.rsplit('}', 1)[-1] == 'loc' and element.text}
+
+
+class FunctionDiscovery:
+    """Discover function pages from the best available source (toc, then sitemap + listing, then listing)."""
+
+    def __init__(self, base_url: str, toc_url: Optional[str] = None, sitemap_url: Optional[str] = None):
+        sources = DISCOVERY_SOURCES.get(docs_version(base_url), {})
+        self.base_url = base_url
+        self.toc_url = toc_url or sources.get('toc')
+        self.sitemap_url = sitemap_url or sources.get('sitemap')
+        self.stats = {}
+
+    def run(self, fetch: Callable[[str], Optional[BeautifulSoup]],
+            fetch_raw: Callable[[str], Optional[bytes]],
+            dispose: Optional[Callable] = None) -> Dict[str, Dict]:
+        """Functions keyed by 'name()'; fetch parses HTML pages, fetch_raw returns raw bytes."""
+        if self.toc_url:
+            found = self._parse(fetch_raw, self.toc_url, lambda content: parse_toc(content, self.base_url))
+            if found and found.functions:
+                self.stats = dict(found.stats, source='toc', fetches=1)
+                return found.functions
+            print(f"No functions in TOC {self.toc_url}; falling back to the listing page")
+
+        allowed = None
+        if self.sitemap_url:
+            allowed = self._parse(fetch_raw, self.sitemap_url, parse_sitemap) or None
+            if allowed is None:
+                print(f"No sitemap at {self.sitemap_url}; keeping every listing link")
+
+        soup = fetch(self.base_url)
+        if not soup:
+            print("Failed to fetch main page")
+            return {}
+        found = listing_functions(soup, self.base_url, allowed)
+        if dispose:
+            dispose(soup)
+        self.stats = dict(found.stats, source='sitemap' if allowed else 'listing',
+                          fetches=1 + bool(self.sitemap_url) + bool(self.toc_url))
+        return found.functions
+
+    def _parse(self, fetch_raw: Callable, url: str, parse: Callable):
+        content = fetch_raw(url)
+        if content is None:
+            return None
+        try:
+            return parse(content)
+        except ValueError as e:
+            print(f"Could not read {url}: {e}")
+            return None
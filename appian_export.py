@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Columnar export of the scraped function corpus for analytics.
+Flattens appian-functions-docs.json (+ syntax map) into functions, parameters,
+examples and related-function tables, partitioned by Appian version:
+
+    <output>/<table>/version=<version>/part-0.{parquet,feather,csv}
+
+Parquet/Feather need pyarrow; without it tables are written as CSV.
+"""
+
+import argparse
+import csv
+import glob
+import os
+from typing import Dict, List, Optional
+
+from appian_diff import load_release
+
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:  # Optional: fall back to CSV
+    pyarrow = None
+
+DEFAULT_EXPORT_DIR = 'appian-functions-columnar'
+FORMATS = {'parquet': '.parquet', 'feather': '.feather', 'csv': '.csv'}
+
+# Column name -> type ('string', 'bool' or 'int'); shared by every format so CSV round-trips typed
+TABLES = {
+    'functions': [
+        ('version', 'string'), ('name', 'string'), ('category', 'string'), ('returnType', 'string'),
+        ('deprecated', 'bool'), ('keywordSyntax', 'string'), ('parameterCount', 'int'),
+        ('exampleCount', 'int'), ('description', 'string'), ('useCase', 'string')
+    ],
+    'parameters': [
+        ('version', 'string'), ('function', 'string'), ('position', 'int'), ('keyword', 'string'),
+        ('name', 'string'), ('dataType', 'string'), ('required', 'bool'), ('description', 'string')
+    ],
+    'examples': [
+        ('version', 'string'), ('function', 'string'), ('position', 'int'), ('expression', 'string')
+    ],
+    'related': [
+        ('version', 'string'), ('function', 'string'), ('related', 'string')
+    ]
+}
+
+
+def default_format() -> str:
+    return 'parquet' if pyarrow is not None else 'csv'
+
+
+def flatten_release(release: Dict) -> Dict[str, List[Dict]]:
+    """Flatten one loaded release (see appian_diff.load_release) into table rows."""
+    version = release['version']
+    tables = {name: [] for name in TABLES}
+
+    for name, record in release['functions'].items():
+        parameters = record.get('parameters', {})
+        examples = record.get('examples', [])
+        keyword_syntax = release['syntax'].get(name, {}).get('keywordSyntax', 'unknown')
+
+        tables['functions'].append({
+            'version': version,
+            'name': name,
+            'category': record.get('category', ''),
+            'returnType': record.get('returnType', ''),
+            'deprecated': bool(record.get('deprecated', False)),
+            'keywordSyntax': str(keyword_syntax).lower(),
+            'parameterCount': len(parameters),
+            'exampleCount': len(examples),
+            'description': record.get('description', ''),
+            'useCase': record.get('useCase', '')
+        })
+
+        for position, (display_name, param) in enumerate(parameters.items()):
+            tables['parameters'].append({
+                'version': version,
+                'function': name,
+                'position': position,
+                'keyword': param.get('type', ''),
+                'name': display_name,
+                'dataType': param.get('dataType', ''),
+                'required': bool(param.get('required', False)),
+                'description': param.get('description', '')
+            })
+
+        for position, expression in enumerate(examples):
+            tables['examples'].append({'version': version, 'function': name, 'position': position,
+                                       'expression': expression})
+
+        for related in record.get('relatedFunctions', []):
+            tables['related'].append({'version': version, 'function': name, 'related': related})
+
+    return tables
+
+
+def _arrow_schema(table: str):
+    types = {'string': pyarrow.string(), 'bool': pyarrow.bool_(), 'int': pyarrow.int64()}
+    return pyarrow.schema([(column, types[kind]) for column, kind in TABLES[table]])
+
+
+def _partition_dir(output_dir: str, table: str, version: str) -> str:
+    return os.path.join(output_dir, table, f"version={version}")
+
+
+def write_table(rows: List[Dict], output_dir: str, table: str, version: str, fmt: str) -> str:
+    """Write one table partition, replacing any earlier export of that version."""
+    if fmt in ('parquet', 'feather') and pyarrow is None:
+        raise RuntimeError(f"{fmt} export requires pyarrow (use --format csv)")
+
+    directory = _partition_dir(output_dir, table, version)
+    os.makedirs(directory, exist_ok=True)
+    for stale in glob.glob(os.path.join(directory, 'part-*')):
+        os.remove(stale)
+    path = os.path.join(directory, 'part-0' + FORMATS[fmt])
+
+    if fmt == 'csv':
+        columns = [column for column, _ in TABLES[table]]
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    arrow_table = pyarrow.Table.from_pylist(rows, schema=_arrow_schema(table))
+    if fmt == 'parquet':
+        pyarrow.parquet.write_table(arrow_table, path, compression='zstd')
+    else:
+        pyarrow.feather.write_feather(arrow_table, path, compression='zstd')
+    return path
+
+
+def export_releases(releases: List[Dict], output_dir: str = DEFAULT_EXPORT_DIR,
+                    fmt: Optional[str] = None) -> Dict[str, int]:
+    """Export every table for each release; returns row counts per table."""
+    fmt = fmt or default_format()
+    counts = {name: 0 for name in TABLES}
+    for release in releases:
+        for table, rows in flatten_release(release).items():
+            write_table(rows, output_dir, table, release['version'], fmt)
+            counts[table] += len(rows)
+    return counts
+
+
+def _convert_csv_value(value: str, kind: str):
+    if kind == 'bool':
+        return value == 'True'
+    if kind == 'int':
+        return int(value)
+    return value
+
+
+def read_table(output_dir: str, table: str, versions: Optional[List[str]] = None):
+    """Read a table across version partitions.
+
+    Returns a pyarrow Table when pyarrow is installed (call .to_pandas() for a
+    DataFrame), otherwise a list of typed row dicts read from the CSV partitions.
+    """
+    paths = []
+    for directory in sorted(glob.glob(os.path.join(output_dir, table, 'version=*'))):
+        if versions is None or directory.rsplit('version=', 1)[1] in versions:
+            paths.extend(sorted(glob.glob(os.path.join(directory, 'part-*'))))
+
+    if pyarrow is not None:
+        schema = _arrow_schema(table)
+        parts = []
+        for path in paths:
+            if path.endswith('.parquet'):
+                parts.append(pyarrow.parquet.read_table(path, schema=schema))
+            elif path.endswith('.feather'):
+                parts.append(pyarrow.feather.read_table(path))
+            else:
+                parts.append(pyarrow.csv.read_csv(path, convert_options=pyarrow.csv.ConvertOptions(
+                    column_types={field.name: field.type for field in schema}, true_values=['True'], false_values=['False'])))
+        return pyarrow.concat_tables(parts) if parts else schema.empty_table()
+
+    kinds = dict(TABLES[table])
+    rows = []
+    for path in paths:
+        if not path.endswith('.csv'):
+            raise RuntimeError(f"Reading {path} requires pyarrow")
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                rows.append({column: _convert_csv_value(value, kinds[column]) for column, value in row.items()})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export the scraped function corpus as columnar tables partitioned by version',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Export the current scrape (Parquet if pyarrow is installed, otherwise CSV)
+  python3 appian_export.py
+
+  # Several releases (docs file, optionally ",syntax file") as Feather
+  python3 appian_export.py 25.4/appian-functions-docs.json,25.4/appian-function-syntax.json \\
+                           26.0/appian-functions-docs.json --format feather
+
+  # Load every release into pandas
+  python3 -c "import appian_export; print(appian_export.read_table('appian-functions-columnar', 'parameters').to_pandas())"
+        """
+    )
+    parser.add_argument('releases', nargs='*',
+                        default=['appian-functions-docs.json,appian-function-syntax.json'],
+                        help='Release docs files (docs.json[,syntax.json])')
+    parser.add_argument('--output', type=str, default=DEFAULT_EXPORT_DIR,
+                        help=f'Output directory (default: {DEFAULT_EXPORT_DIR})')
+    parser.add_argument('--format', choices=sorted(FORMATS), default=None,
+                        help='Table format (default: parquet with pyarrow, otherwise csv)')
+    args = parser.parse_args()
+
+    releases = []
+    for spec in args.releases:
+        docs_file, _, syntax_file = spec.partition(',')
+        releases.append(load_release(docs_file, syntax_file or None))
+
+    fmt = args.format or default_format()
+    counts = export_releases(releases, args.output, fmt)
+    print(f"Exported {', '.join(release['version'] for release in releases)} as {fmt}:")
+    for table, count in counts.items():
+        print(f"  {table}: {count} rows")
+    print(f"Saved to: {args.output}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Appian expression tokenizer and parser.
+Splits Appian Expression Language source into tokens and parses it into call
+trees. The parser is error tolerant: it never raises on bad input, it records
+errors and keeps going, which suits scraped documentation examples.
+"""
+
+import argparse
+import json
+import re
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r'''
+    (?P<whitespace>\s+)
+  | (?P<comment>/\*.*?(?:\*/|\Z))
+  | (?P<string>"(?:[^"]|"")*(?:"|\Z))
+  | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)
+  | (?P<name>[A-Za-z_]\w*!(?:\{[^}]*\})?\w*(?:\.(?:\{[^}]*\})?\w+)*|[A-Za-z_]\w*)
+  | (?P<reference>\#"(?:[^"]|"")*(?:"|\Z))
+  | (?P<operator><>|<=|>=|[-+*/&=<>^%])
+  | (?P<punctuation>[(){}\[\],:;.])
+  | (?P<error>.)
+''', re.VERBOSE | re.DOTALL)
+
+SKIPPED_KINDS = ('whitespace', 'comment')
+
+# Binary operator precedence (higher binds tighter); '^' is right associative
+BINARY_PRECEDENCE = {
+    '=': 1, '<>': 1, '<': 1, '>': 1, '<=': 1, '>=': 1,
+    '&': 2,
+    '+': 3, '-': 3,
+    '*': 4, '/': 4,
+    '^': 5,
+}
+UNARY_PRECEDENCE = 6
+# Deeper nesting is skipped with an error instead of overflowing the stack (about 4 frames per level)
+MAX_DEPTH = 100
+LITERAL_KINDS = ('number', 'string', 'reference')
+
+
+class Token(NamedTuple):
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+def tokenize(text: str, include_trivia: bool = False) -> List[Token]:
+    """Split expression text into tokens; whitespace and comments are dropped unless requested."""
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind in SKIPPED_KINDS and not include_trivia:
+            continue
+        tokens.append(Token(kind, match.group(), match.start(), match.end()))
+    return tokens
+
+
+def domain_of(name: str) -> str:
+    """Return the domain prefix of a name ('a', 'fn', 'local', ...) or '' for bare names."""
+    domain, bang, _ = name.partition('!')
+    return domain.lower() if bang else ''
+
+
+def function_key(name: str) -> str:
+    """Normalize a function name for comparison (case-insensitive, fn! and () dropped)."""
+    key = name.strip().lower()
+    if key.startswith('fn!'):
+        key = key[3:]
+    if key.endswith('()'):
+        key = key[:-2]
+    return key
+
+
+def line_col(text: str, offset: int) -> tuple:
+    """Convert a string offset to 1-based (line, column)."""
+    line = text.count('\n', 0, offset) + 1
+    column = offset - (text.rfind('\n', 0, offset) + 1) + 1
+    return line, column
+
+
+class Parser:
+    """Recursive-descent parser over a token list (trivia already removed).
+
+    Nodes are plain dicts with a 'type' key:
+      call    - name, args [{'keyword', 'value', 'start'}]
+      name    - value (rule!x, local!y, fv!item, true, ...)
+      literal - kind ('number', 'string', 'reference'), value
+      list    - items (a '{...}' array; 'key: value' items become 'pair' nodes)
+      pair    - key, value
+      binary  - operator, left, right
+      unary   - operator, operand
+      index   - target, index ('x[1]')
+      postfix - operator ('%'), operand
+      group   - expression ('(...)')
+      error   - placeholder where an expression was expected (or input nested
+                past MAX_DEPTH, which is skipped to the bracket closing it)
+    Every node has 'start' and 'end' offsets into the source text.
+    """
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.position = 0
+        self.errors = []
+        self.depth = 0
+
+    def _peek(self, ahead: int = 0) -> Optional[Token]:
+        index = self.position + ahead
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _at(self, value: str) -> bool:
+        token = self._peek()
+        return token is not None and token.value == value and token.kind in ('punctuation', 'operator')
+
+    def _error(self, message: str, offset: int) -> None:
+        self.errors.append({'offset': offset, 'message': message})
+
+    def _expect(self, value: str) -> int:
+        """Consume a closing punctuation mark, returning the end offset."""
+        token = self._peek()
+        if token is not None and token.value == value and token.kind == 'punctuation':
+            self.position += 1
+            return token.end
+        offset = token.start if token else (self.tokens[-1].end if self.tokens else 0)
+        self._error(f"Expected '{value}'", offset)
+        return offset
+
+    def parse_program(self) -> List[Dict]:
+        """Parse top-level expressions until the tokens run out."""
+        expressions = []
+        while self.position < len(self.tokens):
+            start = self.position
+            expressions.append(self.parse_expression())
+            if self.position == start:
+                token = self.tokens[self.position]
+                self._error(f"Unexpected '{token.value}'", token.start)
+                self.position += 1
+        return expressions
+
+    def _skip_nested(self) -> Dict:
+        """Skip input nested too deeply to parse, up to the bracket that closes the current level."""
+        token = self._peek()
+        start = token.start if token else (self.tokens[-1].end if self.tokens else 0)
+        self._error('Expression nested too deeply', start)
+        end = start
+        level = 0
+        while token is not None:
+            if token.kind == 'punctuation' and token.value in ')]}':
+                if level == 0:
+                    break
+                level -= 1
+            elif token.kind == 'punctuation' and token.value in '([{':
+                level += 1
+            self.position += 1
+            end = token.end
+            token = self._peek()
+        return {'type': 'error', 'start': start, 'end': end}
+
+    def parse_expression(self, min_precedence: int = 0) -> Dict:
+        if self.depth >= MAX_DEPTH:
+            return self._skip_nested()
+        self.depth += 1
+        left = self.parse_unary()
+        while True:
+            token = self._peek()
+            if token is None or token.kind != 'operator':
+                break
+            precedence = BINARY_PRECEDENCE.get(token.value)
+            if precedence is None or precedence <= min_precedence:
+                break
+            self.position += 1
+            # Right-associative '^' parses its right side at one lower level
+            right = self.parse_expression(precedence - 1 if token.value == '^' else precedence)
+            left = {'type': 'binary', 'operator': token.value, 'left': left, 'right': right,
+                    'start': left['start'], 'end': right['end']}
+        self.depth -= 1
+        return left
+
+    def parse_unary(self) -> Dict:
+        token = self._peek()
+        if token is not None and token.kind == 'operator' and token.value in '+-':
+            self.position += 1
+            operand = self.parse_expression(UNARY_PRECEDENCE)
+            return {'type': 'unary', 'operator': token.value, 'operand': operand,
+                    'start': token.start, 'end': operand['end']}
+        return self.parse_postfix(self.parse_primary())
+
+    def parse_postfix(self, node: Dict) -> Dict:
+        while True:
+            token = self._peek()
+            if token is None:
+                return node
+            if token.value == '(' and token.kind == 'punctuation' and node['type'] == 'name':
+                self.position += 1
+                args = self.parse_arguments(')')
+                end = self._expect(')')
+                node = {'type': 'call', 'name': node['value'], 'args': args,
+                        'start': node['start'], 'end': end}
+            elif token.value == '[' and token.kind == 'punctuation':
+                self.position += 1
+                index = self.parse_expression()
+                end = self._expect(']')
+                node = {'type': 'index', 'target': node, 'index': index, 'start': node['start'], 'end': end}
+            elif token.value == '%' and token.kind == 'operator':
+                self.position += 1
+                node = {'type': 'postfix', 'operator': '%', 'operand': node,
+                        'start': node['start'], 'end': token.end}
+            else:
+                return node
+
+    def parse_primary(self) -> Dict:
+        token = self._peek()
+        if token is None:
+            offset = self.tokens[-1].end if self.tokens else 0
+            self._error('Unexpected end of expression', offset)
+            return {'type': 'error', 'start': offset, 'end': offset}
+
+        if token.kind == 'name':
+            self.position += 1
+            return {'type': 'name', 'value': token.value, 'start': token.start, 'end': token.end}
+        if token.kind in LITERAL_KINDS:
+            self.position += 1
+            return {'type': 'literal', 'kind': token.kind, 'value': token.value,
+                    'start': token.start, 'end': token.end}
+        if token.kind == 'punctuation' and token.value == '(':
+            self.position += 1
+            expression = self.parse_expression()
+            end = self._expect(')')
+            return {'type': 'group', 'expression': expression, 'start': token.start, 'end': end}
+        if token.kind == 'punctuation' and token.value == '{':
+            self.position += 1
+            items = []
+            for argument in self.parse_arguments('}'):
+                if argument['keyword'] is None:
+                    items.append(argument['value'])
+                else:
+                    items.append({'type': 'pair', 'key': argument['keyword'], 'value': argument['value'],
+                                  'start': argument['start'], 'end': argument['value']['end']})
+            end = self._expect('}')
+            return {'type': 'list', 'items': items, 'start': token.start, 'end': end}
+
+        self._error(f"Unexpected '{token.value}'", token.start)
+        return {'type': 'error', 'start': token.start, 'end': token.start}
+
+    def parse_arguments(self, closing: str) -> List[Dict]:
+        """Parse comma-separated arguments up to (not including) the closing mark."""
+        args = []
+        while self._peek() is not None and not self._at(closing):
+            token = self._peek()
+            following = self._peek(1)
+            keyword = None
+            if (token.kind == 'name' and following is not None
+                    and following.kind == 'punctuation' and following.value == ':'):
+                keyword = token.value
+                self.position += 2
+
+            start = self.position
+            value = self.parse_expression()
+            args.append({'keyword': keyword, 'value': value, 'start': token.start})
+
+            following = self._peek()
+            if following is None or self._at(closing):
+                break
+            if self._at(','):
+                self.position += 1
+            elif self.position == start:
+                # Nothing consumed: skip the stray token so parsing always advances
+                self._error(f"Unexpected '{following.value}'", following.start)
+                self.position += 1
+            elif following.kind == 'punctuation' and following.value in ')}]':
+                break
+            else:
+                self._error("Expected ','", following.start)
+        return args
+
+
+def parse(text: str) -> Dict:
+    """Parse expression text into {'expressions': [...], 'errors': [...]}."""
+    parser = Parser(tokenize(text))
+    expressions = parser.parse_program()
+    return {'expressions': expressions, 'errors': parser.errors}
+
+
+def walk(node) -> Iterator[Dict]:
+    """Yield every node in a tree (pre-order); accepts a node, list of nodes or parse result."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            stack.extend(reversed(current))
+            continue
+        if not isinstance(current, dict):
+            continue
+        if 'expressions' in current and 'type' not in current:
+            stack.extend(reversed(current['expressions']))
+            continue
+
+        yield current
+        node_type = current['type']
+        if node_type == 'call':
+            stack.extend(reversed([argument['value'] for argument in current['args']]))
+        elif node_type == 'list':
+            stack.extend(reversed(current['items']))
+        elif node_type == 'binary':
+            stack.extend([current['right'], current['left']])
+        elif node_type == 'index':
+            stack.extend([current['index'], current['target']])
+        elif node_type in ('unary', 'postfix'):
+            stack.append(current['operand'])
+        elif node_type == 'group':
+            stack.append(current['expression'])
+        elif node_type == 'pair':
+            stack.append(current['value'])
+
+
+def iter_calls(tree) -> Iterator[Dict]:
+    """Yield every call node in a tree."""
+    for node in walk(tree):
+        if node['type'] == 'call':
+            yield node
+
+
+def call_keywords(call: Dict) -> List[Tuple[str, int]]:
+    """(keyword, offset) pairs for a call's keyword arguments, excluding local!x: definitions."""
+    return [(argument['keyword'], argument['start']) for argument in call['args']
+            if argument['keyword'] is not None and not domain_of(argument['keyword'])]
+
+
+def find_calls(tokens: List[Token]) -> Iterator[Dict]:
+    """Yield every function call with its keyword and positional arguments.
+
+    Each call is a dict with 'name', 'start', 'keywords' (list of (keyword, offset))
+    and 'positional' (count of positional arguments).
+    """
+    parser = Parser(tokens)
+    for call in iter_calls(parser.parse_program()):
+        yield {
+            'name': call['name'],
+            'start': call['start'],
+            'keywords': [(argument['keyword'], argument['start']) for argument in call['args']
+                         if argument['keyword'] is not None],
+            'positional': sum(1 for argument in call['args'] if argument['keyword'] is None)
+        }
+
+
+def contains_call(text: str) -> bool:
+    """Check whether text parses to at least one function call."""
+    return next(iter_calls(parse(text)), None) is not None
+
+
+def uses_keyword_arguments(text: str, function_name: Optional[str] = None) -> bool:
+    """Decide whether example code passes keyword arguments.
+
+    When function_name is given and the example calls that function, only those
+    calls are considered; otherwise any call (or a bare 'keyword: value' excerpt)
+    counts. Keywords inside strings,
+    comments and URLs never count, and local!x: definitions are not keywords.
+    """
+    tokens = tokenize(text)
+    calls = list(iter_calls(Parser(tokens).parse_program()))
+    if function_name:
+        key = function_key(function_name)
+        own_calls = [call for call in calls if function_key(call['name']) == key]
+        if own_calls:
+            return any(call_keywords(call) for call in own_calls)
+
+    # Excerpts such as 'choiceLabels: ...' show a single keyword argument on its own
+    # (leading numbers are code-block line gutters)
+    leading = [token for token in tokens[:4] if token.kind != 'number'][:2]
+    if (len(leading) == 2 and leading[0].kind == 'name' and not domain_of(leading[0].value)
+            and leading[1].value == ':'):
+        return True
+    return any(call_keywords(call) for call in calls)
+
+
+class IncrementalParser:
+    """Keeps a document's tokens and tree up to date across small edits.
+
+    Only the edited region is re-lexed: lexing restarts at the first token the
+    edit could join (see _relex_index) and stops as soon as the new tokens line
+    up with the old ones again. The (cheap) parse then runs over the merged
+    token list.
+    """
+
+    def __init__(self, text: str = ''):
+        self.text = text
+        self.tokens = tokenize(text, include_trivia=True)
+        self.relexed = len(self.tokens)
+        self._reparse()
+
+    def _reparse(self) -> None:
+        parser = Parser([token for token in self.tokens if token.kind not in SKIPPED_KINDS])
+        self.tree = {'expressions': parser.parse_program(), 'errors': parser.errors}
+
+    def _relex_index(self, start: int) -> int:
+        """Index of the first old token that an edit at start can merge with."""
+        first = 0
+        while first < len(self.tokens) and self.tokens[first].end < start:
+            first += 1
+        # Up to two tokens before the edit can join it ('1e+' followed by '5' is one number)
+        first = max(0, first - 2)
+
+        # A name runs through '{...}' up to the next '}' (recordType!{uuid}Name, x!y.{uuid}field),
+        # so a '{' still open before the edit, or a '.{...}' closed right at it, can join the
+        # edit to the name in front of that brace
+        close = self.text.rfind('}', 0, start)
+        if close == start - 1:
+            close = self.text.rfind('}', 0, close)
+        brace = self.text.find('{', close + 1, start)
+        if brace != -1:
+            while first > 0 and self.tokens[first].start > brace:
+                first -= 1
+            while first > 0:
+                previous = self.tokens[first - 1]
+                if previous.end != self.tokens[first].start or not (
+                        previous.kind == 'name' or previous.value == '.'):
+                    break
+                first -= 1
+        return first
+
+    def update(self, start: int, end: int, new_text: str) -> Dict:
+        """Replace text[start:end] with new_text and return the new parse result."""
+        text = self.text[:start] + new_text + self.text[end:]
+        delta = len(new_text) - (end - start)
+        edit_end = start + len(new_text)
+
+        first = self._relex_index(start)
+        relex_from = self.tokens[first].start if first < len(self.tokens) else len(self.text)
+
+        old_after = {token.start + delta: index for index, token in enumerate(self.tokens)
+                     if token.start >= end}
+
+        new_tokens = self.tokens[:first]
+        relexed = 0
+        tail = []
+        for match in TOKEN_PATTERN.finditer(text, relex_from):
+            token = Token(match.lastgroup, match.group(), match.start(), match.end())
+            if token.start >= edit_end and token.start in old_after:
+                old = self.tokens[old_after[token.start]]
+                if old.kind == token.kind and old.value == token.value:
+                    # Back in sync: the rest of the old tokens only need shifting
+                    tail = [Token(t.kind, t.value, t.start + delta, t.end + delta)
+                            for t in self.tokens[old_after[token.start]:]]
+                    break
+            new_tokens.append(token)
+            relexed += 1
+
+        self.text = text
+        self.tokens = new_tokens + tail
+        self.relexed = relexed
+        self._reparse()
+        return self.tree
+
+
+def measure_corpus(docs: Dict, syntax: Optional[Dict] = None) -> Dict:
+    """Parse every scraped example and compare keyword decisions with the syntax map."""
+    syntax_functions = (syntax or {}).get('functions', {})
+    examples = 0
+    characters = 0
+    with_errors = 0
+    compared = 0
+    agreed = 0
+    disagreements = []
+
+    start = time.perf_counter()
+    for name, info in docs.get('functions', {}).items():
+        decisions = []
+        for example in info.get('examples', []):
+            result = parse(example)
+            examples += 1
+            characters += len(example)
+            with_errors += bool(result['errors'])
+            decisions.append(uses_keyword_arguments(example, name))
+
+        recorded = syntax_functions.get(name, {})
+        if decisions and recorded.get('evidence') == 'examples':
+            compared += 1
+            if any(decisions) == recorded.get('keywordSyntax'):
+                agreed += 1
+            else:
+                disagreements.append(name)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'examples': examples,
+        'characters': characters,
+        'seconds': elapsed,
+        'examplesWithErrors': with_errors,
+        'compared': compared,
+        'agreement': agreed / compared if compared else 0.0,
+        'disagreements': disagreements
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Parse Appian expressions into call trees',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Print the call tree for an expression
+  python3 appian_expr.py 'a!forEach(items: {1, 2}, expression: fv!item * 2)'
+
+  # Parse every scraped example and compare with the syntax map
+  python3 appian_expr.py --measure
+        """
+    )
+    parser.add_argument('expression', nargs='?', help='Expression to parse')
+    parser.add_argument('--measure', action='store_true',
+                        help='Parse all examples in the docs file and report speed and agreement')
+    parser.add_argument('--docs', type=str, default='appian-functions-docs.json',
+                        help='Enriched docs JSON (default: appian-functions-docs.json)')
+    parser.add_argument('--syntax', type=str, default='appian-function-syntax.json',
+                        help='Syntax map JSON (default: appian-function-syntax.json)')
+    args = parser.parse_args()
+
+    if args.measure:
+        with open(args.docs, 'r', encoding='utf-8') as f:
+            docs = json.load(f)
+        with open(args.syntax, 'r', encoding='utf-8') as f:
+            syntax = json.load(f)
+        report = measure_corpus(docs, syntax)
+        print(f"Parsed {report['examples']} examples ({report['characters']} chars) "
+              f"in {report['seconds'] * 1000:.0f} ms")
+        print(f"Examples with parse errors: {report['examplesWithErrors']}")
+        print(f"Keyword syntax agreement with syntax map: {report['agreement']:.1%} "
+              f"of {report['compared']} functions")
+        for name in report['disagreements']:
+            print(f"  - {name}")
+        return
+
+    if args.expression is None:
+        parser.error('an expression or --measure is required')
+    print(json.dumps(parse(args.expression), indent=2))
+
+
+if __name__ == "__main__":
+    main()
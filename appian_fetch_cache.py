@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+File-locked fetch cache shared by concurrent scraper processes.
+Several scrape jobs on one host (different releases or output sets) point at
+the same cache directory. Each URL has a lock file: the first job to ask for
+a page downloads it while the others block on the lock. When they get the lock
+they read the stored copy instead of downloading it again, so N parallel jobs
+cost about one job's network traffic. Request starts can also be spaced out
+across every process through a shared host lock, so the jobs together stay
+under one rate limit for docs.appian.com.
+
+Pages are stored as compressed blobs in a PageArchive (deduplicated by
+content); urls/<hash>.json maps each URL to its blob and fetch time. File
+locks need fcntl (POSIX); without it the cache still works but only
+deduplicates within a process.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from appian_archive import PageArchive
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locks
+    fcntl = None
+
+DEFAULT_TTL = 24 * 3600  # Seconds a cached page is served before it is downloaded again
+HOST_LOCK = 'host'
+
+
+class FileLock:
+    """Exclusive lock on a file, held across processes; use one instance per acquire."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self.contended = False  # Whether acquiring had to wait for another process
+
+    def __enter__(self):
+        self._file = open(self.path, 'a+b')
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                self.contended = True
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+class SharedFetchCache:
+    def __init__(self, root: str, ttl: float = DEFAULT_TTL, rate_limit: Optional[float] = None):
+        self.root = root
+        self.ttl = ttl
+        self.interval = 1.0 / rate_limit if rate_limit else 0.0  # Seconds between request starts, host-wide
+        self.blobs = PageArchive(root)
+        self.url_dir = os.path.join(root, 'urls')
+        self.lock_dir = os.path.join(root, 'locks')
+        os.makedirs(self.url_dir, exist_ok=True)
+        os.makedirs(self.lock_dir, exist_ok=True)
+        self._locks = {}  # URL key -> thread lock, so threads of this process also wait for one download
+        self._locks_guard = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {'hits': 0, 'downloads': 0, 'coalesced': 0, 'throttled': 0.0}
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _thread_lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def _count(self, stat: str, amount=1) -> None:
+        with self._stats_lock:
+            self.stats[stat] += amount
+
+    def lookup(self, url: str) -> Optional[bytes]:
+        """Cached bytes for a URL, or None when missing or older than the TTL."""
+        path = os.path.join(self.url_dir, self._key(url) + '.json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry['fetched'] > self.ttl:
+                return None
+            return self.blobs.get(entry['digest'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, url: str, content: bytes) -> None:
+        digest = self.blobs.put(url, content)
+        path = os.path.join(self.url_dir, self._key(url) + '.json')
+        fd, temp_path = tempfile.mkstemp(dir=self.url_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'digest': digest, 'fetched': time.time()}, f)
+        os.replace(temp_path, path)  # Waiters never read a half-written entry
+
+    def _wait_turn(self) -> None:
+        """Space request starts host-wide: the host lock file holds the next allowed start time."""
+        if not self.interval:
+            return
+        lock = FileLock(os.path.join(self.lock_dir, HOST_LOCK + '.lock'))
+        with lock:
+            with open(lock.path, 'r+b') as f:
+                text = f.read().decode('ascii', 'ignore').strip()
+                now = time.time()
+                start = max(now, float(text) if text else 0.0)
+                f.seek(0)
+                f.truncate()
+                f.write(f"{start + self.interval:.6f}".encode('ascii'))
+        if start > now:
+            self._count('throttled', start - now)
+            time.sleep(start - now)
+
+    def fetch(self, url: str, download: Callable[[], bytes]) -> bytes:
+        """The page's bytes: from the cache, or downloaded once while other jobs wait for it.
+
+        download() errors propagate and nothing is cached, so the next waiter tries itself.
+        """
+        content = self.lookup(url)
+        if content is not None:
+            self._count('hits')
+            return content
+
+        key = self._key(url)
+        thread_lock = self._thread_lock(key)
+        waited = not thread_lock.acquire(blocking=False)
+        if waited:
+            thread_lock.acquire()
+        try:
+            with FileLock(os.path.join(self.lock_dir, key + '.lock')) as lock:
+                content = self.lookup(url)  # Another thread or job may have downloaded it while we waited
+                if content is not None:
+                    self._count('coalesced' if waited or lock.contended else 'hits')
+                    return content
+                self._wait_turn()
+                content = download()
+                self.store(url, content)
+                self._count('downloads')
+                return content
+        finally:
+            thread_lock.release()
+
+    def session(self, inner) -> 'CachedSession':
+        """Wrap a requests-style session so its GETs go through this cache."""
+        return CachedSession(inner, self)
+
+
+class CachedResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class CachedSession:
+    """Session stand-in whose get() is served by a SharedFetchCache (only successful responses are cached)."""
+
+    def __init__(self, inner, cache: SharedFetchCache):
+        self.inner = inner
+        self.cache = cache
+
+    def get(self, url: str, **kwargs) -> CachedResponse:
+        def download() -> bytes:
+            response = self.inner.get(url, **kwargs)
+            response.raise_for_status()
+            return response.content
+        return CachedResponse(self.cache.fetch(url, download))
+
+
+def cache_summary(root: str) -> Dict:
+    """URLs, stored blobs and bytes in a cache directory."""
+    url_dir = os.path.join(root, 'urls')
+    urls = [name for name in os.listdir(url_dir) if name.endswith('.json')] if os.path.isdir(url_dir) else []
+    blob_bytes = blobs = 0
+    for directory, _, files in os.walk(os.path.join(root, 'blobs')):
+        for name in files:
+            blobs += 1
+            blob_bytes += os.path.getsize(os.path.join(directory, name))
+    return {'urls': len(urls), 'blobs': blobs, 'bytes': blob_bytes}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Inspect the fetch cache shared by concurrent scrape jobs',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Two releases scraped at once share one cache and one limit of 5 requests a second in total
+  appian-docs scrape --docs-version 25.4 --output-dir 25.4 --shared-cache /tmp/appian-fetch-cache --rate-limit 5 &
+  appian-docs scrape --docs-version 26.0 --output-dir 26.0 --shared-cache /tmp/appian-fetch-cache --rate-limit 5 &
+
+  # What the cache holds
+  python3 appian_fetch_cache.py /tmp/appian-fetch-cache
+        """
+    )
+    parser.add_argument('root', help='Shared cache directory')
+    args = parser.parse_args()
+
+    summary = cache_summary(args.root)
+    print(f"{summary['urls']} URLs, {summary['blobs']} stored pages ({summary['bytes'] / 1024 / 1024:.1f} MB) "
+          f"in {args.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Precomputed function index for editor tooling.
+Compiles the scraper outputs into a compact pickle so tools can start quickly
+without re-parsing the full documentation JSON.
+"""
+
+import argparse
+import json
+import os
+import pickle
+from typing import Dict, List, Optional
+
+from appian_trie import CompletionTrie
+from appian_types import TypeIndex
+
+INDEX_VERSION = 3
+
+DEFAULT_DOCS_FILE = "appian-functions-docs.json"
+DEFAULT_SNIPPETS_FILE = "appian-functions-complete.json"
+DEFAULT_INDEX_FILE = "appian-functions-index.pkl"
+
+
+def lookup_key(name: str) -> str:
+    """Normalize a function reference for lookup (case-insensitive, no fn!/() decoration)."""
+    key = name.strip().lower()
+    if key.startswith('fn!'):
+        key = key[3:]
+    if key.endswith('()'):
+        key = key[:-2]
+    return key
+
+
+def _snippet_bodies(snippets: Dict) -> Dict[str, List[str]]:
+    """Map lookup keys to snippet bodies from appian-functions-complete.json."""
+    bodies = {}
+    for snippet in snippets.values():
+        prefixes = snippet.get('prefix') or []
+        if prefixes:
+            bodies[lookup_key(prefixes[0])] = snippet.get('body', [])
+    return bodies
+
+
+def build_index(docs: Dict, snippets: Optional[Dict] = None) -> Dict:
+    """Build the index structure from loaded docs (and optionally snippets) JSON."""
+    bodies = _snippet_bodies(snippets) if snippets else {}
+    functions = []
+    by_name = {}
+    trie = CompletionTrie()
+
+    for name, info in docs.get('functions', {}).items():
+        parameters = []
+        for display_name, param in info.get('parameters', {}).items():
+            parameters.append({
+                'keyword': param.get('type') or display_name,
+                'name': display_name,
+                'dataType': param.get('dataType', ''),
+                'description': param.get('description', '')
+            })
+
+        key = lookup_key(name)
+        entry = {
+            'name': name,
+            'description': info.get('description', ''),
+            'returnType': info.get('returnType', ''),
+            'returnDescription': info.get('returnDescription', ''),
+            'category': info.get('category', ''),
+            'deprecated': bool(info.get('deprecated', False)),
+            'parameters': parameters,
+            'body': bodies.get(key, [])
+        }
+        position = len(functions)
+        functions.append(entry)
+        by_name[key] = position
+
+        # Mirror the snippet prefixes: "a!forEach" also completes from "forEach"
+        trie.add(name, [] if key.startswith('a!') else ['fn!' + name])
+
+    return {
+        'version': INDEX_VERSION,
+        'source': docs.get('metadata', {}).get('source', ''),
+        'functions': functions,
+        'byName': by_name,
+        'trie': trie,
+        'types': TypeIndex.from_docs(docs)  # Normalized types and returns/accepts reverse indexes
+    }
+
+
+def build_index_file(docs_file: str = DEFAULT_DOCS_FILE,
+                     snippets_file: Optional[str] = DEFAULT_SNIPPETS_FILE,
+                     index_file: str = DEFAULT_INDEX_FILE) -> Dict:
+    """Read the scraper outputs and write the pickled index."""
+    with open(docs_file, 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+
+    snippets = None
+    if snippets_file and os.path.exists(snippets_file):
+        with open(snippets_file, 'r', encoding='utf-8') as f:
+            snippets = json.load(f)
+
+    # Imported here: loading the index must stay fast, only rebuilding writes it
+    from appian_output import atomic_write
+
+    index = build_index(docs, snippets)
+    atomic_write(index_file, pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))  # Editors may be reading it
+    return index
+
+
+def load_index(index_file: str = DEFAULT_INDEX_FILE,
+               docs_file: Optional[str] = DEFAULT_DOCS_FILE,
+               snippets_file: Optional[str] = DEFAULT_SNIPPETS_FILE) -> Dict:
+    """Load the pickled index, rebuilding it when missing or older than the docs file."""
+    stale = not os.path.exists(index_file)
+    if not stale and docs_file and os.path.exists(docs_file):
+        stale = os.path.getmtime(docs_file) > os.path.getmtime(index_file)
+
+    if not stale:
+        try:
+            with open(index_file, 'rb') as f:
+                index = pickle.load(f)
+            if index.get('version') == INDEX_VERSION:
+                return index
+        except Exception as e:
+            print(f"Error loading {index_file}: {e}")
+
+    if not docs_file or not os.path.exists(docs_file):
+        return build_index({})
+    return build_index_file(docs_file, snippets_file, index_file)
+
+
+def find_function(index: Dict, name: str) -> Optional[Dict]:
+    """Return the index entry for a function name, or None."""
+    position = index['byName'].get(lookup_key(name))
+    if position is None:
+        return None
+    return index['functions'][position]
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Compile scraped Appian docs into a fast-loading function index')
+    parser.add_argument('--docs', type=str, default=DEFAULT_DOCS_FILE,
+                        help=f'Enriched docs JSON (default: {DEFAULT_DOCS_FILE})')
+    parser.add_argument('--snippets', type=str, default=DEFAULT_SNIPPETS_FILE,
+                        help=f'Snippets JSON (default: {DEFAULT_SNIPPETS_FILE})')
+    parser.add_argument('--output', type=str, default=DEFAULT_INDEX_FILE,
+                        help=f'Index file to write (default: {DEFAULT_INDEX_FILE})')
+    args = parser.parse_args(argv)
+
+    index = build_index_file(args.docs, args.snippets, args.output)
+    print(f"Indexed {len(index['functions'])} functions")
+    types = index['types'].summary()
+    print(f"Types: {types['parameterTypes']} parameter and {types['returnTypes']} return types across "
+          f"{types['typedFunctions']} functions ({types['unrecognized']} type cells not recognized)")
+    print(f"Saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Appian Expression Linter
+Checks a!/fn! function calls in expression files against the scraped signatures:
+unknown functions and keywords, deprecated functions and keyword-syntax misuse.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional
+
+from appian_expr import call_keywords, domain_of, iter_calls, line_col, parse
+
+DEFAULT_DOCS_FILE = "appian-functions-docs.json"
+DEFAULT_SYNTAX_FILE = "appian-function-syntax.json"
+DEFAULT_EXTENSIONS = ['.sail', '.expr', '.appian']
+
+# Only system functions are checked; rule!, cons!, local! etc. are user-defined
+CHECKED_DOMAINS = ('', 'a', 'fn')
+
+KEYWORD_PATTERN = re.compile(r'^[A-Za-z_]\w*$')
+VARIADIC_KEYWORD = re.compile(r'^(\w+?)(?:1|N)$')
+
+# Signature table used by worker processes (set once per worker by _init_worker)
+_worker_signatures = None
+
+
+def build_signatures(docs: Dict, syntax: Optional[Dict] = None) -> Dict[str, Dict]:
+    """Build the lookup table the linter checks calls against, keyed by lowercase name."""
+    syntax_functions = (syntax or {}).get('functions', {})
+    signatures = {}
+
+    for name, info in docs.get('functions', {}).items():
+        keywords = [param.get('type', '') for param in info.get('parameters', {}).values()]
+        # Only trust keyword lists that are all identifiers (some scraped tables are misaligned)
+        checkable = bool(keywords) and all(KEYWORD_PATTERN.match(keyword) for keyword in keywords)
+        # Placeholder pairs like key1/keyN or localVar1/localVarN accept arbitrary keywords
+        variadic = any(VARIADIC_KEYWORD.match(keyword) for keyword in keywords
+                       if keyword.endswith('N'))
+
+        syntax_info = syntax_functions.get(name, {})
+        signatures[name.lower()] = {
+            'name': name,
+            'keywords': {keyword.lower() for keyword in keywords},
+            'checkKeywords': checkable and not variadic,
+            'deprecated': bool(info.get('deprecated', False)),
+            'keywordSyntax': syntax_info.get('keywordSyntax', 'unknown'),
+            'evidence': syntax_info.get('evidence', 'none')
+        }
+
+    return signatures
+
+
+def load_signatures(docs_file: str = DEFAULT_DOCS_FILE,
+                    syntax_file: Optional[str] = DEFAULT_SYNTAX_FILE) -> Dict[str, Dict]:
+    """Load the scraper outputs and build the signature table."""
+    with open(docs_file, 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+
+    syntax = None
+    if syntax_file and os.path.exists(syntax_file):
+        with open(syntax_file, 'r', encoding='utf-8') as f:
+            syntax = json.load(f)
+
+    return build_signatures(docs, syntax)
+
+
+def _issue(text: str, offset: int, severity: str, code: str, message: str) -> Dict:
+    line, column = line_col(text, offset)
+    return {'line': line, 'column': column, 'severity': severity, 'code': code, 'message': message}
+
+
+def lint_text(text: str, signatures: Dict[str, Dict]) -> List[Dict]:
+    """Lint one expression and return its issues sorted by position."""
+    issues = []
+    tree = parse(text)
+
+    for error in tree['errors']:
+        issues.append(_issue(text, error['offset'], 'error', 'syntax', error['message']))
+
+    for call in iter_calls(tree):
+        name = call['name']
+        domain = domain_of(name)
+        if domain not in CHECKED_DOMAINS:
+            continue
+
+        lookup = name[3:] if domain == 'fn' else name
+        signature = signatures.get(lookup.lower())
+        if signature is None:
+            issues.append(_issue(text, call['start'], 'error', 'unknown-function',
+                                 f"Unknown function {name}()"))
+            continue
+
+        if signature['deprecated']:
+            issues.append(_issue(text, call['start'], 'warning', 'deprecated',
+                                 f"{signature['name']}() is deprecated"))
+
+        # local!name: definitions (a!localVariables and friends) are not keyword arguments
+        keywords = call_keywords(call)
+        if not keywords:
+            continue
+
+        if any(argument['keyword'] is None for argument in call['args']):
+            issues.append(_issue(text, call['start'], 'error', 'mixed-arguments',
+                                 f"{signature['name']}() mixes keyword and positional arguments"))
+
+        if signature['keywordSyntax'] is False:
+            issues.append(_issue(text, keywords[0][1], 'warning', 'keyword-syntax',
+                                 f"{signature['name']}() is documented with positional syntax "
+                                 f"(evidence: {signature['evidence']})"))
+
+        if signature['checkKeywords']:
+            for keyword, offset in keywords:
+                if keyword.lower() not in signature['keywords']:
+                    issues.append(_issue(text, offset, 'error', 'unknown-keyword',
+                                         f"{signature['name']}() has no parameter '{keyword}'"))
+
+    issues.sort(key=lambda issue: (issue['line'], issue['column']))
+    return issues
+
+
+def _init_worker(signatures: Dict[str, Dict]) -> None:
+    """Pool initializer: receive the signature table once per worker process."""
+    global _worker_signatures
+    _worker_signatures = signatures
+
+
+def _lint_file(path: str) -> tuple:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except Exception as e:
+        return path, [{'line': 0, 'column': 0, 'severity': 'error', 'code': 'io', 'message': str(e)}]
+    try:
+        return path, lint_text(text, _worker_signatures)
+    except Exception as e:
+        # Reported per file: an uncaught error would take down the pool worker and the whole run
+        return path, [{'line': 0, 'column': 0, 'severity': 'error', 'code': 'parse',
+                       'message': f"Could not parse: {type(e).__name__}: {e}"}]
+
+
+def iter_expression_files(paths: List[str], extensions: List[str]) -> Iterator[str]:
+    """Expand files and directories into the expression files to lint."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for file_name in sorted(files):
+                    if os.path.splitext(file_name)[1] in extensions:
+                        yield os.path.join(root, file_name)
+        else:
+            yield path
+
+
+def lint_paths(paths: List[str], signatures: Dict[str, Dict],
+               workers: Optional[int] = None, extensions: Optional[List[str]] = None) -> Iterator[tuple]:
+    """Lint many files, yielding (path, issues) as results arrive.
+
+    With more than one worker, files are spread over a process pool; each worker
+    receives the signature table once through the pool initializer.
+    """
+    files = list(iter_expression_files(paths, extensions or DEFAULT_EXTENSIONS))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(files) < 2:
+        _init_worker(signatures)
+        for path in files:
+            yield _lint_file(path)
+        return
+
+    chunksize = max(1, len(files) // (workers * 8))
+    with Pool(workers, initializer=_init_worker, initargs=(signatures,)) as pool:
+        for result in pool.imap_unordered(_lint_file, files, chunksize=chunksize):
+            yield result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Lint Appian expressions against the scraped function signatures',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Lint a directory of expression files on all cores
+  python3 appian_lint.py expressions/
+
+  # Lint with 4 workers and JSON output
+  python3 appian_lint.py --workers 4 --format json expressions/ interfaces/
+        """
+    )
+    parser.add_argument('paths', nargs='+', help='Expression files or directories')
+    parser.add_argument('--docs', type=str, default=DEFAULT_DOCS_FILE,
+                        help=f'Enriched docs JSON (default: {DEFAULT_DOCS_FILE})')
+    parser.add_argument('--syntax', type=str, default=DEFAULT_SYNTAX_FILE,
+                        help=f'Syntax map JSON (default: {DEFAULT_SYNTAX_FILE})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--ext', type=str, nargs='+', default=DEFAULT_EXTENSIONS,
+                        help=f"File extensions to lint in directories (default: {' '.join(DEFAULT_EXTENSIONS)})")
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help='Output format (default: text)')
+    args = parser.parse_args()
+
+    signatures = load_signatures(args.docs, args.syntax)
+
+    error_count = 0
+    file_count = 0
+    report = {}
+    for path, issues in lint_paths(args.paths, signatures, args.workers, args.ext):
+        file_count += 1
+        error_count += sum(1 for issue in issues if issue['severity'] == 'error')
+        if args.format == 'json':
+            if issues:
+                report[path] = issues
+            continue
+        for issue in issues:
+            print(f"{path}:{issue['line']}:{issue['column']}: "
+                  f"{issue['severity']} [{issue['code']}] {issue['message']}")
+
+    if args.format == 'json':
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(f"\nLinted {file_count} files, {error_count} errors")
+
+    sys.exit(1 if error_count else 0)
+
+
+if __name__ == "__main__":
+    main()
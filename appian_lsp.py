@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Appian Expression Language Server
+Serves completions, hover docs and deprecation warnings over the Language Server
+Protocol (JSON-RPC on stdio), backed by the precomputed function index.
+"""
+
+import argparse
+import json
+import re
+import sys
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from appian_index import (DEFAULT_DOCS_FILE, DEFAULT_INDEX_FILE, DEFAULT_SNIPPETS_FILE,
+                          find_function, load_index)
+
+# LSP constants
+COMPLETION_KIND_FUNCTION = 3
+COMPLETION_KIND_PROPERTY = 10
+COMPLETION_TAG_DEPRECATED = 1
+INSERT_FORMAT_SNIPPET = 2
+SEVERITY_WARNING = 2
+DIAGNOSTIC_TAG_DEPRECATED = 2
+TEXT_SYNC_FULL = 1
+
+MAX_COMPLETIONS = 50
+
+WORD_BEFORE_CURSOR = re.compile(r'[A-Za-z0-9_!]*$')
+WORD_AFTER_CURSOR = re.compile(r'^[A-Za-z0-9_!]*')
+KEYWORD_BEFORE_VALUE = re.compile(r'([A-Za-z_]\w*)\s*:\s*$')
+CALLEE_BEFORE_PAREN = re.compile(r'((?:a!|fn!)?[A-Za-z_]\w*)\s*$')
+FUNCTION_CALL = re.compile(r'(?<![\w!.])((?:a!|fn!)?[A-Za-z_]\w*)\s*\(')
+STRING_OR_COMMENT = re.compile(r'"(?:[^"]|"")*"?|/\*.*?(?:\*/|$)', re.DOTALL)
+
+
+def mask_strings_and_comments(text: str) -> str:
+    """Blank out string literals and comments, keeping offsets and newlines intact."""
+    def blank(match):
+        return re.sub(r'[^\n]', ' ', match.group(0))
+    return STRING_OR_COMMENT.sub(blank, text)
+
+
+def in_string_or_comment(text: str, offset: int) -> bool:
+    """Check whether offset falls inside an unterminated string or comment."""
+    last = None
+    for last in STRING_OR_COMMENT.finditer(text, 0, offset):
+        pass
+    if last is None or last.end() != offset:
+        return False
+    token = last.group(0)
+    if token.startswith('"'):
+        return token.count('"') % 2 == 1
+    return len(token) < 4 or not token.endswith('*/')
+
+
+def position_to_offset(text: str, line: int, character: int) -> int:
+    """Convert an LSP position to a string offset."""
+    offset = 0
+    for _ in range(line):
+        newline = text.find('\n', offset)
+        if newline == -1:
+            return len(text)
+        offset = newline + 1
+    return min(offset + character, len(text))
+
+
+def offset_to_position(text: str, offset: int) -> Dict:
+    """Convert a string offset to an LSP position."""
+    line = text.count('\n', 0, offset)
+    line_start = text.rfind('\n', 0, offset) + 1
+    return {'line': line, 'character': offset - line_start}
+
+
+def enclosing_call(masked: str, offset: int) -> Tuple[Optional[str], bool]:
+    """Find the function whose argument list contains offset.
+
+    Returns (function name, at argument start). The second value is True when
+    only whitespace separates the cursor word from the preceding '(' or ','.
+    """
+    depth = 0
+    at_argument_start = None
+    position = offset - 1
+    while position >= 0:
+        char = masked[position]
+        if char in ')}':
+            depth += 1
+        elif char in '({':
+            if depth == 0:
+                if char == '{':
+                    # Inside an array literal, not directly in an argument list
+                    return None, False
+                match = CALLEE_BEFORE_PAREN.search(masked, 0, position)
+                if not match:
+                    return None, False
+                if at_argument_start is None:
+                    at_argument_start = True
+                return match.group(1), at_argument_start
+            depth -= 1
+        elif depth == 0 and at_argument_start is None and not char.isspace():
+            at_argument_start = char == ','
+        position -= 1
+    return None, False
+
+
+class AppianLanguageServer:
+    """Minimal LSP server for Appian expressions."""
+
+    def __init__(self, index: Dict):
+        self.index = index
+        self.documents = {}
+        self.notifications = []
+        self.shutdown_requested = False
+
+    # Protocol plumbing
+
+    def handle(self, message: Dict) -> Optional[Dict]:
+        """Dispatch one JSON-RPC message and return the response, if any."""
+        method = message.get('method', '')
+        params = message.get('params') or {}
+        handler = self.HANDLERS.get(method)
+
+        if handler is None:
+            if 'id' in message:
+                return {'jsonrpc': '2.0', 'id': message['id'],
+                        'error': {'code': -32601, 'message': f'Method not found: {method}'}}
+            return None
+
+        result = handler(self, params)
+        if 'id' in message:
+            return {'jsonrpc': '2.0', 'id': message['id'], 'result': result}
+        return None
+
+    def serve(self, reader: BinaryIO, writer: BinaryIO) -> None:
+        """Read LSP messages from reader until exit, writing replies to writer."""
+        while True:
+            message = read_message(reader)
+            if message is None:
+                break
+            response = self.handle(message)
+            if response is not None:
+                write_message(writer, response)
+            for notification in self.notifications:
+                write_message(writer, notification)
+            self.notifications = []
+            if message.get('method') == 'exit':
+                break
+
+    # Lifecycle
+
+    def on_initialize(self, params: Dict) -> Dict:
+        return {
+            'capabilities': {
+                'textDocumentSync': TEXT_SYNC_FULL,
+                'completionProvider': {'triggerCharacters': ['!', '(', ',']},
+                'hoverProvider': True
+            },
+            'serverInfo': {'name': 'appian-lsp'}
+        }
+
+    def on_initialized(self, params: Dict) -> None:
+        return None
+
+    def on_shutdown(self, params: Dict) -> None:
+        self.shutdown_requested = True
+        return None
+
+    def on_exit(self, params: Dict) -> None:
+        return None
+
+    # Document sync
+
+    def on_did_open(self, params: Dict) -> None:
+        document = params['textDocument']
+        self.documents[document['uri']] = document.get('text', '')
+        self.publish_diagnostics(document['uri'])
+
+    def on_did_change(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        changes = params.get('contentChanges') or []
+        if changes:
+            # Full sync: the last change carries the whole document
+            self.documents[uri] = changes[-1].get('text', '')
+        self.publish_diagnostics(uri)
+
+    def on_did_close(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        self.documents.pop(uri, None)
+        self.notifications.append({
+            'jsonrpc': '2.0',
+            'method': 'textDocument/publishDiagnostics',
+            'params': {'uri': uri, 'diagnostics': []}
+        })
+
+    # Language features
+
+    def on_completion(self, params: Dict) -> Dict:
+        text = self.documents.get(params['textDocument']['uri'], '')
+        position = params['position']
+        return {'isIncomplete': False,
+                'items': self.complete(text, position['line'], position['character'])}
+
+    def on_hover(self, params: Dict) -> Optional[Dict]:
+        text = self.documents.get(params['textDocument']['uri'], '')
+        position = params['position']
+        return self.hover(text, position['line'], position['character'])
+
+    def complete(self, text: str, line: int, character: int) -> List[Dict]:
+        """Compute completion items at a position."""
+        offset = position_to_offset(text, line, character)
+        if in_string_or_comment(text, offset):
+            return []
+        masked = mask_strings_and_comments(text)
+
+        prefix = WORD_BEFORE_CURSOR.search(text, 0, offset).group(0)
+        start = offset - len(prefix)
+        edit_range = {'start': offset_to_position(text, start),
+                      'end': offset_to_position(text, offset)}
+
+        items = []
+        callee, at_argument_start = enclosing_call(masked, start)
+        if callee and at_argument_start and '!' not in prefix:
+            entry = find_function(self.index, callee)
+            if entry:
+                items.extend(self._parameter_items(entry, prefix, edit_range))
+
+        # In a keyword argument's value, functions returning the parameter's type are offered first
+        fitting = self._functions_fitting_argument(masked, start, callee)
+        if prefix:
+            # Prefix matches first, then camel-hump and typo-tolerant matches
+            for name in self.index['trie'].lookup(prefix, limit=MAX_COMPLETIONS):
+                entry = find_function(self.index, name)
+                if entry:
+                    items.append(self._function_item(entry, edit_range, entry['name'] in fitting))
+        else:
+            for name in fitting[:MAX_COMPLETIONS]:
+                entry = find_function(self.index, name)
+                if entry:
+                    items.append(self._function_item(entry, edit_range, True))
+
+        return items
+
+    def _functions_fitting_argument(self, masked: str, start: int, callee: Optional[str]) -> List[str]:
+        """Functions whose return type fits the keyword argument being typed at start (precomputed lookup)."""
+        types = self.index.get('types')
+        match = KEYWORD_BEFORE_VALUE.search(masked, 0, start)
+        if not (types and callee and match):
+            return []
+        entry = find_function(self.index, callee)
+        if not entry:
+            return []
+        return types.returning_types(types.parameter_types(entry['name'], match.group(1)))
+
+    def _parameter_items(self, entry: Dict, prefix: str, edit_range: Dict) -> List[Dict]:
+        """Keyword-argument completions for the parameters of a function."""
+        items = []
+        prefix_lower = prefix.lower()
+        for order, param in enumerate(entry['parameters']):
+            keyword = param['keyword']
+            if not keyword.lower().startswith(prefix_lower):
+                continue
+            items.append({
+                'label': f"{keyword}:",
+                'kind': COMPLETION_KIND_PROPERTY,
+                'detail': param['dataType'],
+                'documentation': param['description'],
+                'sortText': f"0{order:03d}",
+                'textEdit': {'range': edit_range, 'newText': f"{keyword}: "}
+            })
+        return items
+
+    def _function_item(self, entry: Dict, edit_range: Dict, fits: bool = False) -> Dict:
+        """Completion item for a function, inserting its snippet body when available.
+
+        fits marks a function whose return type matches the argument being typed; it sorts first.
+        """
+        item = {
+            'label': entry['name'],
+            'kind': COMPLETION_KIND_FUNCTION,
+            'detail': entry['returnType'] or entry['category'],
+            'documentation': entry['description'],
+            'sortText': f"{0 if fits else 1}{entry['name'].lower()}"
+        }
+        if entry['body']:
+            item['insertTextFormat'] = INSERT_FORMAT_SNIPPET
+            item['textEdit'] = {'range': edit_range, 'newText': '\n'.join(entry['body'])}
+        else:
+            item['textEdit'] = {'range': edit_range, 'newText': entry['name']}
+        if entry['deprecated']:
+            item['tags'] = [COMPLETION_TAG_DEPRECATED]
+        return item
+
+    def hover(self, text: str, line: int, character: int) -> Optional[Dict]:
+        """Compute hover documentation for the function under the cursor."""
+        offset = position_to_offset(text, line, character)
+        before = WORD_BEFORE_CURSOR.search(text, 0, offset).group(0)
+        after = WORD_AFTER_CURSOR.match(text[offset:]).group(0)
+        word = before + after
+        if not word:
+            return None
+
+        entry = find_function(self.index, word)
+        if not entry:
+            return None
+
+        signature = ', '.join(param['keyword'] for param in entry['parameters'])
+        lines = [f"```appian\n{entry['name']}({signature})\n```"]
+        if entry['deprecated']:
+            lines.append('**Deprecated**')
+        if entry['description']:
+            lines.append(entry['description'])
+        if entry['returnType'] or entry['returnDescription']:
+            returns = ' - '.join(part for part in [entry['returnType'], entry['returnDescription']] if part)
+            lines.append(f"**Returns:** {returns}")
+        if entry['parameters']:
+            lines.append('\n'.join(
+                f"- `{param['keyword']}` ({param['dataType']}): {param['description']}"
+                for param in entry['parameters']))
+
+        start = offset - len(before)
+        return {
+            'contents': {'kind': 'markdown', 'value': '\n\n'.join(lines)},
+            'range': {'start': offset_to_position(text, start),
+                      'end': offset_to_position(text, offset + len(after))}
+        }
+
+    def diagnostics(self, text: str) -> List[Dict]:
+        """Warn about calls to deprecated functions."""
+        results = []
+        masked = mask_strings_and_comments(text)
+        for match in FUNCTION_CALL.finditer(masked):
+            entry = find_function(self.index, match.group(1))
+            if entry and entry['deprecated']:
+                results.append({
+                    'range': {'start': offset_to_position(text, match.start(1)),
+                              'end': offset_to_position(text, match.end(1))},
+                    'severity': SEVERITY_WARNING,
+                    'source': 'appian',
+                    'message': f"{entry['name']}() is deprecated",
+                    'tags': [DIAGNOSTIC_TAG_DEPRECATED]
+                })
+        return results
+
+    def publish_diagnostics(self, uri: str) -> None:
+        self.notifications.append({
+            'jsonrpc': '2.0',
+            'method': 'textDocument/publishDiagnostics',
+            'params': {'uri': uri, 'diagnostics': self.diagnostics(self.documents.get(uri, ''))}
+        })
+
+    HANDLERS = {
+        'initialize': on_initialize,
+        'initialized': on_initialized,
+        'shutdown': on_shutdown,
+        'exit': on_exit,
+        'textDocument/didOpen': on_did_open,
+        'textDocument/didChange': on_did_change,
+        'textDocument/didClose': on_did_close,
+        'textDocument/completion': on_completion,
+        'textDocument/hover': on_hover,
+    }
+
+
+def read_message(reader: BinaryIO) -> Optional[Dict]:
+    """Read one Content-Length framed JSON-RPC message."""
+    length = None
+    while True:
+        header = reader.readline()
+        if not header:
+            return None
+        header = header.strip()
+        if not header:
+            break
+        name, _, value = header.decode('ascii').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value.strip())
+    if length is None:
+        return None
+    return json.loads(reader.read(length).decode('utf-8'))
+
+
+def write_message(writer: BinaryIO, message: Dict) -> None:
+    """Write one Content-Length framed JSON-RPC message."""
+    body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii'))
+    writer.write(body)
+    writer.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Language server for Appian expressions (LSP over stdio)')
+    parser.add_argument('--index', type=str, default=DEFAULT_INDEX_FILE,
+                        help=f'Precomputed index file (default: {DEFAULT_INDEX_FILE})')
+    parser.add_argument('--docs', type=str, default=DEFAULT_DOCS_FILE,
+                        help=f'Docs JSON used to rebuild a stale index (default: {DEFAULT_DOCS_FILE})')
+    parser.add_argument('--snippets', type=str, default=DEFAULT_SNIPPETS_FILE,
+                        help=f'Snippets JSON used for completion bodies (default: {DEFAULT_SNIPPETS_FILE})')
+    args = parser.parse_args()
+
+    server = AppianLanguageServer(load_index(args.index, args.docs, args.snippets))
+    server.serve(sys.stdin.buffer, sys.stdout.buffer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Precompiled matchers for the extractor heuristics.
+Every heading pattern, skip list and category keyword list is compiled once at
+import; word lists are folded into a single alternation per rule instead of
+being re-scanned term by term for each paragraph. Doc versions whose pages use
+different wording can override any pattern or word list (see VERSION_PATTERNS).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+DEFAULT_PATTERNS = {
+    # Heading / label text (searched case-insensitively)
+    'example_heading': r'example',
+    'returns_heading': r'returns?',
+    'keywords_heading': r'keywords',
+    'related_heading': r'see also|related|similar',
+    'use_case_heading': r'usage|use case|when to use',
+    # Examples-table header naming the expected result column (matched on lowercased text)
+    'result_header': r'result|returns?|output',
+    # "Returns: Text" / "Text - description" at the start of a returns paragraph
+    'return_type_prefix': r'^([\w\s]+?)(?:\s*-|\s*:)',
+    # Prose after an example introducing its result
+    'result_prefix': r'^\s*(?:returns?|result|output)\b\s*:?\s*(.*)$',
+}
+
+# Heading patterns looked up with one pass over a page's strings (see Matchers.scan_headings)
+HEADING_KINDS = ('returns_heading', 'keywords_heading', 'related_heading', 'use_case_heading', 'example_heading')
+
+# Word lists matched as plain substrings of lowercased text
+DEFAULT_TERMS = {
+    # Navigation/share chrome that disqualifies a description paragraph
+    'description_skip': ('share', 'linkedin', 'reddit', 'email', 'copy', 'print',
+                         'privacy', 'disclaimer', '©', 'copyright',
+                         'see also', 'related', 'feedback'),
+    # A description sentence that explains purpose
+    'use_case_hint': ('use', 'when', 'for', 'to'),
+}
+
+# (category, name terms, description terms, name must start with 'a!'), checked in order
+DEFAULT_CATEGORIES = (
+    ('UI Components', ('field', 'picker', 'layout', 'section', 'column', 'grid', 'chart', 'button', 'link',
+                       'image'), (), True),
+    ('Array Functions', ('array', 'append', 'insert', 'remove', 'filter', 'map', 'reduce', 'flatten', 'union'),
+     ('array', 'list', 'collection'), False),
+    ('Text Functions', ('text', 'concat', 'split', 'trim', 'upper', 'lower', 'search', 'replace', 'char'),
+     ('text', 'string', 'character'), False),
+    ('Date and Time Functions', ('date', 'time', 'day', 'month', 'year', 'hour', 'minute', 'calendar', 'today',
+                                 'now'), ('date', 'time', 'calendar', 'timestamp'), False),
+    ('Data Query Functions', ('query', 'record', 'data', 'filter', 'aggregate', 'paginginfo'), (), False),
+    ('Logic Functions', ('if', 'and', 'or', 'not', 'null', 'empty', 'match', 'choose'),
+     ('condition', 'logic', 'boolean'), False),
+    ('Math Functions', ('sum', 'average', 'min', 'max', 'round', 'abs', 'power', 'sqrt', 'mod', 'rand'),
+     ('mathematical', 'calculation', 'numeric'), False),
+    ('Document Functions', ('document', 'folder', 'file', 'download', 'export'), (), False),
+    ('Process Functions', ('process', 'task', 'node', 'activity'), (), False),
+)
+DEFAULT_CATEGORY = 'Other Functions'
+
+# Docs version -> overrides of DEFAULT_PATTERNS / DEFAULT_TERMS keys (and optionally 'categories'),
+# e.g. {'26.1': {'related_heading': r'see also|related|similar|next steps'}}
+VERSION_PATTERNS: Dict[str, Dict] = {}
+
+
+def terms_pattern(terms: Tuple[str, ...]) -> Optional['re.Pattern']:
+    """One alternation matching any of the terms as a substring (None for an empty list)."""
+    if not terms:
+        return None
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+
+def docs_version(url: str) -> str:
+    """'https://docs.appian.com/suite/help/25.4/...' -> '25.4' ('' when the URL has no version)."""
+    match = re.search(r'/help/([\w.]+)/', url or '')
+    return match.group(1) if match else ''
+
+
+class Matchers:
+    """Compiled heuristics for one docs version."""
+
+    def __init__(self, version: str = '', overrides: Optional[Dict] = None):
+        config = dict(DEFAULT_PATTERNS, **DEFAULT_TERMS)
+        config['categories'] = DEFAULT_CATEGORIES
+        config.update(overrides or {})
+        self.version = version
+
+        self.example_heading = re.compile(config['example_heading'], re.IGNORECASE)
+        self.returns_heading = re.compile(config['returns_heading'], re.IGNORECASE)
+        self.keywords_heading = re.compile(config['keywords_heading'], re.IGNORECASE)
+        self.related_heading = re.compile(config['related_heading'], re.IGNORECASE)
+        self.use_case_heading = re.compile(config['use_case_heading'], re.IGNORECASE)
+        self.result_header = re.compile(config['result_header'])
+        self.return_type_prefix = re.compile(config['return_type_prefix'])
+        self.result_prefix = re.compile(config['result_prefix'], re.IGNORECASE | re.DOTALL)
+        self.whitespace = re.compile(r'\s+')
+        # Matches a string iff at least one heading pattern does
+        self.any_heading = re.compile('|'.join(f"(?:{config[kind]})" for kind in HEADING_KINDS), re.IGNORECASE)
+
+        self.description_skip = terms_pattern(config['description_skip'])
+        self.use_case_hint = terms_pattern(config['use_case_hint'])
+        self.categories = [(category, terms_pattern(name_terms), terms_pattern(description_terms), a_only)
+                           for category, name_terms, description_terms, a_only in config['categories']]
+
+    def scan_headings(self, soup: BeautifulSoup) -> Dict[str, List]:
+        """Strings matching each heading pattern, in document order, from a single pass over the page.
+
+        Equivalent to soup.find_all(string=pattern) for every kind in HEADING_KINDS.
+        """
+        from bs4 import NavigableString
+        return self.classify_headings(node for node in soup.descendants if isinstance(node, NavigableString))
+
+    def classify_headings(self, strings: Iterable) -> Dict[str, List]:
+        """Group strings by the heading patterns they match (a string can match several)."""
+        found = {kind: [] for kind in HEADING_KINDS}
+        for string in strings:
+            if not self.any_heading.search(string):
+                continue
+            for kind in HEADING_KINDS:
+                if getattr(self, kind).search(string):
+                    found[kind].append(string)
+        return found
+
+    def is_skipped_description(self, text_lower: str) -> bool:
+        return self.description_skip is not None and self.description_skip.search(text_lower) is not None
+
+    def has_use_case_hint(self, text_lower: str) -> bool:
+        return self.use_case_hint is not None and self.use_case_hint.search(text_lower) is not None
+
+    def categorize(self, name: str, description: str) -> str:
+        """First category whose name or description terms match."""
+        name_lower = name.lower()
+        desc_lower = description.lower()
+        for category, name_terms, description_terms, a_only in self.categories:
+            if a_only and not name.startswith('a!'):
+                continue
+            if (name_terms is not None and name_terms.search(name_lower)) or \
+                    (description_terms is not None and description_terms.search(desc_lower)):
+                return category
+        return DEFAULT_CATEGORY
+
+
+DEFAULT_MATCHERS = Matchers()
+_compiled = {'': DEFAULT_MATCHERS}
+
+
+def matchers_for(url_or_version: str = '') -> Matchers:
+    """Matchers for a docs version (or any URL under it), compiled once per version."""
+    version = docs_version(url_or_version) if '/' in (url_or_version or '') else (url_or_version or '')
+    if version not in VERSION_PATTERNS:
+        return DEFAULT_MATCHERS
+    if version not in _compiled:
+        _compiled[version] = Matchers(version, VERSION_PATTERNS[version])
+    return _compiled[version]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Atomic, deterministic writer for the JSON artifacts.
+Each file is serialized in canonical form (UTF-8, fixed indent and
+separators, trailing newline), written to a temp file in the target
+directory, fsynced and renamed over the target. A crash mid-write leaves the
+previous file intact, and concurrent jobs writing the same path never
+interleave: the last rename wins with a complete file.
+
+Key order is part of the canonical form. The emitters build every map in a
+fixed order (entries in listing order, record fields in declaration order,
+parameters in positional order) whatever order pages were scraped in, so it
+is kept as built; maps with no meaningful order can be written with
+sort_keys. Identical inputs then give byte-identical outputs (pass
+--scraped-date, or replay an archived run, to pin the date).
+
+Compressed copies (path.gz, and path.zst when the optional 'zstandard'
+package is installed) can be written next to each file for editor clients;
+they are deterministic too (no timestamp in the gzip header).
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from typing import Iterable, List
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for .zst variants
+    zstandard = None
+
+COMPRESSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def canonical_json(data, indent: int = 2, sort_keys: bool = False) -> bytes:
+    """UTF-8 JSON with a trailing newline; equal data built in the same key order gives equal bytes."""
+    text = json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=sort_keys, separators=(',', ': '))
+    return (text + '\n').encode('utf-8')
+
+
+def compress(content: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd output requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=19).compress(content)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def parse_compressions(value: str) -> List[str]:
+    """Codecs from a comma-separated list such as 'gzip,zstd' (raises ValueError on unknown names)."""
+    codecs = [codec.strip() for codec in (value or '').split(',') if codec.strip()]
+    unknown = [codec for codec in codecs if codec not in COMPRESSIONS]
+    if unknown:
+        raise ValueError(f"Unknown compression: {', '.join(unknown)} (choose from {', '.join(COMPRESSIONS)})")
+    if 'zstd' in codecs and zstandard is None:
+        raise ValueError("zstd output requires the 'zstandard' package")
+    return codecs
+
+
+def _fsync_dir(directory: str) -> None:
+    """Persist the rename itself (POSIX only; directories cannot be opened on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: str, content: bytes) -> None:
+    """Replace path with content: temp file in the same directory, fsync, rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, 0o644)  # mkstemp creates 0600 files
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_dir(directory)
+
+
+def write_json(path: str, data, indent: int = 2, compressions: Iterable[str] = (),
+               sort_keys: bool = False) -> List[str]:
+    """Atomically write data as canonical JSON plus any compressed variants; returns the paths written."""
+    content = canonical_json(data, indent, sort_keys)
+    atomic_write(path, content)
+    written = [path]
+    for codec in compressions:
+        variant = path + COMPRESSIONS[codec]
+        atomic_write(variant, compress(content, codec))
+        written.append(variant)
+    return written
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Single scrape pipeline: discover -> fetch -> parse -> extract -> emit.
+Each function page is fetched and parsed once and handed to every emitter
+plugin, so the snippets, docs, syntax and examples files all come from one
+pass over the documentation. scrape_appian_docs.py and
+scrape_appian_docs_enhanced.py are front-ends that run it with their own emitter.
+
+requests and bs4 (with lxml) are imported when the first request is sent or
+the first page is parsed, not at import time, so tools that only read the
+generated JSON (validate, index, repair --dry-run, --help) start quickly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
+
+from appian_archive import DEFAULT_ARCHIVE_DIR, PageArchive
+from appian_discovery import FunctionDiscovery
+from appian_output import parse_compressions, write_json
+from appian_progress import ProgressBar
+from appian_scheduler import (DEFAULT_STATS_FILE, RateLimiter, WorkStealingScheduler, estimate_costs, load_costs,
+                              save_costs)
+from appian_singleflight import DEFAULT_PAGE_CACHE, SingleFlight
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak memory is then not reported
+    resource = None
+
+DEFAULT_BASE_URL = "https://docs.appian.com/suite/help/25.4/Appian_Functions.html"
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Artifact name -> (default file, JSON indent)
+OUTPUT_FILES = {
+    'snippets': ('appian-functions-complete.json', 4),
+    'docs': ('appian-functions-docs.json', 2),
+    'syntax': ('appian-function-syntax.json', 2),
+    'examples': ('appian-function-examples.json', 2),
+}
+
+
+class LazySession:
+    """requests.Session stand-in that imports requests and opens the session on the first request."""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None):
+        self.headers = dict(headers or {})
+        self._session = None
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    session = requests.Session()
+                    session.headers.update(self.headers)
+                    self.headers = session.headers
+                    self._session = session
+        return self._session.get(url, **kwargs)
+
+
+def fetch_content(session, url: str, archive: Optional[PageArchive] = None,
+                  log_fetches: bool = True) -> Optional[bytes]:
+    """Raw bytes of a URL (from the archive when replaying; archived when fetched).
+
+    log_fetches prints a "Fetching:" line per URL; callers drawing a progress bar turn it off.
+    """
+    if archive and archive.replaying:
+        content = archive.lookup(url)
+        if content is None:
+            print(f"Not in archive: {url}")
+        return content
+
+    try:
+        if log_fetches:
+            print(f"Fetching: {url}")
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+        if archive:
+            archive.put(url, response.content)
+        return response.content
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+
+
+def fetch_page(session, url: str, archive: Optional[PageArchive] = None,
+               log_fetches: bool = True) -> Optional[BeautifulSoup]:
+    """Fetch and parse a web page."""
+    from bs4 import BeautifulSoup
+
+    content = fetch_content(session, url, archive, log_fetches)
+    return BeautifulSoup(content, 'lxml') if content is not None else None
+
+
+def peak_memory_mb() -> Optional[float]:
+    """Peak resident memory of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KB elsewhere
+
+
+def dispose_tree(soup: BeautifulSoup) -> None:
+    """Break a parse tree's reference cycles so it is freed immediately.
+
+    Decomposing the BeautifulSoup object alone leaves its children linked, so
+    each top-level node is decomposed (or detached) first.
+    """
+    from bs4.element import Tag
+
+    for element in list(soup.contents):
+        if isinstance(element, Tag):
+            element.decompose()
+        else:
+            element.extract()
+    soup.decompose()
+
+
+class Page:
+    """A fetched function page: the parsed tree plus values shared between emitters."""
+
+    def __init__(self, url: str, soup: BeautifulSoup):
+        self.url = url
+        self.soup = soup
+        self._main = None
+        self._memo = {}
+
+    @property
+    def main(self):
+        """Main content area (avoids navigation and footer elements)."""
+        if self._main is None:
+            self._main = self.soup.find('main') or self.soup.find('div', class_='content') or self.soup
+        return self._main
+
+    def memo(self, key: str, compute: Callable):
+        """Compute a per-page value once, whichever emitter asks first."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def dispose(self) -> None:
+        """Free the parse tree now instead of waiting for the cyclic garbage collector."""
+        dispose_tree(self.soup)
+        self.soup = None
+        self._main = None
+        self._memo.clear()
+
+
+class Emitter:
+    """Stage plugin: receives every page and builds one or more artifacts."""
+
+    def start(self, base_url: str, functions: Dict[str, Dict]) -> None:
+        pass
+
+    def add_page(self, key: str, info: Dict, page: Optional[Page]) -> None:
+        """Handle one function; page is None when it could not be fetched.
+
+        Pages arrive in scheduling order, not listing order; emitters should
+        assemble their output in listing order in finish().
+        """
+        raise NotImplementedError
+
+    def finish(self) -> Dict[str, Dict]:
+        """Artifacts built by this emitter, keyed by OUTPUT_FILES name."""
+        raise NotImplementedError
+
+
+class ScrapePipeline:
+    def __init__(self, base_url: str, emitters: List[Emitter], fetch: Optional[Callable] = None,
+                 fetch_raw: Optional[Callable] = None, discovery: Optional[FunctionDiscovery] = None,
+                 archive: Optional[PageArchive] = None, workers: int = 1, stats_file: Optional[str] = None,
+                 low_memory: bool = False, retries: int = 0, retry_delay: float = 1.0,
+                 rate_limit: Optional[float] = None, progress: bool = False):
+        self.base_url = base_url
+        self.emitters = emitters
+        self.archive = archive
+        self.workers = workers
+        self.stats_file = stats_file  # Per-URL costs from the previous run, used to schedule longest-first
+        self.low_memory = low_memory  # Dispose parse trees as soon as every emitter has seen the page
+        self.retries = retries  # Extra attempts for a page that fails to fetch (delay doubles each time)
+        self.retry_delay = retry_delay
+        self.progress = progress  # Progress bar (ETA, pages/s) instead of a line per page
+        self.retried = 0
+        self._retry_lock = threading.Lock()
+        self.run_stats = {}
+        if fetch is None or fetch_raw is None:
+            session = LazySession({'User-Agent': USER_AGENT})
+            # No "Fetching:" lines under the progress bar (callers passing fetch turn off their own)
+            fetch = fetch or functools.partial(fetch_page, session, archive=archive, log_fetches=not progress)
+            fetch_raw = fetch_raw or functools.partial(fetch_content, session, archive=archive,
+                                                       log_fetches=not progress)
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None  # Requests per second, across workers
+        if self.limiter and not (archive and archive.replaying):
+            fetch, fetch_raw = self.limiter.wrap(fetch), self.limiter.wrap(fetch_raw)
+        # One download and parse per URL: concurrent requests share it, repeats come from an LRU
+        self.flight = SingleFlight(fetch, max_pages=0 if low_memory else DEFAULT_PAGE_CACHE)
+        self.fetch = self.flight
+        self.fetch_raw = fetch_raw  # Raw bytes, for TOC and sitemap discovery sources
+        self.discovery = discovery or FunctionDiscovery(base_url)
+
+    def fetch_with_retries(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch a page, retrying failures with exponential backoff."""
+        soup = self.fetch(url)
+        for attempt in range(self.retries):
+            if soup:
+                break
+            time.sleep(self.retry_delay * 2 ** attempt)
+            with self._retry_lock:
+                self.retried += 1
+            print(f"Retrying {url} (attempt {attempt + 2}/{self.retries + 1})")
+            soup = self.fetch(url)
+        return soup
+
+    def run(self, limit: Optional[int] = None, only: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """Run every stage; returns the artifacts from all emitters.
+
+        only restricts the fetch to those discovered keys (e.g. records being repaired).
+        """
+        print("Starting Appian documentation scraping...")
+
+        # Discover function pages (TOC, sitemap + listing page, or the listing page alone)
+        print("Extracting function list...")
+        functions = self.discovery.run(self.fetch, self.fetch_raw,
+                                       dispose=dispose_tree if self.low_memory else None)
+        if not functions:
+            return {}
+        stats = self.discovery.stats
+        print(f"Found {len(functions)} functions via {stats['source']} in {stats['fetches']} fetch(es) "
+              f"({stats['duplicates']} duplicate and {stats['rejected']} non-function links skipped)")
+
+        for emitter in self.emitters:
+            emitter.start(self.base_url, functions)
+
+        selected = list(functions)
+        if only is not None:
+            wanted = set(only)
+            selected = [key for key in selected if key in wanted]
+        if limit:
+            selected = selected[:limit]
+        known = load_costs(self.stats_file)
+        costs = estimate_costs(selected, {key: known[functions[key]['url']] for key in selected
+                                          if functions[key]['url'] in known})
+        emit_lock = threading.Lock()
+        done = []
+        memory = {}  # pages processed -> peak MB
+        self.retried = 0
+        bar = ProgressBar(len(selected)) if self.progress else None
+
+        def process(key: str) -> float:
+            # Fetch and parse run in parallel; extraction and emitting are serialized
+            info = functions[key]
+            start = time.perf_counter()
+            soup = self.fetch_with_retries(info['url'])
+            page = Page(info['url'], soup) if soup else None
+            cost = time.perf_counter() - start
+            with emit_lock:
+                start = time.perf_counter()
+                done.append(key)
+                if bar:
+                    bar.update(key)
+                else:
+                    print(f"Processing {key} ({len(done)}/{len(selected)})...")
+                for emitter in self.emitters:
+                    emitter.add_page(key, info, page)
+                if page and self.low_memory:
+                    page.dispose()
+                if len(done) % 100 == 0 and resource is not None:
+                    memory[len(done)] = round(peak_memory_mb(), 1)
+                    if self.low_memory:
+                        print(f"Peak memory after {len(done)} pages: {memory[len(done)]} MB")
+                return cost + time.perf_counter() - start
+
+        scheduler = WorkStealingScheduler(self.workers)
+        try:
+            self.run_stats = scheduler.run(costs, process)
+        finally:
+            if bar:
+                bar.close()
+        self.run_stats['retries'] = self.retried
+        self.run_stats['fetch'] = self.flight.summary()
+        if self.limiter:
+            self.run_stats['rateLimitWait'] = round(self.limiter.waited, 3)
+        self.run_stats['discovery'] = self.discovery.stats
+        if resource is not None:
+            memory[len(done)] = round(peak_memory_mb(), 1)
+            self.run_stats['peakMemoryMB'] = memory
+        print(f"Scraped {self.run_stats['tasks']} pages with {self.run_stats['workers']} workers in "
+              f"{self.run_stats['makespan']:.1f}s (ideal {self.run_stats['ideal']:.1f}s, "
+              f"{self.run_stats['steals']} steals), peak memory {memory.get(len(done), '?')} MB")
+        fetch_stats = self.run_stats['fetch']
+        print(f"Fetched {fetch_stats['downloads']} pages for {fetch_stats['requests']} requests "
+              f"({fetch_stats['shared']} shared in flight, {fetch_stats['cacheHits']} from cache, "
+              f"{fetch_stats['duplicateDownloads']} duplicate downloads)")
+        if self.stats_file and not (self.archive and self.archive.replaying):
+            save_costs(self.stats_file, {functions[key]['url']: seconds
+                                         for key, seconds in scheduler.durations.items()}, self.run_stats)
+
+        if self.archive and not self.archive.replaying:
+            manifest_path = self.archive.save_manifest(source=self.base_url)
+            print(f"Archived {len(self.archive.pages)} pages ({self.archive.stats['stored']} new, "
+                  f"{self.archive.stats['reused']} unchanged) -> {manifest_path}")
+
+        outputs = {}
+        for emitter in self.emitters:
+            outputs.update(emitter.finish())
+        return outputs
+
+
+def write_outputs(outputs: Dict[str, Dict], files: Optional[Dict[str, str]] = None,
+                  compressions: Iterable[str] = ()) -> List[str]:
+    """Atomically write each artifact to its file (defaults from OUTPUT_FILES) as canonical JSON,
+    plus any compressed variants; returns the paths written."""
+    written = []
+    for name, data in outputs.items():
+        default_file, indent = OUTPUT_FILES[name]
+        path = (files or {}).get(name) or default_file
+        written.extend(write_json(path, data, indent, compressions))
+    return written
+
+
+def main():
+    # Imported here: the scraper front-ends import this module
+    from scrape_appian_docs import AppianDocScraper, SnippetEmitter
+    from scrape_appian_docs_enhanced import DocsEmitter, EnhancedAppianDocScraper
+    from appian_store import CorpusStore
+
+    parser = argparse.ArgumentParser(
+        description='Scrape Appian documentation once and write snippets, docs, syntax and examples',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # All outputs for Appian 25.4 from a single pass
+  python3 appian_pipeline.py
+
+  # A different version, first 20 functions only
+  python3 appian_pipeline.py --url https://docs.appian.com/suite/help/26.0/Appian_Functions.html --limit 20
+
+  # Discover pages from a docs table of contents (JSON), when the site publishes one
+  python3 appian_pipeline.py --toc https://docs.appian.com/suite/help/25.4/toc.json
+
+  # Keep the raw pages, then rebuild every output from them (no network)
+  python3 appian_pipeline.py --archive
+  python3 appian_pipeline.py --replay latest
+
+  # Also write .gz copies of each JSON file for editor clients
+  python3 appian_pipeline.py --compress gzip
+        """
+    )
+    parser.add_argument('--url', type=str, default=DEFAULT_BASE_URL,
+                        help='URL to the Appian Functions documentation page (default: 25.4)')
+    parser.add_argument('--limit', type=int, default=None, help='Only process the first N functions')
+    parser.add_argument('--toc', type=str, metavar='URL',
+                        help='Docs table of contents (JSON) to discover functions from in one fetch')
+    parser.add_argument('--sitemap', type=str, metavar='URL',
+                        help='Sitemap used to keep only listing links to pages that exist')
+    parser.add_argument('--snippets-output', type=str, default=OUTPUT_FILES['snippets'][0], help='Snippets file')
+    parser.add_argument('--docs-output', type=str, default=OUTPUT_FILES['docs'][0], help='Docs file')
+    parser.add_argument('--syntax-output', type=str, default=OUTPUT_FILES['syntax'][0], help='Syntax map file')
+    parser.add_argument('--examples-output', type=str, default=OUTPUT_FILES['examples'][0], help='Examples file')
+    parser.add_argument('--sqlite', type=str, metavar='DB', help='Also write the SQLite corpus store')
+    parser.add_argument('--compress', type=str, default='', metavar='CODECS',
+                        help='Also write compressed copies of each JSON file: gzip, zstd or gzip,zstd')
+    parser.add_argument('--workers', type=int, default=4, help='Pages fetched in parallel (default: 4)')
+    parser.add_argument('--low-memory', action='store_true',
+                        help='Compact records and free parse trees early; reports peak memory per 100 pages')
+    parser.add_argument('--stats', type=str, default=DEFAULT_STATS_FILE,
+                        help=f'Per-URL cost history used to schedule slow pages first (default: {DEFAULT_STATS_FILE})')
+    parser.add_argument('--archive-dir', type=str, default=DEFAULT_ARCHIVE_DIR,
+                        help=f'Raw page archive directory (default: {DEFAULT_ARCHIVE_DIR})')
+    parser.add_argument('--archive', action='store_true',
+                        help='Keep raw pages in --archive-dir for --replay runs (off by default; never pruned)')
+    parser.add_argument('--replay', type=str, metavar='RUN',
+                        help="Read pages from an archived run (id or 'latest') instead of the network")
+    args = parser.parse_args()
+    try:
+        compressions = parse_compressions(args.compress)
+    except ValueError as e:
+        parser.error(str(e))
+
+    archive = None
+    if args.replay or args.archive:
+        archive = PageArchive(args.archive_dir)
+        if args.replay:
+            manifest = archive.start_replay(args.replay)
+            args.url = manifest['source'] or args.url
+            print(f"Replaying archived run {manifest['run']} ({len(manifest['pages'])} pages)")
+
+    store = CorpusStore(args.sqlite) if args.sqlite else None
+    snippet_scraper = AppianDocScraper(base_url=args.url, archive=archive)
+    docs_scraper = EnhancedAppianDocScraper(base_url=args.url, archive=archive, store=store)
+    emitters = [SnippetEmitter(snippet_scraper), DocsEmitter(docs_scraper, low_memory=args.low_memory)]
+    discovery = FunctionDiscovery(args.url, toc_url=args.toc, sitemap_url=args.sitemap)
+    pipeline = ScrapePipeline(args.url, emitters, fetch=docs_scraper.fetch_page, fetch_raw=docs_scraper.fetch_raw,
+                              discovery=discovery, archive=archive, workers=args.workers, stats_file=args.stats,
+                              low_memory=args.low_memory)
+    outputs = pipeline.run(limit=args.limit)
+    if store:
+        store.close()
+
+    if not outputs.get('docs', {}).get('functions'):
+        print("No documentation generated")
+        return
+
+    files = {'snippets': args.snippets_output, 'docs': args.docs_output,
+             'syntax': args.syntax_output, 'examples': args.examples_output}
+    for path in write_outputs(outputs, files, compressions):
+        print(f"✓ Saved to: {path}")
+    print(f"\n✓ {len(outputs['snippets'])} snippets and {len(outputs['docs']['functions'])} documented "
+          f"functions from one fetch per page")
+
+
+if __name__ == "__main__":
+    main()
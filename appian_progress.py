@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Progress bar for long scrapes.
+Redraws one line in place on a terminal (bar, count, throughput and ETA);
+when output is redirected to a file or CI log it prints a line every 10%
+instead, so logs stay short.
+"""
+
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+BAR_WIDTH = 30
+REDRAW_INTERVAL = 0.1  # Seconds between terminal redraws
+LOG_STEPS = 10  # Lines printed over a run when not on a terminal
+
+
+def format_duration(seconds: float) -> str:
+    """H:MM:SS (or M:SS under an hour)."""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class ProgressBar:
+    def __init__(self, total: int, label: str = 'Scraping', stream: Optional[TextIO] = None,
+                 interactive: Optional[bool] = None, unit: str = 'pages'):
+        self.total = total
+        self.label = label
+        self.unit = unit
+        self.stream = stream or sys.stderr
+        self.interactive = self.stream.isatty() if interactive is None else interactive
+        self.done = 0
+        self.started = time.perf_counter()
+        self._drawn = 0.0
+        self._logged_step = 0
+        self._lock = threading.Lock()
+
+    def rate(self) -> float:
+        """Items completed per second so far."""
+        elapsed = time.perf_counter() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self) -> Optional[float]:
+        """Seconds left at the current rate (None before the first item)."""
+        rate = self.rate()
+        return (self.total - self.done) / rate if rate else None
+
+    def render(self, item: str = '') -> str:
+        fraction = self.done / self.total if self.total else 1.0
+        filled = int(BAR_WIDTH * fraction)
+        eta = self.eta()
+        line = (f"{self.label} [{'#' * filled}{'-' * (BAR_WIDTH - filled)}] {self.done}/{self.total} "
+                f"{fraction:4.0%} {self.rate():.1f} {self.unit}/s "
+                f"ETA {format_duration(eta) if eta is not None else '?'}")
+        return f"{line} {item}" if item else line
+
+    def update(self, item: str = '', count: int = 1) -> None:
+        """Record finished items; item (e.g. the function name) is shown on the terminal line."""
+        with self._lock:
+            self.done += count
+            now = time.perf_counter()
+            if self.interactive:
+                if now - self._drawn >= REDRAW_INTERVAL or self.done >= self.total:
+                    self._drawn = now
+                    self.stream.write(f"\r{self.render(item)[:119]}\033[K")
+                    self.stream.flush()
+            else:
+                step = self.done * LOG_STEPS // self.total if self.total else LOG_STEPS
+                if step > self._logged_step:
+                    self._logged_step = step
+                    self.stream.write(self.render() + '\n')
+                    self.stream.flush()
+
+    def close(self) -> None:
+        """Finish the terminal line with the final totals."""
+        with self._lock:
+            if self.interactive:
+                elapsed = time.perf_counter() - self.started
+                self.stream.write(f"\r{self.render()[:119]}\033[K\n"
+                                  f"{self.label}: {self.done} {self.unit} in {format_duration(elapsed)}\n")
+                self.stream.flush()
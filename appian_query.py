@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Query helpers for the SQLite corpus store (appian_store.py).
+Lookups hit the indexes directly, so nothing loads the whole corpus.
+"""
+
+import argparse
+import json
+import sqlite3
+from typing import Dict, List, Optional
+
+from appian_store import DEFAULT_STORE_FILE, has_fts
+
+
+def open_store(path: str = DEFAULT_STORE_FILE) -> sqlite3.Connection:
+    """Open a store read-only."""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def get_function(conn: sqlite3.Connection, name: str) -> Optional[Dict]:
+    """One function in the same shape as an appian-functions-docs.json record."""
+    row = conn.execute('SELECT * FROM functions WHERE name = ?', (name,)).fetchone()
+    if not row:
+        return None
+
+    parameters = {}
+    for param in conn.execute('SELECT * FROM parameters WHERE functionId = ? ORDER BY position', (row['id'],)):
+        parameters[param['name']] = {
+            'type': param['keyword'],
+            'dataType': param['dataType'],
+            'description': param['description'],
+            'required': bool(param['required'])
+        }
+    examples = [example['expression'] for example in conn.execute(
+        'SELECT expression FROM examples WHERE functionId = ? ORDER BY position', (row['id'],))]
+    related = [edge['relatedName'] for edge in conn.execute(
+        'SELECT relatedName FROM related WHERE functionId = ?', (row['id'],))]
+
+    return {
+        'name': row['name'],
+        'description': row['description'],
+        'returnType': row['returnType'],
+        'returnDescription': row['returnDescription'],
+        'parameters': parameters,
+        'examples': examples,
+        'useCase': row['useCase'],
+        'relatedFunctions': related,
+        'category': row['category'],
+        'deprecated': bool(row['deprecated'])
+    }
+
+
+def get_syntax(conn: sqlite3.Connection, name: str) -> Optional[Dict]:
+    """Keyword syntax entry for a function, as in appian-function-syntax.json."""
+    row = conn.execute('''
+        SELECT syntax.keywordSyntax, syntax.evidence, syntax.confidence FROM syntax
+        JOIN functions ON functions.id = syntax.functionId WHERE functions.name = ?
+    ''', (name,)).fetchone()
+    if not row:
+        return None
+    keyword_syntax = {'true': True, 'false': False}.get(row['keywordSyntax'], row['keywordSyntax'])
+    entry = {'keywordSyntax': keyword_syntax, 'evidence': row['evidence']}
+    if row['confidence'] is not None:
+        entry['confidence'] = row['confidence']
+    return entry
+
+
+def find_functions(conn: sqlite3.Connection, category: Optional[str] = None, deprecated: Optional[bool] = None,
+                   return_type: Optional[str] = None, parameter_type: Optional[str] = None,
+                   keyword_syntax: Optional[str] = None, min_confidence: Optional[float] = None,
+                   limit: Optional[int] = None) -> List[str]:
+    """Names of functions matching every given filter."""
+    clauses, values = [], []
+    if category is not None:
+        clauses.append('functions.category = ?')
+        values.append(category)
+    if deprecated is not None:
+        clauses.append('functions.deprecated = ?')
+        values.append(int(deprecated))
+    if return_type is not None:
+        clauses.append('functions.returnType = ?')
+        values.append(return_type)
+    if parameter_type is not None:
+        clauses.append('functions.id IN (SELECT functionId FROM parameters WHERE dataType = ?)')
+        values.append(parameter_type)
+    if keyword_syntax is not None:
+        clauses.append('functions.id IN (SELECT functionId FROM syntax WHERE keywordSyntax = ?)')
+        values.append(str(keyword_syntax).lower())
+    if min_confidence is not None:
+        clauses.append('functions.id IN (SELECT functionId FROM syntax WHERE confidence >= ?)')
+        values.append(min_confidence)
+
+    query = 'SELECT name FROM functions'
+    if clauses:
+        query += ' WHERE ' + ' AND '.join(clauses)
+    query += ' ORDER BY name'
+    if limit:
+        query += ' LIMIT ?'
+        values.append(limit)
+    return [row['name'] for row in conn.execute(query, values)]
+
+
+def search(conn: sqlite3.Connection, text: str, limit: int = 20) -> List[str]:
+    """Functions whose name, description or use case match the text, best match first."""
+    if has_fts(conn):
+        terms = ' '.join('"' + term.replace('"', '""') + '"' for term in text.split())
+        rows = conn.execute('''
+            SELECT functions.name FROM functions_fts
+            JOIN functions ON functions.id = functions_fts.rowid
+            WHERE functions_fts MATCH ? ORDER BY bm25(functions_fts) LIMIT ?
+        ''', (terms, limit))
+    else:
+        pattern = f'%{text}%'
+        rows = conn.execute('''
+            SELECT name FROM functions WHERE name LIKE ? OR description LIKE ? OR useCase LIKE ?
+            ORDER BY name LIMIT ?
+        ''', (pattern, pattern, pattern, limit))
+    return [row['name'] for row in rows]
+
+
+def referenced_by(conn: sqlite3.Connection, name: str) -> List[str]:
+    """Functions that list the given function as related."""
+    return [row['name'] for row in conn.execute('''
+        SELECT functions.name FROM related JOIN functions ON functions.id = related.functionId
+        WHERE related.relatedName = ? ORDER BY functions.name
+    ''', (name,))]
+
+
+def category_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    return {row['category']: row['total'] for row in conn.execute(
+        'SELECT category, COUNT(*) AS total FROM functions GROUP BY category ORDER BY total DESC')}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Query the SQLite corpus store',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Full record for one function
+  python3 appian_query.py a!forEach
+
+  # Filter by category, deprecation, return type or parameter type
+  python3 appian_query.py --category "Text Functions" --deprecated no
+  python3 appian_query.py --param-type Date --return-type Boolean
+
+  # Functions very likely to take keyword arguments
+  python3 appian_query.py --min-confidence 0.9
+
+  # Full-text search over names and descriptions
+  python3 appian_query.py --search "time zone"
+        """
+    )
+    parser.add_argument('name', nargs='?', help='Print the full record for this function')
+    parser.add_argument('--db', type=str, default=DEFAULT_STORE_FILE,
+                        help=f'SQLite database file (default: {DEFAULT_STORE_FILE})')
+    parser.add_argument('--category', type=str, help='Only functions in this category')
+    parser.add_argument('--deprecated', choices=['yes', 'no'], help='Only (non-)deprecated functions')
+    parser.add_argument('--return-type', type=str, help='Only functions with this return type')
+    parser.add_argument('--param-type', type=str, help='Only functions taking a parameter of this type')
+    parser.add_argument('--keyword-syntax', choices=['true', 'false', 'unknown'], help='Filter by keyword syntax')
+    parser.add_argument('--min-confidence', type=float,
+                        help='Only functions whose keyword syntax confidence is at least this (0-1)')
+    parser.add_argument('--search', type=str, help='Full-text search')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum number of results')
+    args = parser.parse_args()
+
+    conn = open_store(args.db)
+    if args.name:
+        record = get_function(conn, args.name)
+        if not record:
+            print(f"Not found: {args.name}")
+            return
+        print(json.dumps(dict(record, syntax=get_syntax(conn, args.name)), indent=2, ensure_ascii=False))
+        return
+
+    if args.search:
+        names = search(conn, args.search, args.limit or 20)
+    elif any(value is not None for value in (args.category, args.deprecated, args.return_type,
+                                             args.param_type, args.keyword_syntax, args.min_confidence)):
+        names = find_functions(conn, category=args.category,
+                               deprecated=None if args.deprecated is None else args.deprecated == 'yes',
+                               return_type=args.return_type, parameter_type=args.param_type,
+                               keyword_syntax=args.keyword_syntax, min_confidence=args.min_confidence,
+                               limit=args.limit)
+    else:
+        for category, total in category_counts(conn).items():
+            print(f"{total:5d}  {category}")
+        return
+
+    for name in names:
+        print(name)
+    print(f"\n{len(names)} functions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Compact record types for low-memory scrapes.
+Function, parameter and syntax records use __slots__ instead of per-record
+dicts, and repeated short strings (data types, categories, keywords, evidence)
+are interned so every record shares one copy. to_dict() rebuilds the exact
+JSON record, key order included.
+"""
+
+import sys
+from typing import Dict, Union
+
+# Key order of a full record as built by EnhancedAppianDocScraper._build_function_details
+FUNCTION_FIELDS = ('name', 'description', 'returnType', 'returnDescription', 'parameters', 'examples',
+                   'useCase', 'relatedFunctions', 'category', 'deprecated')
+PARAMETER_FIELDS = ('type', 'dataType', 'description', 'required')
+SYNTAX_FIELDS = ('keywordSyntax', 'evidence', 'confidence')
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ParameterRecord:
+    __slots__ = ('name', 'keyword', 'dataType', 'description', 'required')
+
+    def __init__(self, name: str, keyword: str, dataType: str, description: str, required: bool):
+        self.name = name
+        self.keyword = _intern(keyword)
+        self.dataType = _intern(dataType)
+        self.description = description
+        self.required = required
+
+    def to_dict(self) -> Dict:
+        return {'type': self.keyword, 'dataType': self.dataType, 'description': self.description,
+                'required': self.required}
+
+
+class FunctionRecord:
+    __slots__ = FUNCTION_FIELDS
+
+    def __init__(self, record: Dict):
+        self.name = record['name']
+        self.description = record['description']
+        self.returnType = _intern(record['returnType'])
+        self.returnDescription = record['returnDescription']
+        self.parameters = tuple(ParameterRecord(name, param['type'], param['dataType'], param['description'],
+                                                param['required'])
+                                for name, param in record['parameters'].items())
+        self.examples = tuple(record['examples'])
+        self.useCase = record['useCase']
+        self.relatedFunctions = tuple(_intern(name) for name in record['relatedFunctions'])
+        self.category = _intern(record['category'])
+        self.deprecated = record['deprecated']
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'description': self.description,
+            'returnType': self.returnType,
+            'returnDescription': self.returnDescription,
+            'parameters': {param.name: param.to_dict() for param in self.parameters},
+            'examples': list(self.examples),
+            'useCase': self.useCase,
+            'relatedFunctions': list(self.relatedFunctions),
+            'category': self.category,
+            'deprecated': self.deprecated
+        }
+
+
+class SyntaxRecord:
+    __slots__ = SYNTAX_FIELDS
+
+    def __init__(self, syntax_info: Dict):
+        self.keywordSyntax = _intern(syntax_info['keywordSyntax'])
+        self.evidence = _intern(syntax_info['evidence'])
+        self.confidence = syntax_info['confidence']
+
+    def to_dict(self) -> Dict:
+        return {'keywordSyntax': self.keywordSyntax, 'evidence': self.evidence, 'confidence': self.confidence}
+
+
+def compact_function(record: Dict) -> Union[FunctionRecord, Dict]:
+    """Compact a full function record; partial ones (e.g. fetch errors) are returned unchanged."""
+    if tuple(record) != FUNCTION_FIELDS or \
+            any(tuple(param) != PARAMETER_FIELDS for param in record['parameters'].values()):
+        return record
+    return FunctionRecord(record)
+
+
+def compact_syntax(syntax_info: Dict) -> Union[SyntaxRecord, Dict]:
+    if tuple(syntax_info) != SYNTAX_FIELDS:
+        return syntax_info
+    return SyntaxRecord(syntax_info)
+
+
+def expand(record: Union[FunctionRecord, SyntaxRecord, Dict]) -> Dict:
+    """Plain dict for a compact record (dicts pass through)."""
+    return record if isinstance(record, dict) else record.to_dict()
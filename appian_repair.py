@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Targeted repair of existing outputs.
+Reads the docs, syntax, snippets and examples files, selects the functions
+whose records are broken (page fetch failed, empty description, no
+parameters), re-fetches only those pages through the pipeline (in parallel,
+with retries) and patches the rebuilt records into the files in place.
+Fixing 20 bad pages costs 20 page fetches plus one for discovery, not a full
+scrape. Records whose page still cannot be fetched keep their old entry.
+"""
+
+import argparse
+import os
+from typing import Dict, Iterable, List, Optional
+
+from appian_archive import DEFAULT_ARCHIVE_DIR, PageArchive
+from appian_output import write_json
+from appian_pipeline import DEFAULT_BASE_URL, OUTPUT_FILES, ScrapePipeline, write_outputs
+from appian_validate import CHECKS, build_columns, load_output, run_checks
+
+# Validator checks that mean the page should be fetched again
+REPAIR_CHECKS = ('fetch_error', 'empty_description', 'no_parameters')
+DEFAULT_REPORT = 'appian-repair-report.json'
+
+
+def select_repairs(snippets: Dict, docs: Dict, syntax: Dict,
+                   checks: Iterable[str] = REPAIR_CHECKS) -> Dict[str, List[str]]:
+    """Function name -> the repair checks it fails (functions failing none are left out)."""
+    columns = build_columns(snippets, docs, syntax)
+    flags = run_checks(columns)
+    selected = {}
+    for index, name in enumerate(columns['name']):
+        failed = [check for check in checks if flags[check][index]]
+        if failed:
+            selected[name] = failed
+    return selected
+
+
+def _patch_examples(store: Dict, repaired: Dict, name: str) -> None:
+    """Replace one function's examples in the examples file, keeping the hash-keyed entries consistent."""
+    examples = store.setdefault('examples', {})
+    functions = store.setdefault('functions', {})
+    for digest in functions.get(name, []):
+        entry = examples.get(digest)
+        if entry and name in entry['functions']:
+            entry['functions'].remove(name)
+            if not entry['functions']:
+                del examples[digest]
+
+    hashes = repaired.get('functions', {}).get(name)
+    if hashes is None:
+        functions.pop(name, None)
+        return
+    for digest in hashes:
+        entry = examples.get(digest)
+        if entry is None:
+            entry = dict(repaired['examples'][digest], functions=[])
+            examples[digest] = entry
+        if name not in entry['functions']:
+            entry['functions'].append(name)
+    functions[name] = hashes  # An existing key keeps its position
+
+
+def patch_outputs(existing: Dict[str, Dict], repaired: Dict[str, Dict]) -> List[str]:
+    """Patch rebuilt records into the loaded outputs (artifact name -> data); returns the names patched.
+
+    Existing records are replaced where they stand, so the files keep their
+    order; only artifacts present in existing are touched.
+    """
+    patched = []
+    syntax_map = repaired.get('syntax', {}).get('functions', {})
+    for name, record in repaired.get('docs', {}).get('functions', {}).items():
+        if syntax_map.get(name, {}).get('evidence') == 'fetch_error':
+            continue  # Still failing: the old record is no worse
+        if 'docs' in existing:
+            existing['docs'].setdefault('functions', {})[name] = record
+        if 'syntax' in existing:
+            existing['syntax'].setdefault('functions', {})[name] = syntax_map[name]
+        snippet_key = f"Appian {name}()"
+        if 'snippets' in existing and snippet_key in repaired.get('snippets', {}):
+            existing['snippets'][snippet_key] = repaired['snippets'][snippet_key]
+        if 'examples' in existing and 'examples' in repaired:
+            _patch_examples(existing['examples'], repaired['examples'], name)
+        patched.append(name)
+    return patched
+
+
+def repair(files: Dict[str, str], base_url: Optional[str] = None, checks: Iterable[str] = REPAIR_CHECKS,
+           workers: int = 4, retries: int = 3, retry_delay: float = 1.0, archive: Optional[PageArchive] = None,
+           session=None, dry_run: bool = False) -> Dict:
+    """Re-fetch and patch the broken records in the output files (artifact name -> path).
+
+    session replaces both scrapers' HTTP session (tests pass a fake one).
+    """
+    existing = {name: load_output(path) for name, path in files.items() if path and os.path.exists(path)}
+    selected = select_repairs(existing.get('snippets', {}), existing.get('docs', {}), existing.get('syntax', {}),
+                              checks)
+    base_url = base_url or existing.get('docs', {}).get('metadata', {}).get('source') or DEFAULT_BASE_URL
+    report = {
+        'source': base_url,
+        'selected': selected,
+        'repaired': [],
+        'stillFailing': [],
+        'notFound': [],
+        'fetches': 0,
+        'written': []
+    }
+    if not selected or dry_run:
+        return report
+
+    # Imported here: selection and dry runs only read the outputs
+    from scrape_appian_docs import AppianDocScraper, SnippetEmitter
+    from scrape_appian_docs_enhanced import DocsEmitter, EnhancedAppianDocScraper
+
+    snippet_scraper = AppianDocScraper(base_url=base_url, archive=archive)
+    docs_scraper = EnhancedAppianDocScraper(base_url=base_url, archive=archive)
+    if session is not None:
+        snippet_scraper.session = docs_scraper.session = session
+    emitters = [SnippetEmitter(snippet_scraper), DocsEmitter(docs_scraper)]
+    pipeline = ScrapePipeline(base_url, emitters, fetch=docs_scraper.fetch_page, fetch_raw=docs_scraper.fetch_raw,
+                              archive=archive, workers=workers, retries=retries, retry_delay=retry_delay)
+    repaired = pipeline.run(only=[f"{name}()" for name in selected])
+
+    rebuilt = repaired.get('docs', {}).get('functions', {})
+    report['repaired'] = patch_outputs(existing, repaired)
+    report['stillFailing'] = [name for name in rebuilt if name not in report['repaired']]
+    report['notFound'] = [name for name in selected if name not in rebuilt]
+    stats = pipeline.run_stats
+    report['fetches'] = stats.get('tasks', 0) + stats.get('retries', 0) + stats.get('discovery', {}).get('fetches', 0)
+    if report['repaired']:
+        report['written'] = write_outputs(existing, files)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Re-fetch only the broken records in the generated outputs and patch them in place',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Re-fetch pages that failed or produced empty descriptions/parameters
+  python3 appian_repair.py
+
+  # Only the pages that failed to fetch, with more retries
+  python3 appian_repair.py --checks fetch_error --retries 5
+
+  # List what would be re-fetched
+  python3 appian_repair.py --dry-run
+
+  # Re-extract the selected records from the latest archived pages (no network)
+  python3 appian_repair.py --replay latest
+        """
+    )
+    parser.add_argument('--snippets', type=str, default=OUTPUT_FILES['snippets'][0], help='Snippets file')
+    parser.add_argument('--docs', type=str, default=OUTPUT_FILES['docs'][0], help='Docs file')
+    parser.add_argument('--syntax', type=str, default=OUTPUT_FILES['syntax'][0], help='Syntax map file')
+    parser.add_argument('--examples', type=str, default=OUTPUT_FILES['examples'][0], help='Examples file')
+    parser.add_argument('--url', type=str, help='Functions listing page (default: the docs file source)')
+    parser.add_argument('--checks', type=str, default=','.join(REPAIR_CHECKS),
+                        help=f"Comma-separated validator checks that select a record (default: "
+                             f"{','.join(REPAIR_CHECKS)})")
+    parser.add_argument('--workers', type=int, default=4, help='Pages fetched in parallel (default: 4)')
+    parser.add_argument('--retries', type=int, default=3, help='Extra attempts per failed page (default: 3)')
+    parser.add_argument('--retry-delay', type=float, default=1.0,
+                        help='Seconds before the first retry, doubled each time (default: 1.0)')
+    parser.add_argument('--archive-dir', type=str, default=DEFAULT_ARCHIVE_DIR,
+                        help=f'Raw page archive directory (default: {DEFAULT_ARCHIVE_DIR})')
+    parser.add_argument('--replay', type=str, metavar='RUN',
+                        help="Read pages from an archived run (id or 'latest') instead of the network")
+    parser.add_argument('--report', type=str, default=DEFAULT_REPORT,
+                        help=f'Repair report JSON file (default: {DEFAULT_REPORT})')
+    parser.add_argument('--dry-run', action='store_true', help='Only list the records that would be re-fetched')
+    args = parser.parse_args()
+
+    checks = [check.strip() for check in args.checks.split(',') if check.strip()]
+    unknown = [check for check in checks if check not in CHECKS]
+    if unknown:
+        parser.error(f"unknown checks: {', '.join(unknown)}")
+
+    # Live repairs are not archived: a manifest of a few pages would replace the full run as 'latest'
+    archive = None
+    if args.replay:
+        archive = PageArchive(args.archive_dir)
+        manifest = archive.start_replay(args.replay)
+        args.url = args.url or manifest['source']
+        print(f"Replaying archived run {manifest['run']} ({len(manifest['pages'])} pages)")
+
+    files = {'snippets': args.snippets, 'docs': args.docs, 'syntax': args.syntax, 'examples': args.examples}
+    report = repair(files, base_url=args.url, checks=checks, workers=args.workers, retries=args.retries,
+                    retry_delay=args.retry_delay, archive=archive, dry_run=args.dry_run)
+
+    print(f"\n{len(report['selected'])} records selected for repair")
+    for name, failed in list(report['selected'].items())[:20]:
+        print(f"  {name:40s} {', '.join(failed)}")
+    if args.dry_run or not report['selected']:
+        return
+
+    write_json(args.report, report)
+    print(f"\n✓ Repaired {len(report['repaired'])} records with {report['fetches']} fetches")
+    if report['stillFailing']:
+        print(f"✗ Still failing: {', '.join(report['stillFailing'])}")
+    if report['notFound']:
+        print(f"✗ Not on the listing page: {', '.join(report['notFound'])}")
+    for path in report['written']:
+        print(f"✓ Saved to: {path}")
+    print(f"Report: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Work-stealing scheduler for page scraping.
+Tasks are ordered longest-first using each URL's cost from the previous run
+(appian-scrape-stats.json) and dealt to per-worker queues; a worker whose
+queue runs dry steals the largest remaining task from the most loaded worker,
+so heavy pages start early and the run finishes close to total work / workers.
+RateLimiter optionally caps how fast those workers hit the docs site.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Hashable, List, Optional
+
+from appian_output import write_json
+
+DEFAULT_STATS_FILE = 'appian-scrape-stats.json'
+
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart, across every worker thread."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.waited = 0.0  # Total seconds workers spent throttled
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+            self.waited += start - now
+        if start > now:
+            time.sleep(start - now)
+
+    def wrap(self, fetch: Callable) -> Callable:
+        """fetch(url), throttled."""
+        def throttled(url):
+            self.wait()
+            return fetch(url)
+        return throttled
+
+
+def load_costs(stats_file: Optional[str]) -> Dict[str, float]:
+    """Per-URL seconds from a previous run's stats file (empty if there is none)."""
+    if not stats_file or not os.path.exists(stats_file):
+        return {}
+    with open(stats_file, 'r', encoding='utf-8') as f:
+        stats = json.load(f)
+    return {url: page['seconds'] for url, page in stats.get('pages', {}).items()}
+
+
+def save_costs(stats_file: str, costs: Dict[str, float], run_stats: Dict) -> None:
+    """Merge this run's per-URL seconds into the stats file (pages not re-scraped keep their old cost).
+
+    Parallel jobs share the file, so the read-merge-write holds a lock on stats_file + '.lock';
+    without it the last job to write would drop the others' pages.
+    """
+    # Imported here: only needed once a scrape finishes, and it slows every startup
+    from appian_fetch_cache import FileLock
+
+    with FileLock(stats_file + '.lock'):
+        pages = {url: {'seconds': seconds} for url, seconds in load_costs(stats_file).items()}
+        pages.update({url: {'seconds': round(seconds, 4)} for url, seconds in costs.items()})
+        write_json(stats_file, {'run': run_stats, 'pages': pages}, sort_keys=True)
+
+
+def estimate_costs(keys: List[Hashable], known: Dict[Hashable, float]) -> Dict[Hashable, float]:
+    """Cost per task; tasks with no history get the mean of the known costs."""
+    history = [known[key] for key in keys if key in known]
+    default = sum(history) / len(history) if history else 1.0
+    return {key: known.get(key, default) for key in keys}
+
+
+class WorkStealingScheduler:
+    def __init__(self, workers: int = 4):
+        self.workers = max(1, workers)
+        self.durations = {}  # task -> measured seconds
+        self.steals = 0
+
+    def plan(self, costs: Dict[Hashable, float]) -> List[deque]:
+        """Deal tasks longest-first, each to the worker with the least estimated load."""
+        queues = [deque() for _ in range(self.workers)]
+        loads = [0.0] * self.workers
+        for key in sorted(costs, key=lambda task: -costs[task]):
+            worker = loads.index(min(loads))
+            queues[worker].append(key)
+            loads[worker] += costs[key]
+        return queues
+
+    def run(self, costs: Dict[Hashable, float], handler: Callable[[Hashable], Optional[float]]) -> Dict:
+        """Run handler(task) for every task; returns makespan and utilization stats."""
+        queues = self.plan(costs)
+        remaining = [sum(costs[key] for key in queue) for queue in queues]
+        lock = threading.Lock()
+        busy = [0.0] * self.workers
+        errors = []
+
+        def next_task(worker: int) -> Optional[Hashable]:
+            with lock:
+                if queues[worker]:
+                    key = queues[worker].popleft()
+                    remaining[worker] -= costs[key]
+                    return key
+                victim = max(range(self.workers), key=lambda other: remaining[other] if queues[other] else -1)
+                if not queues[victim]:
+                    return None
+                # Take the victim's largest remaining task, keeping the longest-first order overall
+                key = queues[victim].popleft()
+                remaining[victim] -= costs[key]
+                self.steals += 1
+                return key
+
+        def work(worker: int) -> None:
+            while not errors:
+                key = next_task(worker)
+                if key is None:
+                    return
+                start = time.perf_counter()
+                try:
+                    cost = handler(key)
+                except Exception as e:  # Stop every worker and re-raise in the caller
+                    errors.append(e)
+                    return
+                elapsed = time.perf_counter() - start
+                busy[worker] += elapsed
+                # Handlers may report their own cost (e.g. excluding time spent waiting on a lock)
+                self.durations[key] = cost if isinstance(cost, float) else elapsed
+
+        start = time.perf_counter()
+        if self.workers == 1:
+            work(0)
+        else:
+            threads = [threading.Thread(target=work, args=(worker,), daemon=True) for worker in range(self.workers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        makespan = time.perf_counter() - start
+
+        if errors:
+            raise errors[0]
+
+        total = sum(busy)
+        return {
+            'workers': self.workers,
+            'tasks': len(self.durations),
+            'steals': self.steals,
+            'work': round(total, 3),
+            'makespan': round(makespan, 3),
+            'ideal': round(total / self.workers, 3),
+            'efficiency': round(total / (makespan * self.workers), 3) if makespan else 1.0
+        }
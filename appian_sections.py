@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Heading-indexed section map of a function page.
+The page's headings are read once into sections (heading -> the sibling
+elements up to the next heading of the same or a higher level), classified by
+the matcher registry into kinds such as 'returns' or 'examples', so extractors
+look their section up by name instead of each scanning every text node.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from appian_matchers import DEFAULT_MATCHERS, Matchers
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+# Section kind -> the matcher pattern that recognizes its heading
+SECTION_KINDS = {
+    'returns': 'returns_heading',
+    'keywords': 'keywords_heading',
+    'related': 'related_heading',
+    'usage': 'use_case_heading',
+    'examples': 'example_heading',
+}
+
+
+def heading_level(element) -> int:
+    """'h2' -> 2; anything that is not a heading sorts below every heading."""
+    name = getattr(element, 'name', None)
+    return int(name[1]) if name in HEADING_TAGS else 7
+
+
+class Section:
+    """One heading and the elements it introduces."""
+    __slots__ = ('heading', 'level', 'title', 'kinds')
+
+    def __init__(self, heading, kinds: List[str]):
+        self.heading = heading
+        self.level = heading_level(heading)
+        self.title = heading.get_text(' ', strip=True)
+        self.kinds = kinds
+
+    def blocks(self) -> List:
+        """Sibling elements after the heading, up to the next heading of the same or a higher level."""
+        blocks = []
+        for sibling in self.heading.find_next_siblings():
+            if heading_level(sibling) <= self.level or \
+                    any(heading_level(inner) <= self.level for inner in sibling.find_all(HEADING_TAGS)):
+                break
+            blocks.append(sibling)
+        return blocks
+
+    def find_all(self, names) -> List:
+        """Elements with the given tag name(s) anywhere in the section, in document order."""
+        names = (names,) if isinstance(names, str) else tuple(names)
+        found = []
+        for block in self.blocks():
+            if block.name in names:
+                found.append(block)
+            found.extend(block.find_all(names))
+        return found
+
+
+class SectionMap:
+    """Sections of a page, indexed by normalized heading text and by kind."""
+
+    def __init__(self, root: BeautifulSoup, matchers: Matchers = DEFAULT_MATCHERS):
+        from bs4 import NavigableString
+
+        self.root = root
+        self.matchers = matchers
+        self.sections = []
+        self.by_title = {}  # lowercased heading text -> first section with that title
+        self.by_kind = {kind: [] for kind in SECTION_KINDS}
+        self._strings = []  # Text nodes matching any heading pattern, for the fallback in anchors()
+        self._text_matches = None
+
+        # One walk over the page (bs4's find_all filters cost more than the walk itself)
+        headings = []
+        for node in root.descendants:
+            if isinstance(node, NavigableString):
+                if matchers.any_heading.search(node):
+                    self._strings.append(node)
+            elif node.name in HEADING_TAGS:
+                headings.append(node)
+
+        for heading in headings:
+            title = heading.get_text(' ', strip=True)
+            # The h1 is the function name (e.g. a!relatedRecordData()), not a section
+            kinds = [] if heading.name == 'h1' else [kind for kind, pattern in SECTION_KINDS.items()
+                                                     if getattr(matchers, pattern).search(title)]
+            section = Section(heading, kinds)
+            self.sections.append(section)
+            self.by_title.setdefault(title.lower(), section)
+            for kind in kinds:
+                self.by_kind[kind].append(section)
+
+    def get(self, title: str) -> Optional[Section]:
+        """Section by its heading text (case-insensitive)."""
+        return self.by_title.get(title.lower())
+
+    def first(self, kind: str) -> Optional[Section]:
+        """First section of a kind ('returns', 'keywords', 'related', 'usage', 'examples')."""
+        sections = self.by_kind[kind]
+        return sections[0] if sections else None
+
+    def of_kind(self, kind: str) -> List[Section]:
+        return self.by_kind[kind]
+
+    def anchors(self, kind: str) -> List:
+        """Elements to read a kind of section from: its headings, in document order.
+
+        Pages that mark the section without a real heading (bold text, a table
+        label) fall back to the elements whose text matches the kind's pattern,
+        found in one pass over the page for all kinds together.
+        """
+        if self.by_kind[kind]:
+            return [section.heading for section in self.by_kind[kind]]
+        if self._text_matches is None:
+            self._text_matches = self.matchers.classify_headings(self._strings)
+        return [string.parent for string in self._text_matches.get(SECTION_KINDS[kind], []) if string.parent]
+
+    def outline(self) -> List[Dict]:
+        """Heading level, title and kinds of every section (for debugging page structure)."""
+        return [{'level': section.level, 'title': section.title, 'kinds': section.kinds} for section in self.sections]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Request coalescing for page fetches within a run.
+Concurrent fetches of one normalized URL (canonical_url: no fragment or
+query, lowercase host) share a single in-flight download and parsed tree, and
+a bounded LRU of parsed pages serves repeats, so no page is downloaded twice
+in one run. Parsed trees are shared read-only; low-memory runs keep no LRU
+because their trees are disposed as soon as the emitters are done.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from appian_discovery import canonical_url
+
+DEFAULT_PAGE_CACHE = 32  # Parsed pages kept for repeats
+
+
+class _Flight:
+    """One in-flight fetch that later callers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, fetch: Callable[[str], Optional[object]], max_pages: int = DEFAULT_PAGE_CACHE):
+        self.fetch = fetch
+        self.max_pages = max_pages
+        self._pages = OrderedDict()  # canonical URL -> parsed page, least recently used first
+        self._flights = {}  # canonical URL -> _Flight
+        self._downloaded = set()  # canonical URLs fetched successfully this run
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'downloads': 0, 'failed': 0, 'shared': 0, 'cacheHits': 0,
+                      'duplicateDownloads': 0}
+
+    def __call__(self, url: str):
+        """The parsed page for url (None when it could not be fetched)."""
+        key = canonical_url(url)
+        with self._lock:
+            self.stats['requests'] += 1
+            if key in self._pages:
+                self._pages.move_to_end(key)
+                self.stats['cacheHits'] += 1
+                return self._pages[key]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.stats['shared'] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self.fetch(url)
+        except Exception as e:  # Waiters see the same error; nothing is cached
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                if flight.result is None:
+                    self.stats['failed'] += 1
+                else:
+                    self.stats['downloads'] += 1
+                    if key in self._downloaded:
+                        self.stats['duplicateDownloads'] += 1
+                    self._downloaded.add(key)
+                    if self.max_pages:
+                        self._pages[key] = flight.result
+                        if len(self._pages) > self.max_pages:
+                            self._pages.popitem(last=False)
+            flight.done.set()
+        return flight.result
+
+    def summary(self) -> Dict[str, int]:
+        return dict(self.stats, cachedPages=len(self._pages))
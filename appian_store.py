@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+SQLite store for the scraped function corpus.
+Normalized tables for functions, parameters, examples, related-function edges
+and syntax evidence (with its confidence), with indexes on the common filters and an FTS5 table over
+descriptions. Written in batched transactions by EnhancedAppianDocScraper
+(--sqlite) or built from the existing JSON outputs; see appian_query.py for lookups.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_STORE_FILE = 'appian-functions.db'
+SCHEMA_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS functions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    returnType TEXT,
+    returnDescription TEXT,
+    useCase TEXT,
+    category TEXT,
+    deprecated INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS parameters (
+    functionId INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    keyword TEXT,
+    dataType TEXT,
+    description TEXT,
+    required INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (functionId, position)
+);
+CREATE TABLE IF NOT EXISTS examples (
+    functionId INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    expression TEXT NOT NULL,
+    PRIMARY KEY (functionId, position)
+);
+CREATE TABLE IF NOT EXISTS related (
+    functionId INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    relatedName TEXT NOT NULL,
+    PRIMARY KEY (functionId, relatedName)
+);
+CREATE TABLE IF NOT EXISTS syntax (
+    functionId INTEGER PRIMARY KEY REFERENCES functions(id) ON DELETE CASCADE,
+    keywordSyntax TEXT NOT NULL,
+    evidence TEXT,
+    confidence REAL
+);
+CREATE INDEX IF NOT EXISTS idx_functions_category ON functions(category);
+CREATE INDEX IF NOT EXISTS idx_functions_deprecated ON functions(deprecated);
+CREATE INDEX IF NOT EXISTS idx_functions_return_type ON functions(returnType);
+CREATE INDEX IF NOT EXISTS idx_parameters_keyword ON parameters(keyword);
+CREATE INDEX IF NOT EXISTS idx_parameters_data_type ON parameters(dataType);
+CREATE INDEX IF NOT EXISTS idx_related_name ON related(relatedName);
+CREATE INDEX IF NOT EXISTS idx_syntax_keyword ON syntax(keywordSyntax);
+'''
+
+# Full-text index over names and descriptions; rowid is functions.id
+FTS_SCHEMA = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS functions_fts USING fts5(name, description, useCase);
+'''
+
+
+def fts_available(conn: sqlite3.Connection) -> bool:
+    """Whether this SQLite build has the FTS5 extension."""
+    try:
+        conn.execute('CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)')
+        conn.execute('DROP TABLE temp.fts5_probe')
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def connect(path: str = DEFAULT_STORE_FILE) -> sqlite3.Connection:
+    """Open (and create if needed) a corpus store."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.executescript(SCHEMA)
+    if 'confidence' not in {row['name'] for row in conn.execute('PRAGMA table_info(syntax)')}:
+        conn.execute('ALTER TABLE syntax ADD COLUMN confidence REAL')  # Stores from schema version 1
+    if fts_available(conn):
+        conn.executescript(FTS_SCHEMA)
+    conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('schemaVersion', ?)", (str(SCHEMA_VERSION),))
+    conn.commit()
+    return conn
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'functions_fts'").fetchone()
+    return row is not None
+
+
+class CorpusStore:
+    """Buffers scraped records and writes them to SQLite in bulk transactions."""
+
+    def __init__(self, path: str = DEFAULT_STORE_FILE, batch_size: int = 100):
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = connect(path)
+        self.fts = has_fts(self.conn)
+        self.pending = []  # (function record, syntax info) awaiting the next transaction
+        self.written = 0
+
+    def set_metadata(self, metadata: Dict) -> None:
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)',
+                                  [(key, json.dumps(value)) for key, value in metadata.items()])
+
+    def add(self, record: Dict, syntax_info: Optional[Dict] = None) -> None:
+        """Queue one function; the batch is written once batch_size records are pending."""
+        self.pending.append((record, syntax_info or {}))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending records in a single transaction."""
+        if not self.pending:
+            return
+        with self.conn:
+            self._write(self.pending)
+        self.written += len(self.pending)
+        self.pending = []
+
+    def _write(self, batch: List[Tuple[Dict, Dict]]) -> None:
+        cursor = self.conn.cursor()
+        cursor.executemany('''
+            INSERT INTO functions (name, description, returnType, returnDescription, useCase, category, deprecated)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                description = excluded.description, returnType = excluded.returnType,
+                returnDescription = excluded.returnDescription, useCase = excluded.useCase,
+                category = excluded.category, deprecated = excluded.deprecated
+        ''', [(record['name'], record.get('description', ''), record.get('returnType', ''),
+               record.get('returnDescription', ''), record.get('useCase', ''), record.get('category', ''),
+               int(bool(record.get('deprecated', False)))) for record, _ in batch])
+
+        names = [record['name'] for record, _ in batch]
+        ids = {}
+        for start in range(0, len(names), 500):  # Stay under SQLite's bound-parameter limit
+            chunk = names[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for row in cursor.execute(f'SELECT id, name FROM functions WHERE name IN ({placeholders})', chunk):
+                ids[row['name']] = row['id']
+
+        id_rows = [(ids[name],) for name in names]
+        for table in ('parameters', 'examples', 'related', 'syntax'):
+            cursor.executemany(f'DELETE FROM {table} WHERE functionId = ?', id_rows)
+
+        parameters, examples, related, syntax = [], [], [], []
+        for record, syntax_info in batch:
+            function_id = ids[record['name']]
+            for position, (display_name, param) in enumerate(record.get('parameters', {}).items()):
+                parameters.append((function_id, position, display_name, param.get('type', ''),
+                                   param.get('dataType', ''), param.get('description', ''),
+                                   int(bool(param.get('required', False)))))
+            examples.extend((function_id, position, expression)
+                            for position, expression in enumerate(record.get('examples', [])))
+            related.extend((function_id, name) for name in dict.fromkeys(record.get('relatedFunctions', [])))
+            if syntax_info:
+                syntax.append((function_id, str(syntax_info.get('keywordSyntax', 'unknown')).lower(),
+                               syntax_info.get('evidence', ''), syntax_info.get('confidence')))
+
+        cursor.executemany('INSERT INTO parameters VALUES (?, ?, ?, ?, ?, ?, ?)', parameters)
+        cursor.executemany('INSERT INTO examples VALUES (?, ?, ?)', examples)
+        cursor.executemany('INSERT INTO related VALUES (?, ?)', related)
+        cursor.executemany('INSERT INTO syntax VALUES (?, ?, ?, ?)', syntax)
+
+        if self.fts:
+            cursor.executemany('DELETE FROM functions_fts WHERE rowid = ?', id_rows)
+            cursor.executemany('INSERT INTO functions_fts (rowid, name, description, useCase) VALUES (?, ?, ?, ?)',
+                               [(ids[record['name']], record['name'], record.get('description', ''),
+                                 record.get('useCase', '')) for record, _ in batch])
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+
+def build_store(docs: Dict, syntax: Optional[Dict] = None, path: str = DEFAULT_STORE_FILE) -> int:
+    """Load already-scraped JSON outputs into a store; returns the number of functions written.
+
+    Syntax entries from before confidence scoring are scored from the record on the way in.
+    """
+    # Imported here: the scorer pulls in the expression parser, which queries never need
+    from appian_syntax import keyword_confidence
+
+    store = CorpusStore(path, batch_size=len(docs.get('functions', {})) or 1)
+    store.set_metadata(docs.get('metadata', {}))
+    syntax_functions = (syntax or {}).get('functions', {})
+    for name, record in docs.get('functions', {}).items():
+        syntax_info = syntax_functions.get(name)
+        if syntax_info and 'confidence' not in syntax_info:
+            syntax_info = dict(syntax_info, confidence=keyword_confidence(
+                name, record.get('parameters') or {}, record.get('examples', []), syntax_info.get('evidence', '')))
+        store.add(record, syntax_info)
+    store.close()
+    return store.written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build the SQLite corpus store from the scraped JSON outputs',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build appian-functions.db from appian-functions-docs.json + appian-function-syntax.json
+  python3 appian_store.py
+
+  # Or write it during the scrape
+  python3 scrape_appian_docs_enhanced.py --sqlite appian-functions.db
+
+  # Query it
+  python3 appian_query.py --category "Text Functions" --deprecated no
+        """
+    )
+    parser.add_argument('--docs', type=str, default='appian-functions-docs.json', help='Docs JSON file')
+    parser.add_argument('--syntax', type=str, default='appian-function-syntax.json', help='Syntax map JSON file')
+    parser.add_argument('--output', type=str, default=DEFAULT_STORE_FILE,
+                        help=f'SQLite database file (default: {DEFAULT_STORE_FILE})')
+    args = parser.parse_args()
+
+    with open(args.docs, 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+    syntax = None
+    if os.path.exists(args.syntax):
+        with open(args.syntax, 'r', encoding='utf-8') as f:
+            syntax = json.load(f)
+
+    count = build_store(docs, syntax, args.output)
+    print(f"Stored {count} functions")
+    print(f"Saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
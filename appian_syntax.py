@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Keyword syntax confidence scoring.
+Combines every signal a page gives about keyword arguments - an explicit
+Keywords section, a UI-component parameter table (Name | Keyword | Type |
+Description), example calls of the function itself (from their parse trees)
+and the a! prefix - into one probability per function with a logistic model.
+The whole corpus is scored in one pass from the generated outputs, and a small
+hand-labeled set (appian-syntax-labels.json) reports accuracy and calibration
+so the weights can be tuned (or fitted with --fit).
+"""
+
+import argparse
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from appian_expr import call_keywords, function_key, iter_calls, parse
+from appian_output import write_json
+from appian_validate import load_output
+
+# Log-odds contribution of each signal (counts are capped at MAX_EXAMPLE_COUNT), fitted on the
+# labeled set; the a! prefix alone stays unsure, page evidence decides either way
+DEFAULT_WEIGHTS = {
+    'bias': -1.5,
+    'keywords_section': 3.0,  # Explicit "Keywords" list on the page (not fitted: every labeled case has examples too)
+    'ui_table': 1.1,  # Parameter table has a Keyword column next to display names
+    'keyword_examples': 1.7,  # Examples calling this function with keyword arguments
+    'positional_examples': -1.9,  # Examples calling it with positional arguments only
+    'a_prefix': 2.0,  # a! domain function
+}
+SIGNALS = tuple(name for name in DEFAULT_WEIGHTS if name != 'bias')
+MAX_EXAMPLE_COUNT = 3
+CONFIDENT = 0.8  # keywordSyntax is True at or above this confidence, False at or below 1 - CONFIDENT
+DEFAULT_LABELS = 'appian-syntax-labels.json'
+DEFAULT_REPORT = 'appian-syntax-report.json'
+CALIBRATION_BINS = 5
+
+
+def example_calls(examples: Iterable[str], function_name: str) -> Tuple[int, int]:
+    """(examples calling the function with keyword arguments, examples calling it positionally only).
+
+    Calls to other functions in the same example do not count.
+    """
+    key = function_key(function_name)
+    keyword = positional = 0
+    for example in examples:
+        own_calls = [call for call in iter_calls(parse(example)) if function_key(call['name']) == key]
+        if any(call_keywords(call) for call in own_calls):
+            keyword += 1
+        elif any(call['args'] for call in own_calls):
+            positional += 1
+    return keyword, positional
+
+
+def extract_signals(function_name: str, parameters: Dict, examples: Iterable[str],
+                    keywords_section: bool = False) -> Dict[str, float]:
+    """Signal values for one function (0/1 flags and capped example counts)."""
+    keyword, positional = example_calls(examples, function_name)
+    return {
+        'keywords_section': float(keywords_section),
+        'ui_table': float(any((param.get('type') or display) != display for display, param in parameters.items())),
+        'keyword_examples': float(min(keyword, MAX_EXAMPLE_COUNT)),
+        'positional_examples': float(min(positional, MAX_EXAMPLE_COUNT)),
+        'a_prefix': float(function_name.startswith('a!')),
+    }
+
+
+def confidence(signals: Dict[str, float], weights: Optional[Dict[str, float]] = None) -> float:
+    """Probability that the function takes keyword arguments."""
+    weights = weights or DEFAULT_WEIGHTS
+    logit = weights['bias'] + sum(weights[name] * value for name, value in signals.items())
+    return 1.0 / (1.0 + math.exp(-logit))
+
+
+def decide(probability: float, threshold: float = CONFIDENT):
+    """Tri-state keywordSyntax for a confidence: True, False or 'unknown' in between."""
+    if probability >= threshold:
+        return True
+    if probability <= 1.0 - threshold:
+        return False
+    return 'unknown'
+
+
+def keyword_confidence(function_name: str, parameters: Dict, examples: Iterable[str], evidence: str,
+                       weights: Optional[Dict[str, float]] = None) -> float:
+    """Confidence for one scraped function, rounded for the syntax map."""
+    signals = extract_signals(function_name, parameters, examples, evidence == 'keywords_section')
+    return round(confidence(signals, weights), 3)
+
+
+def score_corpus(docs: Dict, syntax: Dict, examples: Optional[Dict] = None,
+                 weights: Optional[Dict[str, float]] = None) -> Dict[str, Dict]:
+    """Signals, confidence and decision for every function in the outputs, in one pass.
+
+    Examples come from the examples file when given (full expressions), else
+    from the docs records' compact examples.
+    """
+    syntax_map = syntax.get('functions', {})
+    example_store = (examples or {}).get('examples', {})
+    example_functions = (examples or {}).get('functions', {})
+    scores = {}
+    for name, record in docs.get('functions', {}).items():
+        if name in example_functions:
+            expressions = [example_store[digest]['expression'] for digest in example_functions[name]
+                           if digest in example_store]
+        else:
+            expressions = record.get('examples', [])
+        evidence = syntax_map.get(name, {}).get('evidence', 'none')
+        signals = extract_signals(name, record.get('parameters') or {}, expressions, evidence == 'keywords_section')
+        probability = confidence(signals, weights)
+        scores[name] = {'confidence': round(probability, 3), 'keywordSyntax': decide(probability),
+                        'signals': signals}
+    return scores
+
+
+def evaluate(scores: Dict[str, Dict], labels: Dict[str, bool], syntax: Optional[Dict] = None,
+             threshold: float = CONFIDENT) -> Dict:
+    """Accuracy and calibration of the scores against labeled functions.
+
+    With the syntax map, the accuracy of its recorded keywordSyntax (the
+    single-evidence rule) is reported alongside as a baseline.
+    """
+    labeled = [name for name in labels if name in scores]
+    probabilities = [scores[name]['confidence'] for name in labeled]
+    truths = [bool(labels[name]) for name in labeled]
+    decisions = [decide(probability, threshold) for probability in probabilities]
+    decided = [(decision, truth) for decision, truth in zip(decisions, truths) if decision != 'unknown']
+
+    bins = []
+    for index in range(CALIBRATION_BINS):
+        low, high = index / CALIBRATION_BINS, (index + 1) / CALIBRATION_BINS
+        members = [(probability, truth) for probability, truth in zip(probabilities, truths)
+                   if low <= probability < high or (high == 1.0 and probability == 1.0)]
+        if members:
+            bins.append({'range': [low, high], 'count': len(members),
+                         'meanConfidence': round(sum(p for p, _ in members) / len(members), 3),
+                         'observed': round(sum(truth for _, truth in members) / len(members), 3)})
+
+    report = {
+        'labeled': len(labeled),
+        'missing': [name for name in labels if name not in scores],
+        'decided': len(decided),
+        'accuracy': round(sum(decision == truth for decision, truth in decided) / len(decided), 3) if decided else 0.0,
+        'accuracyAt50': round(sum((probability >= 0.5) == truth for probability, truth in zip(probabilities, truths))
+                              / len(labeled), 3) if labeled else 0.0,
+        'brier': round(sum((probability - truth) ** 2 for probability, truth in zip(probabilities, truths))
+                       / len(labeled), 4) if labeled else 0.0,
+        'calibration': bins,
+        'errors': [name for name, decision, truth in zip(labeled, decisions, truths)
+                   if decision != 'unknown' and decision != truth],
+    }
+    if syntax is not None:
+        recorded = [(syntax.get('functions', {}).get(name, {}).get('keywordSyntax', 'unknown'), truth)
+                    for name, truth in zip(labeled, truths)]
+        recorded = [(value, truth) for value, truth in recorded if value != 'unknown']
+        report['baseline'] = {
+            'decided': len(recorded),
+            'accuracy': round(sum(value == truth for value, truth in recorded) / len(recorded), 3) if recorded else 0.0
+        }
+    return report
+
+
+def fit_weights(rows: List[Dict[str, float]], truths: List[bool], l2: float = 0.01, epochs: int = 2000,
+                rate: float = 0.5) -> Dict[str, float]:
+    """Logistic regression weights for the signals (batch gradient descent with L2, deterministic)."""
+    weights = dict(DEFAULT_WEIGHTS)
+    count = len(rows)
+    if not count:
+        return weights
+    for _ in range(epochs):
+        gradient = {name: 0.0 for name in weights}
+        for signals, truth in zip(rows, truths):
+            error = confidence(signals, weights) - truth
+            gradient['bias'] += error
+            for name in SIGNALS:
+                gradient[name] += error * signals[name]
+        for name in weights:
+            penalty = 0.0 if name == 'bias' else l2 * weights[name]
+            weights[name] -= rate * (gradient[name] / count + penalty)
+    return {name: round(value, 3) for name, value in weights.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Score keyword syntax confidence for every function and check it against labeled functions',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Score the corpus and report accuracy on the labeled set
+  python3 appian_syntax.py
+
+  # Fit the weights on the labeled set, then store confidences in the syntax map
+  python3 appian_syntax.py --fit --write
+        """
+    )
+    parser.add_argument('--docs', type=str, default='appian-functions-docs.json', help='Docs file')
+    parser.add_argument('--syntax', type=str, default='appian-function-syntax.json', help='Syntax map file')
+    parser.add_argument('--examples', type=str, default='appian-function-examples.json',
+                        help='Examples file (optional; full example expressions)')
+    parser.add_argument('--labels', type=str, default=DEFAULT_LABELS,
+                        help=f'Labeled functions (default: {DEFAULT_LABELS})')
+    parser.add_argument('--fit', action='store_true', help='Fit the signal weights on the labeled set')
+    parser.add_argument('--write', action='store_true', help='Store each confidence in the syntax map')
+    parser.add_argument('--output', type=str, default=DEFAULT_REPORT,
+                        help=f'Report JSON file (default: {DEFAULT_REPORT})')
+    args = parser.parse_args()
+
+    docs, syntax, examples = load_output(args.docs), load_output(args.syntax), load_output(args.examples)
+    labels = load_output(args.labels).get('functions', {})
+
+    weights = None
+    if args.fit:
+        first_pass = score_corpus(docs, syntax, examples)
+        labeled = [name for name in labels if name in first_pass]
+        weights = fit_weights([first_pass[name]['signals'] for name in labeled], [labels[name] for name in labeled])
+        print(f"Fitted weights on {len(labeled)} labeled functions: {weights}")
+
+    start = time.perf_counter()
+    scores = score_corpus(docs, syntax, examples, weights)
+    elapsed = time.perf_counter() - start
+    report = evaluate(scores, labels, syntax)
+
+    decisions = [score['keywordSyntax'] for score in scores.values()]
+    print(f"Scored {len(scores)} functions in {elapsed * 1000:.0f} ms: {decisions.count(True)} keyword, "
+          f"{decisions.count(False)} positional, {decisions.count('unknown')} unsure")
+    print(f"Labeled set: {report['labeled']} functions, accuracy {report['accuracy']:.1%} on "
+          f"{report['decided']} decided (Brier {report['brier']}); "
+          f"recorded keywordSyntax accuracy {report['baseline']['accuracy']:.1%} on {report['baseline']['decided']}")
+    for row in report['calibration']:
+        print(f"  confidence {row['range'][0]:.1f}-{row['range'][1]:.1f}: {row['count']:3d} functions, "
+              f"mean {row['meanConfidence']:.2f}, observed {row['observed']:.2f}")
+    if report['errors']:
+        print(f"Misclassified: {', '.join(report['errors'])}")
+
+    write_json(args.output, dict(report, weights=weights or DEFAULT_WEIGHTS, scores=scores))
+    print(f"Saved to: {args.output}")
+
+    if args.write and syntax:
+        for name, score in scores.items():
+            if name in syntax.get('functions', {}):
+                syntax['functions'][name]['confidence'] = score['confidence']
+        write_json(args.syntax, syntax)
+        print(f"✓ Confidences stored in: {args.syntax}")
+
+
+if __name__ == "__main__":
+    main()
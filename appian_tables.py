@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Header-aware parameter table extraction.
+Each table is classified once by its normalized header signature (e.g.
+('name', 'keyword', 'type', 'description')); the column mapping for a signature
+is cached and reused across the corpus, and shapes that could not be mapped are
+collected into a report.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# Normalized header text -> column role
+HEADER_ROLES = {
+    'keyword': 'keyword', 'keywords': 'keyword',
+    'parameter': 'parameter', 'parameters': 'parameter', 'parameter name': 'parameter',
+    'argument': 'parameter', 'arguments': 'parameter', 'input': 'parameter', 'inputs': 'parameter',
+    'name': 'name', 'display name': 'name',
+    'type': 'dataType', 'types': 'dataType', 'data type': 'dataType', 'data types': 'dataType',
+    'datatype': 'dataType', 'value type': 'dataType',
+    'description': 'description', 'descriptions': 'description', 'details': 'description', 'notes': 'description',
+    'required': 'required', 'mandatory': 'required',
+}
+# Values of a "Required" column that mean the parameter is required
+REQUIRED_VALUES = ('yes', 'y', 'true', 'required', '✓', '✔')
+# First-column values that are repeated headers or page chrome, not parameters
+INVALID_NAMES = ('Keyword', 'Parameter', 'Name', 'Disclaimer', 'Privacy')
+
+
+def normalize_header(text: str) -> str:
+    """'Types ' -> 'types', 'Data-Type' -> 'data type', 'Required?' -> 'required'."""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text.lower()).split())
+
+
+def column_mapping(signature: Tuple[str, ...]) -> Optional[Dict[str, int]]:
+    """Map a header signature to column indexes, or None if it is not a parameter table.
+
+    A parameter table needs a column naming the parameter (keyword, parameter or
+    name) and evidence that the rows are arguments: a type column or a Keyword
+    header. "Name | Description" alone is how the docs list options, properties
+    and related functions, so it is reported as unrecognized instead.
+    """
+    roles = {}
+    for index, header in enumerate(signature):
+        role = HEADER_ROLES.get(header)
+        if role and role not in roles:
+            roles[role] = index
+
+    identifier_roles = [role for role in ('keyword', 'parameter', 'name') if role in roles]
+    if not identifier_roles or not ('dataType' in roles or 'keyword' in roles):
+        return None
+
+    # Keyword: what the expression uses; display name: what the docs show
+    mapping = {
+        'keyword': roles[identifier_roles[0]],
+        'name': roles[('name' if 'name' in roles else identifier_roles[0])]
+    }
+    for role in ('dataType', 'description', 'required'):
+        if role in roles:
+            mapping[role] = roles[role]
+    return mapping
+
+
+def _own_rows(table) -> List:
+    """Rows of this table, excluding rows of tables nested inside its cells."""
+    return [row for row in table.find_all('tr') if row.find_parent('table') is table]
+
+
+class ParameterTableExtractor:
+    """Extracts parameter rows from every parameter table on a page.
+
+    Keep one instance per scrape so the signature -> mapping cache and the
+    shape statistics cover the whole corpus.
+    """
+
+    def __init__(self):
+        self.mappings = {}  # signature -> column mapping (None = not a parameter table)
+        self.shapes = {}  # signature -> {'tables': n, 'example': source}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def classify(self, signature: Tuple[str, ...], source: str = '') -> Optional[Dict[str, int]]:
+        """Column mapping for a header signature, computed once per signature."""
+        shape = self.shapes.setdefault(signature, {'tables': 0, 'example': source})
+        shape['tables'] += 1
+        if signature in self.mappings:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            self.mappings[signature] = column_mapping(signature)
+        return self.mappings[signature]
+
+    def extract(self, soup: BeautifulSoup, source: str = '') -> List[Dict]:
+        """All parameter rows on the page, in document order, deduplicated by display name.
+
+        Each row is {'name', 'keyword', 'dataType', 'description', 'required'}.
+        """
+        rows_out = []
+        seen = set()
+
+        for table in soup.find_all('table'):
+            rows = _own_rows(table)
+            if len(rows) < 2:
+                continue
+
+            header_cells = rows[0].find_all(['th', 'td'], recursive=False)
+            signature = tuple(normalize_header(cell.get_text(strip=True)) for cell in header_cells)
+            mapping = self.classify(signature, source)
+            if not mapping:
+                continue
+
+            for row in rows[1:]:
+                cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'], recursive=False)]
+                parameter = self._row_to_parameter(cells, mapping)
+                if parameter and parameter['name'] not in seen:
+                    seen.add(parameter['name'])
+                    rows_out.append(parameter)
+
+        return rows_out
+
+    def _row_to_parameter(self, cells: List[str], mapping: Dict[str, int]) -> Optional[Dict]:
+        def cell(role: str) -> str:
+            index = mapping.get(role)
+            return cells[index] if index is not None and index < len(cells) else ''
+
+        name = cell('name') or cell('keyword')
+        if not name or name in INVALID_NAMES or len(name) >= 50:
+            return None
+
+        description = cell('description')
+        if 'required' in mapping:
+            required = cell('required').lower() in REQUIRED_VALUES
+        else:
+            # Check for "required" mentions in description
+            desc_lower = description.lower()
+            required = 'required' in desc_lower and 'not required' not in desc_lower
+
+        return {
+            'name': name,
+            'keyword': cell('keyword') or name,
+            'dataType': cell('dataType'),
+            'description': description,
+            'required': required
+        }
+
+    def shape_report(self) -> Dict:
+        """Every header signature seen, most common first, with unmapped shapes listed separately."""
+        shapes = []
+        for signature, info in sorted(self.shapes.items(), key=lambda item: -item[1]['tables']):
+            shapes.append({
+                'headers': list(signature),
+                'tables': info['tables'],
+                'example': info['example'],
+                'mapping': self.mappings.get(signature)
+            })
+        return {
+            'cacheHits': self.cache_hits,
+            'cacheMisses': self.cache_misses,
+            'recognized': [shape for shape in shapes if shape['mapping']],
+            'unrecognized': [shape for shape in shapes if not shape['mapping']]
+        }
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Prefix trie for Appian function name lookup.
+Compiles snippet names and prefixes into a trie that answers prefix,
+camel-hump and fuzzy (bounded edit distance) queries for completion tooling.
+"""
+
+import argparse
+import json
+import pickle
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_SNIPPETS_FILE = "appian-functions-complete.json"
+DEFAULT_TRIE_FILE = "appian-functions-trie.pkl"
+
+HUMP_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z0-9_]+')
+QUERY_SEGMENT_PATTERN = re.compile(r'[A-Z]?[^A-Z]+|[A-Z]')
+
+
+class PrefixTrie:
+    """Case-insensitive prefix trie mapping keys to lists of values."""
+
+    # Each node is a dict of child characters; the value list lives under this key
+    VALUES = ''
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def insert(self, key: str, value) -> None:
+        """Add a value under the given key."""
+        node = self.root
+        for char in key.lower():
+            node = node.setdefault(char, {})
+        values = node.setdefault(self.VALUES, [])
+        if value not in values:
+            values.append(value)
+            self.size += 1
+
+    def _find_node(self, prefix: str) -> Optional[Dict]:
+        """Walk to the node for a prefix, or None if no key starts with it."""
+        node = self.root
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def get(self, key: str) -> List:
+        """Return the values stored under an exact key."""
+        node = self._find_node(key)
+        if node is None:
+            return []
+        return list(node.get(self.VALUES, []))
+
+    def search_prefix(self, prefix: str, limit: Optional[int] = None) -> List:
+        """Return values whose key starts with prefix, shortest keys first."""
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+
+        results = []
+        seen = set()
+        # Breadth-first so exact and short matches come before long ones
+        level = [node]
+        while level:
+            next_level = []
+            for current in level:
+                for value in current.get(self.VALUES, []):
+                    if value not in seen:
+                        seen.add(value)
+                        results.append(value)
+                        if limit and len(results) >= limit:
+                            return results
+                for char, child in sorted(current.items()):
+                    if char != self.VALUES:
+                        next_level.append(child)
+            level = next_level
+
+        return results
+
+    def search_fuzzy(self, query: str, max_distance: int = 1,
+                     limit: Optional[int] = None) -> List[Tuple[object, int]]:
+        """Return (value, distance) pairs for keys within max_distance edits of query.
+
+        Walks the trie once, carrying a Levenshtein DP row per node and pruning
+        any branch whose best achievable distance already exceeds the bound.
+        """
+        query = query.lower()
+        best = {}
+        first_row = list(range(len(query) + 1))
+
+        stack = [(child, char, first_row) for char, child in self.root.items() if char != self.VALUES]
+        while stack:
+            node, char, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, len(query) + 1):
+                row.append(min(row[column - 1] + 1,
+                               previous_row[column] + 1,
+                               previous_row[column - 1] + (query[column - 1] != char)))
+
+            distance = row[-1]
+            if distance <= max_distance:
+                for value in node.get(self.VALUES, []):
+                    if value not in best or distance < best[value]:
+                        best[value] = distance
+
+            if min(row) <= max_distance:
+                for next_char, child in node.items():
+                    if next_char != self.VALUES:
+                        stack.append((child, next_char, row))
+
+        results = sorted(best.items(), key=lambda item: (item[1], str(item[0])))
+        return results[:limit] if limit else results
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def bare_name(name: str) -> str:
+    """Strip the a!/fn! domain and trailing () from a function name."""
+    if name.endswith('()'):
+        name = name[:-2]
+    for domain in ('a!', 'fn!'):
+        if name.startswith(domain):
+            return name[len(domain):]
+    return name
+
+
+def single_deletes(word: str) -> List[str]:
+    """The word plus every variant with one character removed."""
+    return [word] + [word[:i] + word[i + 1:] for i in range(len(word))]
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """Check whether two strings differ by at most one insert, delete or substitution."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+def camel_humps(name: str) -> List[str]:
+    """Split a function name into lowercase camel-case humps (forEach -> for, each)."""
+    return [hump.lower() for hump in HUMP_PATTERN.findall(bare_name(name))]
+
+
+class CompletionTrie:
+    """Compiled lookup structure over function names and snippet prefixes."""
+
+    def __init__(self):
+        self.names = PrefixTrie()
+        self.humps = PrefixTrie()
+        self.hump_map = {}
+        self.sources = {}
+        # Single-deletion neighbourhoods of every key, for constant-time distance-1 lookups
+        self.deletes = {}
+
+    def add(self, name: str, prefixes: Optional[List[str]] = None, source: str = '') -> None:
+        """Register a function under its name, bare name and any extra prefixes."""
+        name = name[:-2] if name.endswith('()') else name
+        keys = {name, bare_name(name)}
+        for prefix in prefixes or []:
+            keys.add(prefix[:-2] if prefix.endswith('()') else prefix)
+        for key in keys:
+            self.names.insert(key, name)
+            key = key.lower()
+            for variant in single_deletes(key):
+                matches = self.deletes.setdefault(variant, [])
+                if key not in matches:
+                    matches.append(key)
+
+        if name not in self.hump_map:
+            humps = camel_humps(name)
+            self.hump_map[name] = humps
+            self.humps.insert(''.join(hump[0] for hump in humps), name)
+
+        if source:
+            sources = self.sources.setdefault(name, [])
+            if source not in sources:
+                sources.append(source)
+
+    def prefix(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Names whose name or snippet prefix starts with query."""
+        return self.names.search_prefix(query, limit=limit)
+
+    def camel(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Names matching a camel-hump query such as 'qRT', 'queRecTy' or 'fe'."""
+        query = bare_name(query)
+        if not query:
+            return []
+        if any(char.isupper() for char in query[1:]):
+            segments = [segment.lower() for segment in QUERY_SEGMENT_PATTERN.findall(query)]
+        else:
+            # All-lowercase queries are read as hump initials
+            segments = list(query.lower())
+
+        initials = ''.join(segment[0] for segment in segments)
+        results = []
+        for name in self.humps.search_prefix(initials):
+            humps = self.hump_map[name]
+            if all(humps[i].startswith(segment) for i, segment in enumerate(segments)):
+                results.append(name)
+                if limit and len(results) >= limit:
+                    break
+        return results
+
+    def fuzzy(self, query: str, max_distance: int = 1,
+              limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(name, distance) pairs for names within max_distance edits of query."""
+        if max_distance != 1:
+            return self.names.search_fuzzy(query, max_distance=max_distance, limit=limit)
+
+        # Keys within one edit share a single-deletion variant with the query
+        query = query.lower()
+        best = {}
+        for variant in single_deletes(query):
+            for key in self.deletes.get(variant, []):
+                if within_one_edit(query, key):
+                    distance = 0 if key == query else 1
+                    for name in self.names.get(key):
+                        if name not in best or distance < best[name]:
+                            best[name] = distance
+
+        results = sorted(best.items(), key=lambda item: (item[1], item[0]))
+        return results[:limit] if limit else results
+
+    def lookup(self, query: str, limit: int = 20, max_distance: int = 1) -> List[str]:
+        """Combined lookup: prefix matches, then camel-hump, then fuzzy matches."""
+        results = self.prefix(query, limit=limit)
+        for name in self.camel(query, limit=limit):
+            if len(results) >= limit:
+                return results
+            if name not in results:
+                results.append(name)
+        if not results:
+            results = [name for name, _ in self.fuzzy(query, max_distance, limit=limit)]
+        return results
+
+    def __len__(self) -> int:
+        return len(self.hump_map)
+
+    def to_state(self) -> Dict:
+        """Plain-data form for pickling (independent of the module the class was loaded from)."""
+        return {
+            'names': (self.names.root, self.names.size),
+            'humps': (self.humps.root, self.humps.size),
+            'humpMap': self.hump_map,
+            'sources': self.sources,
+            'deletes': self.deletes
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'CompletionTrie':
+        trie = cls()
+        trie.names.root, trie.names.size = state['names']
+        trie.humps.root, trie.humps.size = state['humps']
+        trie.hump_map = state['humpMap']
+        trie.sources = state['sources']
+        trie.deletes = state['deletes']
+        return trie
+
+
+def build_trie(snippet_files: List[str]) -> CompletionTrie:
+    """Compile the names and prefixes from one or more snippets files (e.g. several versions)."""
+    trie = CompletionTrie()
+    for snippet_file in snippet_files:
+        with open(snippet_file, 'r', encoding='utf-8') as f:
+            snippets = json.load(f)
+        for snippet in snippets.values():
+            prefixes = snippet.get('prefix') or []
+            if prefixes:
+                trie.add(prefixes[0], prefixes[1:], source=snippet_file)
+    return trie
+
+
+def save_trie(trie: CompletionTrie, trie_file: str = DEFAULT_TRIE_FILE) -> None:
+    with open(trie_file, 'wb') as f:
+        pickle.dump(trie.to_state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_trie(trie_file: str = DEFAULT_TRIE_FILE) -> CompletionTrie:
+    with open(trie_file, 'rb') as f:
+        return CompletionTrie.from_state(pickle.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compile snippet names into a lookup trie and query it',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Compile the default snippets file
+  python3 appian_trie.py
+
+  # Compile several versions into one trie
+  python3 appian_trie.py --snippets appian-25.4.json appian-26.0.json
+
+  # Query an existing trie
+  python3 appian_trie.py --query qRT --mode camel
+        """
+    )
+    parser.add_argument('--snippets', type=str, nargs='+', default=[DEFAULT_SNIPPETS_FILE],
+                        help=f'Snippets JSON file(s) to compile (default: {DEFAULT_SNIPPETS_FILE})')
+    parser.add_argument('--output', type=str, default=DEFAULT_TRIE_FILE,
+                        help=f'Trie file to write or query (default: {DEFAULT_TRIE_FILE})')
+    parser.add_argument('--query', type=str, help='Look up a name instead of compiling')
+    parser.add_argument('--mode', choices=['lookup', 'prefix', 'camel', 'fuzzy'], default='lookup',
+                        help='Query mode (default: lookup)')
+    parser.add_argument('--distance', type=int, default=1,
+                        help='Maximum edit distance for fuzzy queries (default: 1)')
+    args = parser.parse_args()
+
+    if args.query is None:
+        trie = build_trie(args.snippets)
+        save_trie(trie, args.output)
+        print(f"Compiled {len(trie)} functions ({len(trie.names)} keys)")
+        print(f"Saved to: {args.output}")
+        return
+
+    trie = load_trie(args.output)
+    start = time.perf_counter()
+    if args.mode == 'prefix':
+        results = trie.prefix(args.query, limit=20)
+    elif args.mode == 'camel':
+        results = trie.camel(args.query, limit=20)
+    elif args.mode == 'fuzzy':
+        results = [f"{name} ({distance})" for name, distance in trie.fuzzy(args.query, args.distance, limit=20)]
+    else:
+        results = trie.lookup(args.query, max_distance=args.distance)
+    elapsed_us = (time.perf_counter() - start) * 1_000_000
+
+    for result in results:
+        print(f"  - {result}")
+    print(f"{len(results)} results in {elapsed_us:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Normalized data types and type-driven reverse indexes.
+Return types and parameter data types are stored as the text copied from the
+docs tables ("Any Type Array", "Number (Integer)", "List of Text String",
+"Text or Integer Array"). parse_type() reads that text once into interned
+TypeRef values (base type + array flag) ordered by a small lattice: Any Type
+accepts everything, Integer and Decimal are Numbers. TypeIndex precomputes
+"functions returning T" and "functions accepting T" so type-aware tools answer
+them with dictionary lookups instead of re-parsing strings.
+"""
+
+import functools
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ANY_TYPE = 'Any Type'
+
+# Canonical names of the types the docs use, matched ignoring case and spaces
+KNOWN_TYPES = (
+    ANY_TYPE, 'Text', 'Integer', 'Decimal', 'Number', 'Boolean', 'Date', 'Time', 'Date and Time',
+    'User', 'Group', 'Group Type', 'Document', 'Folder', 'Dictionary', 'Map', 'Save',
+    'Record Type', 'Record Field', 'Record Link', 'Record Type Relationship', 'Process Model',
+    'Data Store Entity', 'Safe URI', 'Knowledge Center', 'Document Management Community', 'Image', 'Link',
+    'Query', 'Type', 'Measure', 'Grouping', 'Selection', 'Aggregation', 'Rich Text Item', 'Validation Message',
+    'Styled Text', 'Task', 'Connected System', 'People', 'Portal Page', 'Site Page', 'Deployment',
+    'Encrypted Text', 'Decrypted Text', 'Function', 'Rule', 'Function Reference',
+)
+# Other spellings (lowercase, spaces removed) -> canonical name
+TYPE_ALIASES = {
+    'any': ANY_TYPE, 'anytypes': ANY_TYPE, 'variant': ANY_TYPE,
+    'textstring': 'Text', 'string': 'Text',
+    'numberinteger': 'Integer', 'numberdecimal': 'Decimal',
+    'datetime': 'Date and Time', 'username': 'User', 'wsconfig': 'WsConfig',
+}
+# Type -> the type it is a special case of (Any Type sits above everything)
+SUPERTYPES = {
+    'Integer': 'Number',
+    'Decimal': 'Number',
+}
+
+CAMEL_CASE_TYPE = re.compile(r'^[A-Z][a-z0-9]+(?:[A-Z][A-Za-z0-9]*)+$')  # SortInfo, BarChartConfig
+CONSTRUCTOR_TYPE = re.compile(r'^a![A-Za-z]\w*\(\)$')  # a!gridColumn()
+LIST_OF = re.compile(r'^(?:list|array) of\s+(.+)$', re.IGNORECASE)
+ARRAY_SUFFIX = re.compile(r'^(.+?)\s*\barray$', re.IGNORECASE)
+ALTERNATIVES = re.compile(r'\s*(?:,\s*(?:or|and)\s+|,|/|\s+or\s+|\s+and\s+)\s*')
+GLUED_WORD = re.compile(r'\b(of|or|and)(?=[A-Z]|a!)')  # "List ofa!gridColumn()", "Text orValidation Message"
+GLUED_OR = re.compile(r'(?<=[a-z])or(?=[A-Z])')  # "PagingInfoorGridSelection"
+GLUED_ARRAY = re.compile(r'(?<=[a-z])Array\b')  # "Validation MessageArray"
+MAX_TYPE_TEXT = 100  # Longer cells are descriptions that landed in the type column
+
+
+def _squash(text: str) -> str:
+    return re.sub(r'[\s_()]+', '', text).lower()
+
+
+_CANONICAL = {_squash(name): name for name in KNOWN_TYPES}
+_CANONICAL.update(TYPE_ALIASES)
+
+
+class TypeRef:
+    """An interned type: base type name plus whether it is an array (use type_ref() to get one)."""
+    __slots__ = ('base', 'array', 'key')
+
+    def __init__(self, base: str, array: bool):
+        self.base = base
+        self.array = array
+        self.key = f"{base} Array" if array else base
+
+    @property
+    def any(self) -> bool:
+        return self.base == ANY_TYPE
+
+    def is_a(self, other: 'TypeRef') -> bool:
+        """True when a value of this type can be passed where other is expected."""
+        if other.any:
+            return self.array or not other.array
+        return self.array == other.array and other.base in ancestors(self.base)
+
+    def __reduce__(self):
+        # Unpickled values are interned again, so identity comparisons keep working
+        return type_ref, (self.base, self.array)
+
+    def __repr__(self):
+        return f"TypeRef({self.key!r})"
+
+    def __str__(self):
+        return self.key
+
+
+_interned: Dict[Tuple[str, bool], TypeRef] = {}
+
+
+def type_ref(base: str, array: bool = False) -> TypeRef:
+    """The single TypeRef for a base type and array flag."""
+    ref = _interned.get((base, array))
+    if ref is None:
+        ref = _interned.setdefault((base, array), TypeRef(base, array))
+    return ref
+
+
+@functools.lru_cache(maxsize=None)
+def ancestors(base: str) -> Tuple[str, ...]:
+    """The base type and every type above it, nearest first (Any Type excluded)."""
+    chain = [base]
+    while chain[-1] in SUPERTYPES:
+        chain.append(SUPERTYPES[chain[-1]])
+    return tuple(chain)
+
+
+@functools.lru_cache(maxsize=None)
+def descendants(base: str) -> Tuple[str, ...]:
+    """The base type and every type below it in SUPERTYPES."""
+    return (base,) + tuple(name for name in SUPERTYPES if name != base and base in ancestors(name))
+
+
+def _base_name(text: str) -> Optional[str]:
+    """Canonical base type name for one alternative, or None if it is not recognizably a type."""
+    canonical = _CANONICAL.get(_squash(text))
+    if canonical:
+        return canonical
+    if CAMEL_CASE_TYPE.match(text) or CONSTRUCTOR_TYPE.match(text):
+        return text
+    return None
+
+
+def _parse_alternative(text: str) -> Optional[TypeRef]:
+    text = text.strip(' *')
+    match = LIST_OF.match(text)
+    if match:
+        inner = match.group(1).strip()
+        # "Array of Links", "List of Saves"
+        base = _base_name(inner) or (inner.endswith('s') and _base_name(inner[:-1])) or None
+        return type_ref(base, True) if base else None
+    match = ARRAY_SUFFIX.match(text)
+    if match:
+        base = _base_name(match.group(1))
+        return type_ref(base, True) if base else None
+    base = _base_name(text)
+    return type_ref(base) if base else None
+
+
+@functools.lru_cache(maxsize=None)
+def parse_type(text: str) -> Tuple[TypeRef, ...]:
+    """Type cell text -> the types it allows, in order ('' or prose -> ())."""
+    text = (text or '').strip()
+    if not text or len(text) > MAX_TYPE_TEXT or text.endswith('.'):
+        return ()
+    while text.startswith('(') and text.endswith(')'):
+        text = text[1:-1].strip()
+    if text.count(')') > text.count('('):
+        text = text.rstrip(')')
+    text = GLUED_WORD.sub(r'\1 ', text)
+    text = GLUED_OR.sub(' or ', text)
+    text = GLUED_ARRAY.sub(' Array', text)
+    # "Date and Time" is one type, not two alternatives
+    text = re.sub(r'date\s+and\s+time', 'DateAndTime', text, flags=re.IGNORECASE)
+
+    alternatives = ALTERNATIVES.split(text)
+    match = LIST_OF.match(text)
+    if match and len(alternatives) > 1:
+        # "List of User or Group": every alternative is a list
+        alternatives = [part if LIST_OF.match(part) else f"List of {part}"
+                        for part in ALTERNATIVES.split(match.group(1))]
+
+    types = []
+    for alternative in alternatives:
+        ref = _parse_alternative(alternative) if alternative else None
+        if ref is not None and ref not in types:
+            types.append(ref)
+    return tuple(types)
+
+
+class TypeIndex:
+    """Reverse indexes from normalized types to the functions that return or accept them."""
+
+    def __init__(self):
+        self.returns: Dict[str, List[str]] = {}  # type key -> functions returning it
+        self.accepts: Dict[str, Dict[str, List[str]]] = {}  # type key -> function -> parameter keywords
+        self.signatures: Dict[str, Dict] = {}  # function -> {'returns': [keys], 'parameters': {keyword: [keys]}}
+        self.unrecognized: Dict[str, int] = {}  # non-empty type text no type was read from -> occurrences
+
+    @classmethod
+    def from_docs(cls, docs: Dict) -> 'TypeIndex':
+        index = cls()
+        for name, info in docs.get('functions', {}).items():
+            index.add_function(name, info)
+        return index
+
+    def _parse(self, text: str) -> Tuple[TypeRef, ...]:
+        types = parse_type(text)
+        if text and not types:
+            self.unrecognized[text] = self.unrecognized.get(text, 0) + 1
+        return types
+
+    def add_function(self, name: str, info: Dict) -> None:
+        """Index one docs record's return type and parameter data types."""
+        returns = self._parse(info.get('returnType', ''))
+        for ref in returns:
+            self.returns.setdefault(ref.key, []).append(name)
+
+        parameters = {}
+        for display_name, param in (info.get('parameters') or {}).items():
+            keyword = param.get('type') or display_name
+            types = self._parse(param.get('dataType', ''))
+            if not types:
+                continue
+            parameters[keyword] = [ref.key for ref in types]
+            for ref in types:
+                keywords = self.accepts.setdefault(ref.key, {}).setdefault(name, [])
+                if keyword not in keywords:
+                    keywords.append(keyword)
+        self.signatures[name] = {'returns': [ref.key for ref in returns], 'parameters': parameters}
+
+    def returning(self, type_text: str) -> List[str]:
+        """Functions whose result can be used where type_text is expected (e.g. 'Number' includes Integer)."""
+        return self.returning_types(parse_type(type_text))
+
+    def returning_types(self, expected_types: Iterable[TypeRef]) -> List[str]:
+        found = []
+        for expected in expected_types:
+            if expected.any:
+                keys = [key for key in self.returns if not expected.array or key.endswith(' Array')]
+            else:
+                keys = [type_ref(base, expected.array).key for base in descendants(expected.base)]
+            for key in keys:
+                found.extend(name for name in self.returns.get(key, ()) if name not in found)
+        return found
+
+    def accepting(self, type_text: str, include_any: bool = False) -> Dict[str, List[str]]:
+        """Functions with a parameter that takes a value of type_text -> those parameters' keywords.
+
+        Parameters typed Any Type accept everything; they are only included with include_any.
+        """
+        return self.accepting_types(parse_type(type_text), include_any)
+
+    def accepting_types(self, given_types: Iterable[TypeRef], include_any: bool = False) -> Dict[str, List[str]]:
+        found: Dict[str, List[str]] = {}
+        for given in given_types:
+            keys = [type_ref(base, given.array).key for base in ancestors(given.base)]
+            if include_any and not given.any:
+                keys.append(type_ref(ANY_TYPE, given.array).key)
+                if given.array:
+                    keys.append(type_ref(ANY_TYPE).key)
+            for key in keys:
+                for name, keywords in self.accepts.get(key, {}).items():
+                    merged = found.setdefault(name, [])
+                    merged.extend(keyword for keyword in keywords if keyword not in merged)
+        return found
+
+    def parameter_types(self, function: str, keyword: str) -> List[TypeRef]:
+        """Normalized types of one parameter ([] when unknown)."""
+        keys = self.signatures.get(function, {}).get('parameters', {}).get(keyword, [])
+        return [type_ref(key[:-len(' Array')], True) if key.endswith(' Array') else type_ref(key) for key in keys]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'returnTypes': len(self.returns),
+            'parameterTypes': len(self.accepts),
+            'typedFunctions': sum(bool(sig['returns'] or sig['parameters']) for sig in self.signatures.values()),
+            'unrecognized': sum(self.unrecognized.values())
+        }
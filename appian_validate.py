@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Offline quality report for the generated outputs.
+Reads the snippets, docs and syntax files once, lays the fields out as
+columns, runs every check over whole columns and scores each function
+(100 minus the penalties of the checks it fails). The ranked report shows the
+worst functions first; --min-score / --fail-on turn it into a release gate.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+from appian_output import write_json
+
+# Check id -> (penalty, description)
+CHECKS = {
+    'missing_docs': (40, 'No record in the docs file'),
+    'missing_snippet': (40, 'No entry in the snippets file'),
+    'missing_syntax': (20, 'No entry in the syntax map'),
+    'fetch_error': (50, 'Page could not be fetched when the outputs were built'),
+    'empty_description': (30, 'Empty description'),
+    'truncated_description': (10, 'Description cut off with "..."'),
+    'placeholder_description': (10, 'Snippet description only repeats the function name and the docs have none'),
+    'no_parameters': (15, 'No parameters extracted (the snippet body is a placeholder)'),
+    'suspicious_signature': (40, 'Snippet body does not start with the function name (e.g. 1now())'),
+    'malformed_body': (20, 'Braces outside snippet tabstops'),
+}
+DEFAULT_REPORT = 'appian-quality-report.json'
+SNIPPET_PREFIX = 'Appian '
+TABSTOP = re.compile(r'\$\{\d+:[^}]+\}')
+
+
+def load_output(path: Optional[str]) -> Dict:
+    """A JSON output file, or {} when it does not exist."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_columns(snippets: Dict, docs: Dict, syntax: Dict) -> Dict[str, List]:
+    """One row per function across the three outputs, stored column by column."""
+    records = docs.get('functions', {})
+    syntax_map = syntax.get('functions', {})
+    snippet_map = {key[len(SNIPPET_PREFIX):-2]: snippet for key, snippet in snippets.items()
+                   if key.startswith(SNIPPET_PREFIX) and key.endswith('()')}
+
+    names = list(records)
+    names += [name for name in snippet_map if name not in records]
+    names += [name for name in syntax_map if name not in records and name not in snippet_map]
+
+    empty = {}
+    docs_rows = [records.get(name) for name in names]
+    snippet_rows = [snippet_map.get(name) for name in names]
+    bodies = [(snippet or empty).get('body') or [] for snippet in snippet_rows]
+    return {
+        'name': names,
+        'hasDocs': [row is not None for row in docs_rows],
+        'hasSnippet': [row is not None for row in snippet_rows],
+        'hasSyntax': [name in syntax_map for name in names],
+        'description': [(row or empty).get('description', '') for row in docs_rows],
+        'parameters': [len((row or empty).get('parameters') or {}) for row in docs_rows],
+        'deprecated': [bool((row or empty).get('deprecated')) for row in docs_rows],
+        'evidence': [syntax_map.get(name, empty).get('evidence', '') for name in names],
+        'bodyHead': [body[0] if body else '' for body in bodies],
+        'bodyText': [' '.join(body) for body in bodies],
+        'snippetDescription': [(snippet or empty).get('description', '') for snippet in snippet_rows],
+    }
+
+
+def run_checks(columns: Dict[str, List]) -> Dict[str, List[bool]]:
+    """Check id -> one flag per function (True = the function fails the check)."""
+    names = columns['name']
+    has_docs = columns['hasDocs']
+    has_snippet = columns['hasSnippet']
+    return {
+        'missing_docs': [not present for present in has_docs],
+        'missing_snippet': [not present for present in has_snippet],
+        'missing_syntax': [not present for present in columns['hasSyntax']],
+        'fetch_error': [evidence == 'fetch_error' for evidence in columns['evidence']],
+        'empty_description': [present and not text.strip() for present, text in zip(has_docs, columns['description'])],
+        'truncated_description': [text.rstrip().endswith(('...', '…')) or snippet.rstrip().endswith(('...', '…'))
+                                  for text, snippet in zip(columns['description'], columns['snippetDescription'])],
+        # The snippets file always repeats the name; only a function with no docs description to show instead counts
+        'placeholder_description': [present and not text.strip()
+                                    and snippet in (f"{name}(): {name}()", f"{name}(): {name}() [Deprecated]")
+                                    for present, name, snippet, text in
+                                    zip(has_snippet, names, columns['snippetDescription'], columns['description'])],
+        'no_parameters': [present and count == 0 for present, count in zip(has_docs, columns['parameters'])],
+        'suspicious_signature': [present and not head.startswith(f"{name}(")
+                                 for present, name, head in zip(has_snippet, names, columns['bodyHead'])],
+        'malformed_body': [('{' in cleaned and '}' in cleaned)
+                           for cleaned in (TABSTOP.sub('', text) for text in columns['bodyText'])],
+    }
+
+
+def score_functions(columns: Dict[str, List], flags: Dict[str, List[bool]]) -> List[Dict]:
+    """Per-function score and failed checks, worst first (ties by name)."""
+    scores = [100] * len(columns['name'])
+    for check, column in flags.items():
+        penalty = CHECKS[check][0]
+        scores = [score - penalty if flagged else score for score, flagged in zip(scores, column)]
+
+    rows = []
+    for index, name in enumerate(columns['name']):
+        rows.append({
+            'name': name,
+            'score': max(scores[index], 0),
+            'issues': [check for check in CHECKS if flags[check][index]],
+            'deprecated': columns['deprecated'][index]
+        })
+    rows.sort(key=lambda row: (row['score'], row['name']))
+    return rows
+
+
+def validate(snippets_file: str, docs_file: str, syntax_file: str) -> Dict:
+    """Quality report for one set of outputs (no network)."""
+    start = time.perf_counter()
+    columns = build_columns(load_output(snippets_file), load_output(docs_file), load_output(syntax_file))
+    flags = run_checks(columns)
+    ranked = score_functions(columns, flags)
+    elapsed = time.perf_counter() - start
+
+    total = len(ranked)
+    return {
+        'files': {'snippets': snippets_file, 'docs': docs_file, 'syntax': syntax_file},
+        'functions': total,
+        'meanScore': round(sum(row['score'] for row in ranked) / total, 1) if total else 0.0,
+        'perfect': sum(row['score'] == 100 for row in ranked),
+        'checks': {check: {'failing': sum(flags[check]), 'penalty': penalty, 'description': description}
+                   for check, (penalty, description) in CHECKS.items()},
+        'seconds': round(elapsed, 3),
+        'ranked': ranked
+    }
+
+
+def gate_failures(report: Dict, min_score: Optional[int] = None, fail_on: Optional[List[str]] = None) -> List[str]:
+    """Reasons the outputs fail the release gate (empty when they pass)."""
+    failures = []
+    if min_score is not None:
+        below = [row['name'] for row in report['ranked'] if row['score'] < min_score]
+        if below:
+            failures.append(f"{len(below)} functions score below {min_score} (e.g. {', '.join(below[:5])})")
+    for check in fail_on or []:
+        failing = report['checks'][check]['failing']
+        if failing:
+            failures.append(f"{failing} functions fail {check}")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Score the generated outputs and rank the weakest functions (offline)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Ranked report for the outputs in this directory
+  python3 appian_validate.py
+
+  # Release gate: fail if any function scores below 50 or a page failed to fetch
+  python3 appian_validate.py --min-score 50 --fail-on fetch_error,suspicious_signature
+        """
+    )
+    parser.add_argument('--snippets', type=str, default='appian-functions-complete.json', help='Snippets file')
+    parser.add_argument('--docs', type=str, default='appian-functions-docs.json', help='Docs file')
+    parser.add_argument('--syntax', type=str, default='appian-function-syntax.json', help='Syntax map file')
+    parser.add_argument('--output', type=str, default=DEFAULT_REPORT,
+                        help=f'Report JSON file (default: {DEFAULT_REPORT})')
+    parser.add_argument('--top', type=int, default=20, help='Lowest-scoring functions to print (default: 20)')
+    parser.add_argument('--min-score', type=int, help='Fail when any function scores below this')
+    parser.add_argument('--fail-on', type=str, default='',
+                        help=f"Comma-separated checks that must not fail ({', '.join(CHECKS)})")
+    args = parser.parse_args(argv)
+
+    fail_on = [check.strip() for check in args.fail_on.split(',') if check.strip()]
+    unknown = [check for check in fail_on if check not in CHECKS]
+    if unknown:
+        parser.error(f"unknown checks: {', '.join(unknown)}")
+
+    report = validate(args.snippets, args.docs, args.syntax)
+    write_json(args.output, report)
+
+    print(f"{report['functions']} functions, mean score {report['meanScore']}, "
+          f"{report['perfect']} with no issues ({report['seconds'] * 1000:.0f} ms)\n")
+    for check, info in report['checks'].items():
+        if info['failing']:
+            print(f"  {info['failing']:5d}  {check:24s} {info['description']}")
+    print("\nLowest scores:")
+    for row in report['ranked'][:args.top]:
+        if row['score'] == 100:
+            break
+        print(f"  {row['score']:3d}  {row['name']:40s} {', '.join(row['issues'])}")
+    print(f"\nSaved to: {args.output}")
+
+    failures = gate_failures(report, args.min_score, fail_on)
+    for failure in failures:
+        print(f"✗ {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,85 +4,69 @@ Appian Documentation Scraper
 Extracts all Appian functions from the official documentation and generates VS Code snippets.
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
-import re
+from __future__ import annotations
+
 import argparse
-from typing import Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from appian_archive import DEFAULT_ARCHIVE_DIR, PageArchive
+from appian_matchers import matchers_for
+from appian_discovery import discover_functions
+from appian_output import write_json
+from appian_pipeline import (DEFAULT_BASE_URL, OUTPUT_FILES, USER_AGENT, Emitter, LazySession, Page, ScrapePipeline,
+                             fetch_content, fetch_page)
+from appian_scheduler import DEFAULT_STATS_FILE
+from appian_sections import SectionMap
+from appian_tables import ParameterTableExtractor
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 
 class AppianDocScraper:
-    def __init__(self, base_url: str = "https://docs.appian.com/suite/help/25.4/Appian_Functions.html"):
+    def __init__(self, base_url: str = DEFAULT_BASE_URL,
+                 archive: Optional[PageArchive] = None):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.archive = archive  # Raw page store; in replay mode pages come from here instead of the network
+        self.tables = ParameterTableExtractor()  # Shared so table shapes are classified once per scrape
+        self.matchers = matchers_for(base_url)  # Heuristic patterns compiled for this docs version
+        self.session = LazySession({'User-Agent': USER_AGENT})  # requests is imported on the first fetch
+        self.log_fetches = True  # "Fetching:" line per URL; turned off under a progress bar
         self.functions = {}
 
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch and parse a web page."""
-        try:
-            print(f"Fetching: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except Exception as e:
-            print(f"Error fetching {url}: {e}")
-            return None
+        return fetch_page(self.session, url, self.archive, self.log_fetches)
+
+    def fetch_raw(self, url: str) -> Optional[bytes]:
+        """Fetch a URL's raw bytes (discovery sources such as a TOC or sitemap)."""
+        return fetch_content(self.session, url, self.archive, self.log_fetches)
 
     def extract_function_info(self, soup: BeautifulSoup) -> Dict:
         """Extract function information from the main functions page."""
-        functions = {}
-
-        # Look for all links that could be functions
-        all_links = soup.find_all('a', href=True)
-
-        for link in all_links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
-
-            # Filter for Appian functions
-            if (text.startswith('a!') or
-                'fnc_' in href or
-                    (text.endswith('()') and len(text) > 3)):
-
-                # Clean up function name
-                function_name = text.replace(' [Deprecated]', '').strip()
-                if not function_name.endswith('()'):
-                    function_name += '()'
-
-                full_url = urljoin(self.base_url, href)
-                functions[function_name] = {
-                    'name': function_name,
-                    'url': full_url,
-                    'description': self._get_function_description(link),
-                    'deprecated': '[Deprecated]' in text
-                }
-
-        return functions
-
-    def _get_function_description(self, link_element) -> str:
-        """Extract description text near the function link."""
-        # Look for description in nearby elements
-        parent = link_element.parent
-        if parent:
-            desc = parent.get_text(strip=True)
-            return desc[:200] + "..." if len(desc) > 200 else desc
-        return ""
+        return {key: self._snippet_info(key, info) for key, info in discover_functions(soup, self.base_url).items()}
+
+    def _snippet_info(self, key: str, info: Dict) -> Dict:
+        """Discovered function -> the record this scraper builds snippets from."""
+        return {
+            'name': key,
+            'url': info['url'],
+            'description': info['summary'],
+            'deprecated': info['deprecated']
+        }
 
-    def scrape_function_details(self, function_info: Dict) -> Dict:
+    def scrape_function_details(self, function_info: Dict, soup: Optional[BeautifulSoup] = None,
+                                sections: Optional[SectionMap] = None) -> Dict:
         """Scrape detailed information for a specific function."""
-        soup = self.fetch_page(function_info['url'])
+        if soup is None:
+            soup = self.fetch_page(function_info['url'])
         if not soup:
             return function_info
 
         # Extract function signature
         signature = self._extract_signature(soup)
-        parameters = self._extract_parameters(soup)
-        examples = self._extract_examples(soup)
+        parameters = self._extract_parameters(soup, function_info['url'])
+        examples = self._extract_examples(soup, sections)
 
         function_info.update({
             'signature': signature,
@@ -123,66 +107,46 @@ class AppianDocScraper:
 
         return ""
 
-    def _extract_parameters(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_parameters(self, soup: BeautifulSoup, source: str = '') -> List[Dict]:
         """Extract parameter information."""
-        parameters = []
-
         # Look for main content area to avoid footer elements
         main_content = soup.find('main') or soup.find(
             'div', class_='content') or soup
 
-        # Look for parameter tables in main content
-        tables = main_content.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            if len(rows) < 2:
-                continue
-
-            # Check if this is a parameter table by looking at headers
-            header_row = rows[0]
-            header_cells = header_row.find_all(['th', 'td'])
-            header_text = ' '.join(
-                [cell.get_text(strip=True).lower() for cell in header_cells])
-
-            # Only process tables that look like parameter tables
-            if 'keyword' in header_text or ('type' in header_text and 'description' in header_text):
-                for row in rows[1:]:  # Skip header
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 3:  # Keyword, Type, Description
-                        param_name = cells[0].get_text(strip=True)
-                        param_type = cells[1].get_text(strip=True)
-                        param_desc = cells[2].get_text(strip=True)
-
-                        # Filter out invalid parameters
-                        if (param_name and
-                            param_name not in ['Keyword', 'Parameter', 'Name', 'Disclaimer', 'Privacy'] and
-                                len(param_name) < 50):  # Reasonable parameter name length
-                            parameters.append({
-                                'name': param_name,
-                                'type': param_type,
-                                # Limit description length
-                                'description': param_desc[:100]
-                            })
-                break  # Only process the first valid parameter table
-
-        return parameters
-
-    def _extract_examples(self, soup: BeautifulSoup) -> List[str]:
+        # Keyword and data type come from the mapped columns, whatever the table layout
+        return [{
+            'name': row['keyword'],
+            'type': row['dataType'],
+            # Limit description length
+            'description': row['description'][:100]
+        } for row in self.tables.extract(main_content, source)]
+
+    def _extract_examples(self, soup: BeautifulSoup, sections: Optional[SectionMap] = None) -> List[str]:
         """Extract code examples."""
         examples = []
-
-        # Look for example sections
-        example_sections = soup.find_all(
-            text=re.compile(r'example', re.IGNORECASE))
-        for section in example_sections:
-            parent = section.parent
-            if parent:
-                # Find code blocks near example text
-                code_blocks = parent.find_next_siblings(['pre', 'code'])
+        if sections is None:
+            main_content = soup.find('main') or soup.find('div', class_='content') or soup
+            sections = SectionMap(main_content, self.matchers)
+
+        # Code blocks under "Examples" headings (innermost blocks only, so gutters and wrappers are not doubled)
+        if sections.of_kind('examples'):
+            for section in sections.of_kind('examples'):
+                code_blocks = [block for block in section.find_all(['pre', 'code'])
+                               if block.find(['pre', 'code']) is None]
                 for block in code_blocks[:2]:  # Limit to first 2 examples
                     example_text = block.get_text(strip=True)
                     if example_text and 'a!' in example_text:
                         examples.append(example_text)
+            return examples
+
+        # No heading: look next to any text mentioning examples
+        for parent in sections.anchors('examples'):
+            # Find code blocks near example text
+            code_blocks = parent.find_next_siblings(['pre', 'code'])
+            for block in code_blocks[:2]:  # Limit to first 2 examples
+                example_text = block.get_text(strip=True)
+                if example_text and 'a!' in example_text:
+                    examples.append(example_text)
 
         return examples
 
@@ -267,33 +231,37 @@ class AppianDocScraper:
         lines.append(")")
         return lines
 
-    def run(self) -> Dict:
+    def run(self, limit: Optional[int] = None, workers: int = 1, stats_file: Optional[str] = None) -> Dict:
         """Main scraping process."""
-        print("Starting Appian documentation scraping...")
+        pipeline = ScrapePipeline(self.base_url, [SnippetEmitter(self)], fetch=self.fetch_page,
+                                  fetch_raw=self.fetch_raw, archive=self.archive, workers=workers,
+                                  stats_file=stats_file)
+        return pipeline.run(limit=limit).get('snippets', {})
 
-        # Fetch main page
-        soup = self.fetch_page(self.base_url)
-        if not soup:
-            print("Failed to fetch main page")
-            return {}
 
-        # Extract function list
-        print("Extracting function list...")
-        functions = self.extract_function_info(soup)
-        print(f"Found {len(functions)} functions")
+class SnippetEmitter(Emitter):
+    """Pipeline plugin that builds the VS Code snippets file."""
+
+    def __init__(self, scraper: AppianDocScraper):
+        self.scraper = scraper
+        self.snippets = {}
+        self.order = []
 
-        # Scrape details for each function (limit for testing)
-        snippets = {}
-        for i, (name, info) in enumerate(functions.items()):
-            if i >= 713:  # Process all functions
-                break
+    def start(self, base_url: str, functions: Dict[str, Dict]) -> None:
+        self.order = list(functions)
 
-            print(f"Processing {name}...")
-            detailed_info = self.scrape_function_details(info)
-            snippet = self.generate_snippet(detailed_info)
-            snippets[f"Appian {name}"] = snippet
+    def add_page(self, key: str, info: Dict, page: Optional[Page]) -> None:
+        function_info = self.scraper._snippet_info(key, info)
+        if page:
+            sections = page.memo('sections', lambda: SectionMap(page.main, self.scraper.matchers))
+            function_info = self.scraper.scrape_function_details(function_info, page.soup, sections)
+        self.snippets[f"Appian {key}"] = self.scraper.generate_snippet(function_info)
 
-        return snippets
+    def finish(self) -> Dict[str, Dict]:
+        # Listing order, whatever order the pages were scraped in
+        snippets = {f"Appian {key}": self.snippets[f"Appian {key}"] for key in self.order
+                    if f"Appian {key}" in self.snippets}
+        return {'snippets': snippets}
 
 
 def main():
@@ -310,35 +278,82 @@ Examples:
 
   # Custom output file
   python3 scrape_appian_docs.py --output appian-26.0-functions.json
+
+  # Keep the raw pages, then re-run extraction against them (no network)
+  python3 scrape_appian_docs.py --archive
+  python3 scrape_appian_docs.py --replay latest
+
+See also: appian-docs snippets --help (appian_cli.py) for rate limits and a progress bar.
         """
     )
 
     parser.add_argument(
         '--url',
         type=str,
-        default="https://docs.appian.com/suite/help/25.4/Appian_Functions.html",
+        default=DEFAULT_BASE_URL,
         help='URL to the Appian Functions documentation page (default: 25.4)'
     )
 
     parser.add_argument(
         '--output',
         type=str,
-        default="appian-functions-complete.json",
-        help='Output JSON file name (default: appian-functions-complete.json)'
+        default=OUTPUT_FILES['snippets'][0],
+        help=f"Output JSON file name (default: {OUTPUT_FILES['snippets'][0]})"
+    )
+
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=None,
+        help='Only process the first N functions'
+    )
+
+    parser.add_argument(
+        '--archive-dir',
+        type=str,
+        default=DEFAULT_ARCHIVE_DIR,
+        help=f'Raw page archive directory (default: {DEFAULT_ARCHIVE_DIR})'
+    )
+
+    parser.add_argument(
+        '--archive',
+        action='store_true',
+        help='Keep raw pages in --archive-dir for --replay runs (off by default; never pruned)'
+    )
+
+    parser.add_argument(
+        '--replay',
+        type=str,
+        metavar='RUN',
+        help="Read pages from an archived run (id or 'latest') instead of the network"
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Pages fetched in parallel (default: 4)'
     )
 
     args = parser.parse_args()
 
+    archive = None
+    if args.replay or args.archive:
+        archive = PageArchive(args.archive_dir)
+        if args.replay:
+            manifest = archive.start_replay(args.replay)
+            args.url = manifest['source'] or args.url
+            print(f"Replaying archived run {manifest['run']} ({len(manifest['pages'])} pages)")
+
     print(f"Scraping from: {args.url}")
     print(f"Output file: {args.output}\n")
 
-    scraper = AppianDocScraper(base_url=args.url)
-    snippets = scraper.run()
+    scraper = AppianDocScraper(base_url=args.url, archive=archive)
+    snippets = scraper.run(limit=args.limit, workers=args.workers, stats_file=DEFAULT_STATS_FILE)
 
     if snippets:
-        # Save to JSON file
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(snippets, f, indent=4, ensure_ascii=False)
+        # Save to JSON file (atomic, canonical key order)
+        write_json(args.output, snippets, indent=OUTPUT_FILES['snippets'][1])
 
         print(f"\nGenerated {len(snippets)} snippets")
         print(f"Saved to: {args.output}")
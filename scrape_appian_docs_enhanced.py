@@ -5,59 +5,59 @@ Extracts rich function documentation for AI-powered code generation.
 Generates a companion file with detailed descriptions, examples, and metadata.
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
-import re
-from typing import Dict, List, Optional
-from urllib.parse import urljoin
+from __future__ import annotations
+
+import argparse
+from datetime import date
+import hashlib
+import textwrap
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from appian_archive import DEFAULT_ARCHIVE_DIR, PageArchive
+from appian_expr import contains_call, domain_of, iter_calls, parse, uses_keyword_arguments
+from appian_matchers import matchers_for
+from appian_discovery import discover_functions
+from appian_output import write_json
+from appian_pipeline import (DEFAULT_BASE_URL, OUTPUT_FILES, USER_AGENT, Emitter, LazySession, Page, ScrapePipeline,
+                             fetch_content, fetch_page, write_outputs)
+from appian_records import compact_function, compact_syntax, expand
+from appian_scheduler import DEFAULT_STATS_FILE
+from appian_sections import SectionMap
+from appian_store import CorpusStore
+from appian_syntax import keyword_confidence
+from appian_tables import ParameterTableExtractor
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# Class names used for line-number gutters in highlighted code blocks
+GUTTER_CLASSES = ('gutter', 'lineno', 'line-numbers', 'rouge-gutter', 'gl')
+
 
 class EnhancedAppianDocScraper:
-    def __init__(self, base_url: str = "https://docs.appian.com/suite/help/25.4/Appian_Functions.html"):
+    def __init__(self, base_url: str = DEFAULT_BASE_URL,
+                 archive: Optional[PageArchive] = None, store: Optional[CorpusStore] = None):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.archive = archive  # Raw page store; in replay mode pages come from here instead of the network
+        self.store = store  # Optional SQLite output, written in batches as functions are processed
+        self.tables = ParameterTableExtractor()  # Shared so table shapes are classified once per scrape
+        self.matchers = matchers_for(base_url)  # Heuristic patterns compiled for this docs version
+        self.session = LazySession({'User-Agent': USER_AGENT})  # requests is imported on the first fetch
+        self.log_fetches = True  # "Fetching:" line per URL; turned off under a progress bar
         self.functions = {}
 
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch and parse a web page."""
-        try:
-            print(f"Fetching: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except Exception as e:
-            print(f"Error fetching {url}: {e}")
-            return None
+        return fetch_page(self.session, url, self.archive, self.log_fetches)
+
+    def fetch_raw(self, url: str) -> Optional[bytes]:
+        """Fetch a URL's raw bytes (discovery sources such as a TOC or sitemap)."""
+        return fetch_content(self.session, url, self.archive, self.log_fetches)
 
     def extract_function_list(self, soup: BeautifulSoup) -> Dict:
         """Extract function list from main page."""
-        functions = {}
-        all_links = soup.find_all('a', href=True)
-
-        for link in all_links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
-
-            # Filter for Appian functions
-            if (text.startswith('a!') or
-                'fnc_' in href or
-                (text.endswith('()') and len(text) > 3)):
-
-                function_name = text.replace(' [Deprecated]', '').strip()
-                if not function_name.endswith('()'):
-                    function_name += '()'
-
-                full_url = urljoin(self.base_url, href)
-                functions[function_name] = {
-                    'name': function_name.replace('()', ''),
-                    'url': full_url,
-                    'deprecated': '[Deprecated]' in text
-                }
-
-        return functions
+        return {key: {'name': info['name'], 'url': info['url'], 'deprecated': info['deprecated']}
+                for key, info in discover_functions(soup, self.base_url).items()}
 
     def scrape_function_details(self, function_info: Dict, soup: Optional[BeautifulSoup] = None) -> Dict:
         """Scrape detailed information for a specific function."""
@@ -76,15 +76,20 @@ class EnhancedAppianDocScraper:
         main_content = soup.find('main') or soup.find('div', class_='content') or soup
         return self._build_function_details(function_info, main_content)
 
-    def _build_function_details(self, function_info: Dict, main_content: BeautifulSoup) -> Dict:
+    def _build_function_details(self, function_info: Dict, main_content: BeautifulSoup,
+                                structured_examples: Optional[List[Dict]] = None,
+                                sections: Optional[SectionMap] = None) -> Dict:
         """Build the enriched function record from a parsed page."""
+        if sections is None:
+            sections = SectionMap(main_content, self.matchers)
+
         # Extract all the rich information we need
         description = self._extract_full_description(main_content)
-        return_info = self._extract_return_type(main_content)
-        parameters = self._extract_parameter_details(main_content)
-        examples = self._extract_examples(main_content)
-        use_case = self._extract_use_case(main_content, description)
-        related_functions = self._extract_related_functions(main_content)
+        return_info = self._extract_return_type(main_content, sections)
+        parameters = self._extract_parameter_details(main_content, function_info.get('url', ''))
+        examples = self._extract_examples(main_content, structured_examples)
+        use_case = self._extract_use_case(main_content, description, sections)
+        related_functions = self._extract_related_functions(main_content, sections)
         category = self._categorize_function(function_info['name'], description)
 
         return {
@@ -102,21 +107,13 @@ class EnhancedAppianDocScraper:
 
     def _extract_full_description(self, soup: BeautifulSoup) -> str:
         """Extract full function description (not truncated)."""
-        # Skip common navigation/share elements
-        skip_patterns = [
-            'share', 'linkedin', 'reddit', 'email', 'copy', 'print',
-            'privacy', 'disclaimer', '©', 'copyright',
-            'see also', 'related', 'feedback'
-        ]
-
         def is_valid_description(text: str) -> bool:
             """Check if text looks like a real description."""
-            text_lower = text.lower()
             # Must be substantial
             if len(text) < 30:
                 return False
-            # Must not contain skip patterns
-            if any(pattern in text_lower for pattern in skip_patterns):
+            # Must not contain navigation/share text
+            if self.matchers.is_skipped_description(text.lower()):
                 return False
             # Should contain actual words
             words = text.split()
@@ -146,26 +143,26 @@ class EnhancedAppianDocScraper:
 
         return ''
 
-    def _extract_return_type(self, soup: BeautifulSoup) -> Dict:
+    def _extract_return_type(self, soup: BeautifulSoup, sections: Optional[SectionMap] = None) -> Dict:
         """Extract return type and description."""
         result = {'type': '', 'description': ''}
 
         # Look for "Returns" section
-        returns_heading = soup.find(string=re.compile(r'returns?', re.IGNORECASE))
+        if sections is None:
+            sections = SectionMap(soup, self.matchers)
+        returns_heading = next(iter(sections.anchors('returns')), None)
         if returns_heading:
-            parent = returns_heading.parent
-            if parent:
-                # Get the text after the heading
-                next_elem = parent.find_next(['p', 'div', 'dd', 'td'])
-                if next_elem:
-                    text = next_elem.get_text(strip=True)
-                    # Try to extract type from patterns like "Returns: Text" or "Text -"
-                    type_match = re.match(r'^([\w\s]+?)(?:\s*-|\s*:)', text)
-                    if type_match:
-                        result['type'] = type_match.group(1).strip()
-                        result['description'] = text[len(type_match.group(0)):].strip()
-                    else:
-                        result['description'] = text
+            # Get the text after the heading
+            next_elem = returns_heading.find_next(['p', 'div', 'dd', 'td'])
+            if next_elem:
+                text = next_elem.get_text(strip=True)
+                # Try to extract type from patterns like "Returns: Text" or "Text -"
+                type_match = self.matchers.return_type_prefix.match(text)
+                if type_match:
+                    result['type'] = type_match.group(1).strip()
+                    result['description'] = text[len(type_match.group(0)):].strip()
+                else:
+                    result['description'] = text
 
         # Look in tables for return type
         if not result['type']:
@@ -186,112 +183,182 @@ class EnhancedAppianDocScraper:
 
         return result
 
-    def _extract_parameter_details(self, soup: BeautifulSoup) -> Dict:
-        """Extract detailed parameter information.
+    def _extract_parameter_details(self, soup: BeautifulSoup, source: str = '') -> Dict:
+        """Extract detailed parameter information from every parameter table on the page.
 
-        Handles two Appian documentation table formats:
-        - 4-column (UI components): Name | Keyword | Types | Description
-        - 3-column (system functions): Keyword | Type | Description
+        Columns are mapped from the table headers (e.g. Name | Keyword | Types | Description
+        for UI components, Keyword | Type | Description for system functions); see appian_tables.
         """
         parameters = {}
+        for row in self.tables.extract(soup, source):
+            parameters[row['name']] = {
+                'type': row['keyword'],
+                'dataType': row['dataType'],
+                'description': row['description'],
+                'required': row['required']
+            }
+        return parameters
 
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            if len(rows) < 2:
-                continue
+    def _extract_examples(self, soup: BeautifulSoup,
+                          structured_examples: Optional[List[Dict]] = None) -> List[str]:
+        """Extract up to 3 compact (single-line) code examples for the docs file."""
+        if structured_examples is None:
+            structured_examples = self._extract_structured_examples(soup)
 
-            header_row = rows[0]
-            header_cells = header_row.find_all(['th', 'td'])
-            headers = [cell.get_text(strip=True).lower() for cell in header_cells]
-            header_text = ' '.join(headers)
-
-            # Check if this is a parameter table
-            if 'keyword' in header_text or ('type' in header_text and 'description' in header_text):
-                # Determine table format by checking headers
-                # 4-column format: ['name', 'keyword', 'types', 'description']
-                # 3-column format: ['keyword', 'type', 'description']
-                is_4_column = len(headers) >= 4 and 'name' in headers[0]
-
-                for row in rows[1:]:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        param_name = cells[0].get_text(strip=True)
-
-                        # Filter out invalid parameters
-                        if (param_name and
-                            param_name not in ['Keyword', 'Parameter', 'Name', 'Disclaimer', 'Privacy'] and
-                            len(param_name) < 50):
-
-                            if is_4_column and len(cells) >= 4:
-                                # 4-column format: Name | Keyword | Types | Description
-                                param_info = {
-                                    'type': cells[1].get_text(strip=True),  # Keyword column
-                                    'dataType': cells[2].get_text(strip=True),  # Types column
-                                    'description': cells[3].get_text(strip=True),  # Description column
-                                    'required': False
-                                }
-                            elif len(cells) >= 3:
-                                # 3-column format: Keyword | Type | Description
-                                param_info = {
-                                    'type': param_name,  # First column is keyword in this format
-                                    'dataType': cells[1].get_text(strip=True),  # Type column
-                                    'description': cells[2].get_text(strip=True),  # Description column
-                                    'required': False
-                                }
-                            else:
-                                # Fallback for 2-column tables
-                                param_info = {
-                                    'type': cells[1].get_text(strip=True) if len(cells) > 1 else '',
-                                    'description': '',
-                                    'required': False
-                                }
-
-                            # Check for "required" mentions in description
-                            desc_lower = param_info.get('description', '').lower()
-                            if 'required' in desc_lower and 'not required' not in desc_lower:
-                                param_info['required'] = True
-
-                            parameters[param_name] = param_info
-                break
+        examples = []
+        for example in structured_examples:
+            example_text = self.matchers.whitespace.sub(' ', example['expression']).strip()  # Normalize whitespace
+            if len(example_text) < 500 and example_text not in examples:
+                examples.append(example_text)
+                if len(examples) >= 3:  # Limit to 3 examples
+                    break
 
-        return parameters
+        return examples
+
+    def _extract_structured_examples(self, soup: BeautifulSoup, sections: Optional[SectionMap] = None) -> List[Dict]:
+        """Extract every example code block once, keeping its original formatting.
+
+        Each example records the expression, the expected result when the docs
+        show one, the functions it calls and a content hash for deduplication.
+        """
+        # Code blocks after the first "Examples" heading; the whole page if there is none
+        if sections is None:
+            sections = SectionMap(soup, self.matchers)
+        examples_section = sections.first('examples')
+        example_heading = examples_section.heading if examples_section else None
+        candidates = []
+        in_examples = example_heading is None
+        for element in soup.descendants:
+            if element is example_heading:
+                in_examples = True
+            elif in_examples and getattr(element, 'name', None) in ('pre', 'code'):
+                candidates.append(element)
 
-    def _extract_examples(self, soup: BeautifulSoup) -> List[str]:
-        """Extract code examples with better parsing."""
         examples = []
+        seen = set()
+        for block in candidates:
+            if not self._is_example_block(block):
+                continue
+
+            expression = self._code_block_text(block)
+            if not expression or not contains_call(expression):
+                continue
 
-        # Look for example sections
-        example_headings = soup.find_all(string=re.compile(r'example', re.IGNORECASE))
-
-        for heading in example_headings:
-            parent = heading.parent
-            if parent:
-                # Find code blocks near example heading
-                for sibling in parent.find_next_siblings(['pre', 'code', 'div'])[:5]:
-                    # Check for code blocks
-                    code_blocks = sibling.find_all(['code', 'pre']) if sibling.name == 'div' else [sibling]
-
-                    for block in code_blocks:
-                        example_text = block.get_text(strip=True)
-                        # Only include if it looks like actual code (has function calls)
-                        if example_text and ('(' in example_text or 'a!' in example_text) and len(example_text) < 500:
-                            # Clean up the example
-                            example_text = re.sub(r'\s+', ' ', example_text)  # Normalize whitespace
-                            if example_text not in examples:  # Avoid duplicates
-                                examples.append(example_text)
-                                if len(examples) >= 3:  # Limit to 3 examples
-                                    return examples
+            content_hash = hashlib.sha256(expression.encode('utf-8')).hexdigest()[:16]
+            if content_hash in seen:
+                continue
+            seen.add(content_hash)
+
+            calls = []
+            for call in iter_calls(parse(expression)):
+                if domain_of(call['name']) in ('', 'a', 'fn') and call['name'] not in calls:
+                    calls.append(call['name'])
+
+            examples.append({
+                'hash': content_hash,
+                'expression': expression,
+                'result': self._example_result(block),
+                'calls': calls
+            })
 
         return examples
 
-    def _extract_keyword_syntax(self, soup: BeautifulSoup, examples: List[str]) -> Dict:
+    def _is_example_block(self, block) -> bool:
+        """Keep leaf code blocks: not gutters, not wrappers around other blocks, not inline prose code."""
+        if self._in_gutter(block):
+            return False
+        if block.name == 'pre':
+            return block.find('pre') is None
+        # <code>: skip when it sits inside (or wraps) a <pre>, which is handled on its own
+        if block.find_parent('pre') is not None or block.find('pre') is not None:
+            return False
+        # Inline <code> only counts inside an example table (Expression | Result)
+        return block.find_parent('td') is not None and self._result_cell(block) is not None
+
+    def _in_gutter(self, element) -> bool:
+        """Check whether an element is (inside) a line-number gutter."""
+        for node in [element] + list(element.parents):
+            classes = node.get('class') or []
+            if any(gutter in classes for gutter in GUTTER_CLASSES):
+                return True
+        return False
+
+    def _code_block_text(self, block) -> str:
+        """Code text with gutters removed, common indentation stripped, and layout kept."""
+        parts = []
+        for string in block.find_all(string=True):
+            if not any(any(gutter in (parent.get('class') or []) for gutter in GUTTER_CLASSES)
+                       for parent in string.parents if parent is not block and parent.name):
+                parts.append(str(string))
+        text = textwrap.dedent(''.join(parts).replace('\r\n', '\n'))
+        return text.strip('\n').rstrip()
+
+    def _result_cell(self, block):
+        """For code inside an examples table, return the cell holding its expected result."""
+        cell = block.find_parent('td')
+        row = cell.find_parent('tr') if cell else None
+        table = row.find_parent('table') if row else None
+        if table is None:
+            return None
+
+        header_row = table.find('tr')
+        headers = [c.get_text(strip=True).lower() for c in header_row.find_all(['th', 'td'])]
+        cells = row.find_all(['td', 'th'], recursive=False)
+        for index, header in enumerate(headers):
+            if self.matchers.result_header.search(header) and index < len(cells) and cells[index] is not cell:
+                return cells[index]
+        return None
+
+    def _example_result(self, block) -> str:
+        """Expected result shown next to an example (result column or 'Returns ...' text)."""
+        cell = self._result_cell(block) if block.find_parent('td') is not None else None
+        if cell is not None:
+            return cell.get_text(' ', strip=True)
+
+        # Climb out of highlight wrappers (including line-numbered code tables)
+        container = block
+        while container.parent is not None and container.parent.name and (
+                container.parent.name in ('pre', 'code', 'td', 'tr', 'tbody', 'table', 'figure')
+                or any('highlight' in c for c in container.parent.get('class') or [])):
+            container = container.parent
+
+        following = container.find_next_sibling()
+        if following is not None and following.name in ('p', 'div'):
+            match = self.matchers.result_prefix.match(following.get_text(' ', strip=True))
+            if match:
+                return match.group(1).strip()
+        return ''
+
+    def _add_to_example_store(self, store: Dict, function_name: str, examples: List[Dict]) -> None:
+        """Record a page's examples in the corpus-wide store, deduplicated by content hash."""
+        hashes = []
+        for example in examples:
+            entry = store['examples'].get(example['hash'])
+            if entry is None:
+                entry = {
+                    'expression': example['expression'],
+                    'result': example['result'],
+                    'calls': example['calls'],
+                    'functions': []
+                }
+                store['examples'][example['hash']] = entry
+            elif example['result'] and not entry['result']:
+                entry['result'] = example['result']
+            if function_name not in entry['functions']:
+                entry['functions'].append(function_name)
+            hashes.append(example['hash'])
+        store['functions'][function_name] = hashes
+
+    def _extract_keyword_syntax(self, soup: BeautifulSoup, examples: List[str],
+                                function_name: Optional[str] = None,
+                                sections: Optional[SectionMap] = None) -> Dict:
         """Infer whether a function uses keyword or positional syntax.
 
         This intentionally uses a tri-state result to avoid forcing a conclusion
-        when documentation signals are incomplete or ambiguous.
+        when documentation signals are incomplete or ambiguous. When function_name
+        is given, example calls to that function take precedence over other calls.
         """
-        keywords = self._extract_keywords_section(soup)
+        keywords = self._extract_keywords_section(soup, sections)
         if keywords:
             return {
                 'keywordSyntax': True,
@@ -299,7 +366,7 @@ class EnhancedAppianDocScraper:
             }
 
         if examples:
-            uses_keywords = any(self._example_uses_keywords(example) for example in examples)
+            uses_keywords = any(self._example_uses_keywords(example, function_name) for example in examples)
             return {
                 'keywordSyntax': uses_keywords,
                 'evidence': 'examples'
@@ -310,15 +377,13 @@ class EnhancedAppianDocScraper:
             'evidence': 'none'
         }
 
-    def _extract_keywords_section(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_keywords_section(self, soup: BeautifulSoup, sections: Optional[SectionMap] = None) -> List[str]:
         """Extract a function page's explicit Keywords list when available."""
         keywords = []
-        keywords_headings = soup.find_all(string=re.compile(r'keywords', re.IGNORECASE))
+        if sections is None:
+            sections = SectionMap(soup, self.matchers)
 
-        for heading in keywords_headings:
-            parent = heading.parent
-            if not parent:
-                continue
+        for parent in sections.anchors('keywords'):
             # Avoid parameter table headers (e.g., "Keyword" column in tables).
             if parent.find_parent('table') is not None:
                 continue
@@ -348,214 +413,262 @@ class EnhancedAppianDocScraper:
 
         return keywords
 
-    def _example_uses_keywords(self, example: str) -> bool:
-        """Heuristic: detect keyword-style arguments in example code."""
-        if not example or '(' not in example or ')' not in example:
+    def _example_uses_keywords(self, example: str, function_name: Optional[str] = None) -> bool:
+        """Detect keyword-style arguments in example code by parsing its call tree."""
+        if not example:
             return False
-        # Ignore URL fragments and other non-argument uses of ':'.
-        if 'http://' in example or 'https://' in example:
-            example = example.replace('http://', '').replace('https://', '')
-        return re.search(r'\b[a-zA-Z]\w*\s*:', example) is not None
+        return uses_keyword_arguments(example, function_name)
 
-    def _extract_use_case(self, soup: BeautifulSoup, description: str) -> str:
+    def _extract_use_case(self, soup: BeautifulSoup, description: str,
+                          sections: Optional[SectionMap] = None) -> str:
         """Extract or infer the primary use case."""
         # Look for usage or use case sections
-        use_case_headings = soup.find_all(string=re.compile(r'usage|use case|when to use', re.IGNORECASE))
+        if sections is None:
+            sections = SectionMap(soup, self.matchers)
 
-        for heading in use_case_headings:
-            parent = heading.parent
-            if parent:
-                next_p = parent.find_next('p')
-                if next_p:
-                    use_case = next_p.get_text(strip=True)
-                    if len(use_case) > 20:
-                        return use_case[:200]
+        for parent in sections.anchors('usage'):
+            next_p = parent.find_next('p')
+            if next_p:
+                use_case = next_p.get_text(strip=True)
+                if len(use_case) > 20:
+                    return use_case[:200]
 
         # Fallback: try to extract from description
         if description:
             # Look for sentences that explain purpose
             sentences = description.split('.')
             for sentence in sentences[:3]:
-                if any(keyword in sentence.lower() for keyword in ['use', 'when', 'for', 'to']):
+                if self.matchers.has_use_case_hint(sentence.lower()):
                     return sentence.strip() + '.'
 
         return ''
 
-    def _extract_related_functions(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_related_functions(self, soup: BeautifulSoup, sections: Optional[SectionMap] = None) -> List[str]:
         """Extract related or similar functions."""
         related = []
 
         # Look for "See also" or "Related" sections
-        related_headings = soup.find_all(string=re.compile(r'see also|related|similar', re.IGNORECASE))
-
-        for heading in related_headings:
-            parent = heading.parent
-            if parent:
-                # Find links in the next few siblings
-                for sibling in parent.find_next_siblings(['ul', 'p', 'div'])[:3]:
-                    links = sibling.find_all('a')
-                    for link in links:
-                        func_name = link.get_text(strip=True)
-                        if func_name and (func_name.startswith('a!') or '()' in func_name):
-                            clean_name = func_name.replace('()', '').strip()
-                            if clean_name not in related:
-                                related.append(clean_name)
-                                if len(related) >= 5:  # Limit to 5 related functions
-                                    return related
+        if sections is None:
+            sections = SectionMap(soup, self.matchers)
+
+        for parent in sections.anchors('related'):
+            # Find links in the next few siblings
+            for sibling in parent.find_next_siblings(['ul', 'p', 'div'])[:3]:
+                links = sibling.find_all('a')
+                for link in links:
+                    func_name = link.get_text(strip=True)
+                    if func_name and (func_name.startswith('a!') or '()' in func_name):
+                        clean_name = func_name.replace('()', '').strip()
+                        if clean_name not in related:
+                            related.append(clean_name)
+                            if len(related) >= 5:  # Limit to 5 related functions
+                                return related
 
         return related
 
     def _categorize_function(self, name: str, description: str) -> str:
         """Categorize the function based on name and description."""
-        name_lower = name.lower()
-        desc_lower = description.lower()
-
-        # UI Components
-        if name.startswith('a!') and any(term in name_lower for term in ['field', 'picker', 'layout', 'section', 'column', 'grid', 'chart', 'button', 'link', 'image']):
-            return 'UI Components'
-
-        # Array functions
-        if any(term in name_lower for term in ['array', 'append', 'insert', 'remove', 'filter', 'map', 'reduce', 'flatten', 'union']) or \
-           any(term in desc_lower for term in ['array', 'list', 'collection']):
-            return 'Array Functions'
-
-        # Text functions
-        if any(term in name_lower for term in ['text', 'concat', 'split', 'trim', 'upper', 'lower', 'search', 'replace', 'char']) or \
-           any(term in desc_lower for term in ['text', 'string', 'character']):
-            return 'Text Functions'
-
-        # Date/Time functions
-        if any(term in name_lower for term in ['date', 'time', 'day', 'month', 'year', 'hour', 'minute', 'calendar', 'today', 'now']) or \
-           any(term in desc_lower for term in ['date', 'time', 'calendar', 'timestamp']):
-            return 'Date and Time Functions'
-
-        # Data Query functions
-        if any(term in name_lower for term in ['query', 'record', 'data', 'filter', 'aggregate', 'paginginfo']) or \
-           'a!queryRecordType' in name or 'a!queryEntity' in name:
-            return 'Data Query Functions'
-
-        # Logic functions
-        if any(term in name_lower for term in ['if', 'and', 'or', 'not', 'null', 'empty', 'match', 'choose']) or \
-           any(term in desc_lower for term in ['condition', 'logic', 'boolean']):
-            return 'Logic Functions'
-
-        # Math functions
-        if any(term in name_lower for term in ['sum', 'average', 'min', 'max', 'round', 'abs', 'power', 'sqrt', 'mod', 'rand']) or \
-           any(term in desc_lower for term in ['mathematical', 'calculation', 'numeric']):
-            return 'Math Functions'
-
-        # Document functions
-        if any(term in name_lower for term in ['document', 'folder', 'file', 'download', 'export']):
-            return 'Document Functions'
-
-        # Process functions
-        if any(term in name_lower for term in ['process', 'task', 'node', 'activity']):
-            return 'Process Functions'
-
-        return 'Other Functions'
-
-    def run(self, limit: Optional[int] = None) -> Dict:
-        """Main scraping process."""
-        print("Starting enhanced Appian documentation scraping...")
-
-        # Fetch main page
-        soup = self.fetch_page(self.base_url)
-        if not soup:
-            print("Failed to fetch main page")
-            return {}
-
-        # Extract function list
-        print("Extracting function list...")
-        functions = self.extract_function_list(soup)
-        print(f"Found {len(functions)} functions")
+        return self.matchers.categorize(name, description)
 
-        # Scrape details for each function
-        docs = {
+    def run(self, limit: Optional[int] = None, workers: int = 1, stats_file: Optional[str] = None,
+            low_memory: bool = False, scraped_date: Optional[str] = None) -> Dict:
+        """Main scraping process."""
+        emitter = DocsEmitter(self, low_memory=low_memory, scraped_date=scraped_date)
+        pipeline = ScrapePipeline(self.base_url, [emitter], fetch=self.fetch_page,
+                                  fetch_raw=self.fetch_raw, archive=self.archive, workers=workers,
+                                  stats_file=stats_file, low_memory=low_memory)
+        return pipeline.run(limit=limit)
+
+
+class DocsEmitter(Emitter):
+    """Pipeline plugin that builds the docs, syntax map and examples files (and the SQLite store)."""
+
+    def __init__(self, scraper: EnhancedAppianDocScraper, low_memory: bool = False,
+                 scraped_date: Optional[str] = None):
+        self.scraper = scraper
+        self.low_memory = low_memory  # Hold results as compact __slots__ records until finish()
+        self.scraped_date = scraped_date  # ISO date in the metadata (default: today)
+        self.docs = {}
+        self.syntax_map = {}
+        self.example_store = {}
+        self.order = []
+        self.results = {}  # key -> (record, syntax info, structured examples), in scrape order
+
+    def start(self, base_url: str, functions: Dict[str, Dict]) -> None:
+        self.order = list(functions)
+        self.results = {}
+        self.docs = {
             'metadata': {
                 'version': '1.0',
-                'source': self.base_url,
-                'scrapedDate': '2025-12-15',
+                'source': base_url,
+                'scrapedDate': self.scraped_date or date.today().isoformat(),
                 'totalFunctions': len(functions)
             },
             'functions': {}
         }
-        syntax_map = {
+        self.syntax_map = {
             'metadata': {
                 'source': 'appian-docs-scraper',
-                'appianVersion': self.base_url,
-                'scrapedDate': docs['metadata']['scrapedDate']
+                'appianVersion': base_url,
+                'scrapedDate': self.docs['metadata']['scrapedDate']
             },
             'functions': {}
         }
-
-        count = 0
-        for name, info in functions.items():
-            if limit and count >= limit:
-                break
-
-            print(f"Processing {name} ({count + 1}/{len(functions)})...")
-            soup = self.fetch_page(info['url'])
-            if not soup:
-                detailed_info = {
-                    'name': info['name'],
-                    'description': '',
-                    'parameters': {},
-                    'returnType': '',
-                    'examples': [],
-                    'category': 'Other'
-                }
-                syntax_info = {
-                    'keywordSyntax': 'unknown',
-                    'evidence': 'fetch_error'
-                }
-            else:
-                main_content = soup.find('main') or soup.find('div', class_='content') or soup
-                detailed_info = self._build_function_details(info, main_content)
-                syntax_info = self._extract_keyword_syntax(main_content, detailed_info['examples'])
-
-            docs['functions'][detailed_info['name']] = detailed_info
-            syntax_map['functions'][detailed_info['name']] = syntax_info
-            count += 1
-
+        self.example_store = {
+            'metadata': {
+                'source': base_url,
+                'scrapedDate': self.docs['metadata']['scrapedDate']
+            },
+            'examples': {},
+            'functions': {}
+        }
+        if self.scraper.store:
+            self.scraper.store.set_metadata(self.docs['metadata'])
+
+    def add_page(self, key: str, info: Dict, page: Optional[Page]) -> None:
+        scraper = self.scraper
+        if not page:
+            detailed_info = {
+                'name': info['name'],
+                'description': '',
+                'parameters': {},
+                'returnType': '',
+                'examples': [],
+                'category': 'Other'
+            }
+            syntax_info = {
+                'keywordSyntax': 'unknown',
+                'evidence': 'fetch_error'
+            }
+            structured_examples = None
+            expressions = []
+        else:
+            main_content = page.main
+            # Headings are indexed once per page; every extractor looks its section up by kind
+            sections = page.memo('sections', lambda: SectionMap(main_content, scraper.matchers))
+            structured_examples = page.memo('structured_examples',
+                                            lambda: scraper._extract_structured_examples(main_content, sections))
+            detailed_info = scraper._build_function_details(info, main_content, structured_examples, sections)
+            expressions = [example['expression'] for example in structured_examples]
+            syntax_info = scraper._extract_keyword_syntax(main_content, expressions, info['name'], sections)
+        # Every signal combined into one probability, so consumers can tell weak evidence from strong
+        syntax_info['confidence'] = keyword_confidence(info['name'], detailed_info['parameters'], expressions,
+                                                       syntax_info['evidence'])
+
+        if scraper.store:
+            scraper.store.add(detailed_info, syntax_info)
+        if self.low_memory:
+            detailed_info, syntax_info = compact_function(detailed_info), compact_syntax(syntax_info)
+        self.results[key] = (detailed_info, syntax_info, structured_examples)
+
+    def finish(self) -> Dict[str, Dict]:
+        if self.scraper.store:
+            self.scraper.store.flush()
+
+        # Assemble in listing order, whatever order the pages were scraped in
+        for key in self.order:
+            if key not in self.results:
+                continue
+            detailed_info, syntax_info, structured_examples = self.results.pop(key)
+            detailed_info, syntax_info = expand(detailed_info), expand(syntax_info)
+            self.docs['functions'][detailed_info['name']] = detailed_info
+            self.syntax_map['functions'][detailed_info['name']] = syntax_info
+            if structured_examples is not None:
+                self.scraper._add_to_example_store(self.example_store, detailed_info['name'], structured_examples)
         return {
-            'docs': docs,
-            'syntax': syntax_map
+            'docs': self.docs,
+            'syntax': self.syntax_map,
+            'examples': self.example_store
         }
 
 
 def main():
     """Run the enhanced scraper."""
-    import sys
-
-    # Check for limit argument
-    limit = None
-    if len(sys.argv) > 1:
-        try:
-            limit = int(sys.argv[1])
-            print(f"Limiting to {limit} functions for testing")
-        except ValueError:
-            print("Usage: python3 scrape_appian_docs_enhanced.py [limit]")
-            sys.exit(1)
-
-    scraper = EnhancedAppianDocScraper()
-    result = scraper.run(limit=limit)
+    parser = argparse.ArgumentParser(
+        description='Scrape enriched Appian function documentation',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scrape everything
+  python3 scrape_appian_docs_enhanced.py
+
+  # First 10 functions only, for testing
+  python3 scrape_appian_docs_enhanced.py 10
+
+  # A different version, into its own files
+  python3 scrape_appian_docs_enhanced.py --url https://docs.appian.com/suite/help/26.0/Appian_Functions.html \\
+                                         --docs-output 26.0/appian-functions-docs.json
+
+  # Keep the raw pages, then re-run the extractors against them (no network)
+  python3 scrape_appian_docs_enhanced.py --archive
+  python3 scrape_appian_docs_enhanced.py --replay latest
+
+  # Also write an indexed SQLite store
+  python3 scrape_appian_docs_enhanced.py --sqlite appian-functions.db
+
+See also: appian-docs scrape --help (appian_cli.py) for every output from one pass.
+        """
+    )
+    parser.add_argument('limit', type=int, nargs='?', help='Only process the first N functions')
+    parser.add_argument('--url', type=str, default=DEFAULT_BASE_URL,
+                        help='URL to the Appian Functions documentation page (default: 25.4)')
+    parser.add_argument('--docs-output', type=str, default=OUTPUT_FILES['docs'][0], help='Docs file')
+    parser.add_argument('--syntax-output', type=str, default=OUTPUT_FILES['syntax'][0], help='Syntax map file')
+    parser.add_argument('--examples-output', type=str, default=OUTPUT_FILES['examples'][0], help='Examples file')
+    parser.add_argument('--shapes-output', type=str, default='appian-table-shapes.json',
+                        help='Parameter table shape report (default: appian-table-shapes.json)')
+    parser.add_argument('--scraped-date', type=str, metavar='YYYY-MM-DD',
+                        help='Date recorded in the metadata (default: today, or the archived run\'s date on replay)')
+    parser.add_argument('--archive-dir', type=str, default=DEFAULT_ARCHIVE_DIR,
+                        help=f'Raw page archive directory (default: {DEFAULT_ARCHIVE_DIR})')
+    parser.add_argument('--archive', action='store_true',
+                        help='Keep raw pages in --archive-dir for --replay runs (off by default; never pruned)')
+    parser.add_argument('--replay', type=str, metavar='RUN',
+                        help="Read pages from an archived run (id or 'latest') instead of the network")
+    parser.add_argument('--sqlite', type=str, metavar='DB',
+                        help='Also write the corpus to a SQLite store (see appian_query.py)')
+    parser.add_argument('--workers', type=int, default=4, help='Pages fetched in parallel (default: 4)')
+    parser.add_argument('--low-memory', action='store_true',
+                        help='Compact records and free parse trees early; reports peak memory per 100 pages')
+    args = parser.parse_args()
+
+    limit = args.limit
+    if limit:
+        print(f"Limiting to {limit} functions for testing")
+
+    archive = None
+    base_url = args.url
+    scraped_date = args.scraped_date
+    if args.replay or args.archive:
+        archive = PageArchive(args.archive_dir)
+        if args.replay:
+            manifest = archive.start_replay(args.replay)
+            base_url = manifest['source'] or base_url
+            scraped_date = scraped_date or manifest.get('created', '')[:10] or None
+            print(f"Replaying archived run {manifest['run']} ({len(manifest['pages'])} pages)")
+
+    store = CorpusStore(args.sqlite) if args.sqlite else None
+    scraper = EnhancedAppianDocScraper(base_url=base_url, archive=archive, store=store)
+    result = scraper.run(limit=limit, workers=args.workers, stats_file=DEFAULT_STATS_FILE,
+                         low_memory=args.low_memory, scraped_date=scraped_date)
+    if store:
+        store.close()
+        print(f"✓ Wrote {store.written} functions to SQLite store: {args.sqlite}")
     docs = result.get('docs', {})
-    syntax_map = result.get('syntax', {})
 
     if docs and docs.get('functions'):
-        # Save to JSON file
-        output_file = "appian-functions-docs.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(docs, f, indent=2, ensure_ascii=False)
-
+        # Docs, keyword/positional syntax map and structured examples (deduplicated by content hash)
+        files = {'docs': args.docs_output, 'syntax': args.syntax_output, 'examples': args.examples_output}
         print(f"\n✓ Generated documentation for {len(docs['functions'])} functions")
-        print(f"✓ Saved to: {output_file}")
-
-        # Save keyword/positional syntax map (separate file to avoid breaking existing outputs)
-        syntax_file = "appian-function-syntax.json"
-        with open(syntax_file, 'w', encoding='utf-8') as f:
-            json.dump(syntax_map, f, indent=2, ensure_ascii=False)
-        print(f"✓ Saved syntax map to: {syntax_file}")
+        for path in write_outputs(result, files):
+            print(f"✓ Saved to: {path}")
+        print(f"✓ {len(result.get('examples', {}).get('examples', {}))} unique examples")
+
+        # Save table shape report (header signatures seen, and which ones were not mapped)
+        shape_report = scraper.tables.shape_report()
+        write_json(args.shapes_output, shape_report)
+        print(f"✓ Saved table shape report ({len(shape_report['unrecognized'])} unrecognized shapes) "
+              f"to: {args.shapes_output}")
 
         # Print sample
         sample_func = list(docs['functions'].values())[0]
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """
 Setup script for the Appian documentation scraper
+
+    python3 setup.py      # Install the requirements and check the imports
+    pip install -e .      # Install the modules and the appian-docs command
 """
 
+import glob
 import subprocess
 import sys
 import os
 
+CONSOLE_SCRIPTS = ['appian-docs = appian_cli:main']
+
 
 def install_requirements():
     """Install required Python packages."""
@@ -34,6 +40,31 @@ def test_imports():
         return False
 
 
+def read_requirements():
+    """Requirement specifiers from requirements.txt."""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements.txt")) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def package_setup():
+    """setuptools build (pip install / setup.py <command>), registering the appian-docs console script."""
+    from setuptools import setup
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    modules = sorted(os.path.basename(path)[:-3]
+                     for pattern in ("appian_*.py", "scrape_appian_docs*.py")
+                     for path in glob.glob(os.path.join(here, pattern)))
+    setup(
+        name="appian-docs-scraper",
+        version="0.1.0",
+        description="Scrape Appian function documentation into snippets, docs and editor tooling",
+        py_modules=modules,
+        install_requires=read_requirements(),
+        python_requires=">=3.8",
+        entry_points={"console_scripts": CONSOLE_SCRIPTS},
+    )
+
+
 def main():
     print("=== Appian Documentation Scraper Setup ===")
 
@@ -53,7 +84,11 @@ def main():
     print("\n✓ Setup complete! You can now run:")
     print("  python test_page_structure.py  # Test page structure")
     print("  python scrape_appian_docs.py   # Run full scraper")
+    print("  pip install -e .               # Install the appian-docs command")
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        package_setup()
+    else:
+        main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test the appian-docs entry point, the progress bar and the rate limiter (no network needed)
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+from appian_archive import PageArchive
+from appian_cli import build_parser, main, open_source
+from appian_progress import ProgressBar
+from appian_scheduler import RateLimiter
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, FakeSession
+
+
+def test_subcommands():
+    """Test that every subcommand is listed and bad formats are rejected before scraping."""
+    help_text = build_parser().format_help()
+    listed = all(name in help_text for name in ('scrape', 'snippets', 'index', 'diff', 'validate'))
+    errors = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(errors):
+            main(['scrape', '--format', 'json,xml'])
+        rejected = False
+    except SystemExit as e:
+        rejected = e.code == 2 and 'xml' in errors.getvalue()
+    args = build_parser().parse_args(['scrape', '--offline', '--format', 'json,csv', '--rate-limit', '2'])
+    assert (listed and rejected and args.offline == 'latest' and args.format == ['json', 'csv']
+            and args.rate_limit == 2.0), f"listed={listed} rejected={rejected} args={args}"
+    print("✓ PASS: subcommands listed; --offline defaults to the latest run; unknown formats rejected")
+
+
+def test_progress_bar():
+    """Test throughput/ETA rendering, and one line per 10% when not on a terminal."""
+    log = io.StringIO()
+    bar = ProgressBar(50, stream=log, interactive=False)
+    for index in range(50):
+        bar.update(f"fn{index}")
+    lines = log.getvalue().splitlines()
+
+    terminal = io.StringIO()
+    live = ProgressBar(4, stream=terminal, interactive=True)
+    live.update('append')
+    live.close()
+    assert (len(lines) == 10 and '50/50' in lines[-1] and 'pages/s' in lines[0] and 'ETA' in lines[0]
+            and terminal.getvalue().startswith('\r') and '1/4' in terminal.getvalue()), \
+        f"lines={lines} terminal={terminal.getvalue()!r}"
+    print(f"✓ PASS: {len(lines)} log lines for 50 pages; terminal bar redraws in place ({lines[-1]})")
+
+
+def test_rate_limiter():
+    """Test that request starts are spaced out across threads."""
+    limiter = RateLimiter(50)
+    fetch = limiter.wrap(lambda url: url)
+    start = time.perf_counter()
+    results = [fetch(str(index)) for index in range(6)]
+    elapsed = time.perf_counter() - start
+    assert results == [str(index) for index in range(6)] and elapsed >= 0.09 and limiter.waited > 0, \
+        f"elapsed={elapsed} waited={limiter.waited}"
+    print(f"✓ PASS: 6 requests at 50/s took {elapsed * 1000:.0f} ms")
+
+
+def test_fetch_lines_per_scraper():
+    """Test that turning off "Fetching:" lines for one scraper leaves another scraper's output alone."""
+    printed = []
+    for log_fetches in (False, True):
+        scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+        scraper.session = FakeSession()
+        scraper.log_fetches = log_fetches
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            scraper.run()
+        printed.append(output.getvalue().count('Fetching:'))
+    assert printed[0] == 0 and printed[1] > 0, f"Fetching lines quiet={printed[0]} default={printed[1]}"
+    print(f"✓ PASS: quiet scraper printed no fetch lines, default scraper printed {printed[1]}")
+
+
+def test_offline_scrape():
+    """Test scrape --offline from the page cache into an output directory in several formats."""
+    with tempfile.TemporaryDirectory() as root:
+        cache = os.path.join(root, 'cache')
+        scraper = EnhancedAppianDocScraper(base_url=BASE_URL, archive=PageArchive(cache))
+        scraper.session = FakeSession()
+        scraper.run()
+
+        out = os.path.join(root, 'out')
+        printed = io.StringIO()
+        with contextlib.redirect_stdout(printed), contextlib.redirect_stderr(io.StringIO()):
+            code = main(['scrape', '--offline', '--cache-dir', cache, '--output-dir', out,
+                         '--format', 'json,sqlite,csv', '--scraped-date', '2026-01-02',
+                         '--stats', os.path.join(root, 'stats.json')])
+        with open(os.path.join(out, 'appian-functions-docs.json'), 'r', encoding='utf-8') as f:
+            docs = json.load(f)
+        written = sorted(os.listdir(out))
+        assert (code == 0 and 'append' in docs['functions'] and docs['metadata']['scrapedDate'] == '2026-01-02'
+                and {'appian-functions-complete.json', 'appian-functions.db',
+                     'appian-functions-columnar'} <= set(written)
+                and 'Processing' not in printed.getvalue()), \
+            f"code={code} written={written} metadata={docs['metadata']}"
+        print(f"✓ PASS: offline scrape wrote {', '.join(written)}")
+
+
+def test_cache_is_opt_in():
+    """Test that a plain scrape keeps no pages and --cache keeps them in --cache-dir."""
+    with tempfile.TemporaryDirectory() as root:
+        cache = os.path.join(root, 'cache')
+        parser = build_parser()
+        plain = open_source(parser.parse_args(['scrape', '--cache-dir', cache]))
+        cached = open_source(parser.parse_args(['scrape', '--cache', '--cache-dir', cache]))
+        assert (plain['archive'] is None and not os.path.exists(cache)
+                and cached['archive'] is not None and cached['archive'].root == cache), \
+            f"plain={plain['archive']} cached={cached['archive']}"
+        print("✓ PASS: pages are cached only with --cache")
+
+
+def test_delegated_subcommand():
+    """Test that index/diff/validate run the existing tools with their own flags."""
+    with tempfile.TemporaryDirectory() as root:
+        index_file = os.path.join(root, 'index.pkl')
+        with contextlib.redirect_stdout(io.StringIO()):
+            code = main(['index', '--docs', 'appian-functions-docs.json', '--output', index_file])
+        assert code == 0 and os.path.getsize(index_file) > 0, f"code={code}"
+        print("✓ PASS: appian-docs index wrote the function index")
+
+
+if __name__ == "__main__":
+    print("Testing the appian-docs command line\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_subcommands, test_progress_bar, test_rate_limiter, test_fetch_lines_per_scraper,
+                 test_offline_scrape, test_cache_is_opt_in, test_delegated_subcommand):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test function discovery from a TOC, a sitemap and the listing page (no network needed)
+"""
+
+import contextlib
+import io
+import json
+import sys
+
+from bs4 import BeautifulSoup
+
+from appian_discovery import FunctionDiscovery, canonical_url, discover_functions
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, FakeResponse, FakeSession
+
+ROOT = 'https://docs.appian.com/suite/help/25.4/'
+# Listing page noise: a deprecated alias of a live page, fragment/query/relative variants,
+# navigation and category links, an off-site link and a link back to the listing itself
+LISTING_HTML = f'''<main>
+<a href="{ROOT}Dashboard_Layout.html">a!dashboardLayoutColumns() [Deprecated]</a>
+<a href="Dashboard_Layout.html#usage">a!dashboardLayout()</a>
+<p><a href="fnc_array_append.html">append()</a> Appends a value to an array.</p>
+<a href="./fnc_array_append.html?lang=en">append()</a>
+<a href="fnc_array_index.html">index</a>
+<a href="Array_Functions.html">Array functions</a>
+<a href="Home.html">Home</a>
+<a href="https://community.appian.com/fnc_array_append.html">append()</a>
+<a href="Appian_Functions.html#top">length()</a>
+<a href="#syntax">a!forEach()</a>
+</main>'''
+TOC_JSON = json.dumps({'title': 'Appian Functions', 'children': [
+    {'title': 'Array functions', 'url': 'Array_Functions.html', 'children': [
+        {'title': 'append() Function', 'url': 'fnc_array_append.html', 'summary': 'Appends a value to an array.'},
+        {'title': 'index()', 'url': 'fnc_array_index.html'},
+    ]},
+    {'title': 'a!forEach()', 'href': '/suite/help/25.4/fnc_looping_a_foreach.html'},
+    {'title': 'a!forEach()', 'href': 'fnc_looping_a_foreach.html#examples'},
+]}).encode()
+SITEMAP_XML = f'''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>{ROOT}fnc_array_append.html</loc></url>
+<url><loc>{ROOT}Dashboard_Layout.html</loc></url>
+</urlset>'''.encode()
+FUNCTION_PAGE = b'<main><h1>f()</h1><p>Does something useful with the value it is given.</p></main>'
+
+
+class DocsSiteSession(FakeSession):
+    """A docs site with a listing page, optional TOC/sitemap and a page for every function URL."""
+    def __init__(self, extra=None):
+        super().__init__()
+        self.urls = []
+        self.content = {BASE_URL: LISTING_HTML.encode(), **(extra or {})}
+
+    def get(self, url, timeout=None):
+        self.fetches += 1
+        self.urls.append(url)
+        if url in self.content:
+            return FakeResponse(self.content[url])
+        if url.startswith(ROOT) and url.endswith('.html'):
+            return FakeResponse(FUNCTION_PAGE)
+        raise ConnectionError(f"404 {url}")
+
+
+def _scrape(session, **discovery_args):
+    scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+    scraper.session = session
+    discovery = FunctionDiscovery(BASE_URL, **discovery_args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        functions = discovery.run(scraper.fetch_page, scraper.fetch_raw)
+    return functions, discovery.stats
+
+
+def test_listing_dedup():
+    """Test that listing noise is dropped and each canonical URL is kept once."""
+    functions = discover_functions(BeautifulSoup(LISTING_HTML, 'lxml'), BASE_URL)
+    urls = [info['url'] for info in functions.values()]
+    expected = {
+        'a!dashboardLayout()': f'{ROOT}Dashboard_Layout.html',
+        'append()': f'{ROOT}fnc_array_append.html',
+        'index()': f'{ROOT}fnc_array_index.html',
+    }
+    checks = [
+        {key: info['url'] for key, info in functions.items()} == expected,
+        list(functions) == list(expected),  # Listing order, the live name taking the deprecated alias' place
+        len(urls) == len(set(urls)),
+        functions['a!dashboardLayout()'].get('aliases') == ['a!dashboardLayoutColumns()'],
+        not functions['a!dashboardLayout()']['deprecated'],
+        functions['append()']['summary'].startswith('append()Appends'),
+        canonical_url('./A/../fnc_x.html?x=1#y', BASE_URL) == f'{ROOT}fnc_x.html',
+    ]
+    assert all(checks), f"listing checks {checks}: {functions}"
+    print(f"✓ PASS: {len(functions)} functions from the listing, noise and duplicate URLs dropped")
+
+
+def test_toc_one_fetch():
+    """Test that a TOC discovers functions in one fetch without touching the listing page."""
+    toc_url = f'{ROOT}toc.json'
+    session = DocsSiteSession({toc_url: TOC_JSON})
+    functions, stats = _scrape(session, toc_url=toc_url)
+
+    assert (list(functions) == ['append()', 'index()', 'a!forEach()'] and session.urls == [toc_url]
+            and stats['source'] == 'toc' and stats['duplicates'] == 1
+            and functions['append()']['summary'] == 'Appends a value to an array.'), \
+        f"TOC discovery {list(functions)} via {session.urls} ({stats})"
+    print("✓ PASS: TOC gives names, URLs and summaries in a single fetch")
+
+
+def test_sitemap_and_fallback():
+    """Test sitemap filtering, and the listing fallback when a source is missing."""
+    sitemap_url = f'{ROOT}sitemap.xml'
+    filtered, sitemap_stats = _scrape(DocsSiteSession({sitemap_url: SITEMAP_XML}), sitemap_url=sitemap_url)
+    fallback, fallback_stats = _scrape(DocsSiteSession(), toc_url=f'{ROOT}toc.json')
+    listing = discover_functions(BeautifulSoup(LISTING_HTML, 'lxml'), BASE_URL)
+
+    assert list(filtered) == ['a!dashboardLayout()', 'append()'] and sitemap_stats['source'] == 'sitemap', \
+        f"sitemap discovery {list(filtered)} ({sitemap_stats})"
+    print("✓ PASS: sitemap keeps only listing links to pages it lists")
+
+    assert fallback == listing and fallback_stats['source'] == 'listing', \
+        f"fallback discovery {list(fallback)} ({fallback_stats})"
+    print("✓ PASS: missing TOC falls back to the listing page")
+
+
+def test_fetch_stage_unique():
+    """Test that a full run fetches every function page exactly once."""
+    scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+    scraper.session = DocsSiteSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        docs = scraper.run(workers=2)['docs']
+    pages = scraper.session.urls[1:]
+
+    assert len(pages) == len(set(pages)) == 3 and len(docs['functions']) == 3, f"fetched {pages}"
+    print("✓ PASS: fetch stage saw 3 unique function URLs")
+
+
+if __name__ == "__main__":
+    print("Testing function discovery...\n")
+
+    all_passed = True
+    for test in (test_listing_dedup, test_toc_one_fetch, test_sitemap_and_fallback, test_fetch_stage_unique):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All discovery tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
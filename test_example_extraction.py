@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test structured example extraction on saved page markup (no network needed)
+"""
+
+import sys
+
+from bs4 import BeautifulSoup
+
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+
+# Trimmed copy of a function page: syntax block, a line-numbered (rouge) example,
+# a "Returns" paragraph and an Expression | Result table
+PAGE_HTML = '''<main><h1>append()</h1>
+<p>Appends a value or values to the given array, and returns the resulting array.</p>
+<h2>Syntax</h2><pre><code>append( array, value )</code></pre>
+<h2>Examples</h2>
+<div class="highlighter-rouge"><div class="highlight"><pre class="highlight"><code><table class="rouge-table"><tbody><tr>
+<td class="rouge-gutter gl"><pre class="lineno">1
+2
+3
+4
+</pre></td><td class="rouge-code"><pre>a!localVariables(
+  local!x: {10, 20},
+  append(local!x, 50)
+)
+</pre></td></tr></tbody></table></code></pre></div></div>
+<p>Returns <code>{10, 20, 50}</code></p>
+<table><tr><th>Expression</th><th>Result</th></tr>
+<tr><td><code>append({1}, 2)</code></td><td>{1, 2}</td></tr></table>
+<pre>append({1}, 2)</pre>
+</main>'''
+
+
+def test_structured_examples():
+    """Test formatting, results, calls and per-page deduplication."""
+    scraper = EnhancedAppianDocScraper()
+    main_content = BeautifulSoup(PAGE_HTML, 'lxml').find('main')
+    examples = scraper._extract_structured_examples(main_content)
+    expressions = [example['expression'] for example in examples]
+    assert expressions == ['a!localVariables(\n  local!x: {10, 20},\n  append(local!x, 50)\n)', 'append({1}, 2)'], \
+        f"expressions: {expressions}"
+    print("✓ PASS: code blocks captured once, formatting kept, gutter and syntax block skipped")
+
+    assert examples and [example['result'] for example in examples] == ['{10, 20, 50}', '{1, 2}'], \
+        f"results: {[example['result'] for example in examples]}"
+    print("✓ PASS: expected results read from 'Returns' text and result column")
+
+    assert examples and examples[0]['calls'] == ['a!localVariables', 'append'], \
+        f"calls: {examples[0]['calls'] if examples else None}"
+    print("✓ PASS: called functions recorded")
+
+    compact = scraper._extract_examples(main_content, examples)
+    assert compact[0] == 'a!localVariables( local!x: {10, 20}, append(local!x, 50) )', f"compact examples: {compact}"
+    print("✓ PASS: docs file examples stay single-line without line-number prefixes")
+
+
+def test_example_store_dedup():
+    """Test that the same example on two pages is stored once."""
+    scraper = EnhancedAppianDocScraper()
+    main_content = BeautifulSoup(PAGE_HTML, 'lxml').find('main')
+    examples = scraper._extract_structured_examples(main_content)
+
+    store = {'metadata': {}, 'examples': {}, 'functions': {}}
+    scraper._add_to_example_store(store, 'append', examples)
+    scraper._add_to_example_store(store, 'a!localVariables', examples[:1])
+
+    shared = store['examples'].get(examples[0]['hash'], {})
+    assert len(store['examples']) == 2 and shared.get('functions') == ['append', 'a!localVariables'], f"store: {store}"
+    print("✓ PASS: examples deduplicated by content hash across pages")
+
+
+if __name__ == "__main__":
+    print("Testing structured example extraction...\n")
+
+    all_passed = True
+    for test in (test_structured_examples, test_example_store_dedup):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All example extraction tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
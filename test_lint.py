@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test the Appian expression linter against the scraped signatures (no network needed)
+"""
+
+import os
+import sys
+import tempfile
+from unittest import mock
+
+from appian_lint import lint_paths, lint_text, load_signatures
+
+
+def test_lint_rules():
+    """Test each rule on small expressions."""
+    signatures = load_signatures()
+
+    test_cases = [
+        ('a!forEach(items: {1, 2}, expression: fv!item * 2)', []),
+        ('a!localVariables(local!x: 1, local!y: 2, local!x + local!y)', []),
+        ('a!forEach(items: {1, 2}, expresion: fv!item)', ['unknown-keyword']),
+        ('a!forEach(items: {1, 2}, fv!item)', ['mixed-arguments']),
+        ('a!dashboardLayoutColumns()', ['deprecated']),
+        ('a!notAFunction(1)', ['unknown-function']),
+        ('if(condition: true, valueIfTrue: 1, valueIfFalse: 2)', ['keyword-syntax']),
+        ('rule!myRule(anything: 1)', []),
+        ('a!textField(label: "a: b", value: "x" /* note: y */)', []),
+        ('a!map(anyKey: 1, otherKey: 2)', []),
+    ]
+
+    for expression, expected in test_cases:
+        codes = [issue['code'] for issue in lint_text(expression, signatures)]
+        assert codes == expected, f"{expression[:50]} -> {codes} (expected {expected})"
+        print(f"✓ PASS: {expression[:50]} -> {codes}")
+
+
+def test_parallel_lint():
+    """Test linting a directory of files across worker processes."""
+    signatures = load_signatures()
+    directory = tempfile.mkdtemp()
+    for i in range(40):
+        with open(os.path.join(directory, f"rule{i:02d}.sail"), 'w') as f:
+            f.write('a!forEach(items: ri!list, expresion: fv!item)' if i % 10 == 0
+                    else 'a!forEach(items: ri!list, expression: fv!item)')
+    with open(os.path.join(directory, "notes.txt"), 'w') as f:
+        f.write('a!notAFunction()')
+
+    results = dict(lint_paths([directory], signatures, workers=2))
+    flagged = sorted(os.path.basename(path) for path, issues in results.items() if issues)
+
+    assert len(results) == 40 and flagged == ['rule00.sail', 'rule10.sail', 'rule20.sail', 'rule30.sail'], \
+        f"linted {len(results)} files, flagged {flagged}"
+    print("✓ PASS: parallel lint over 40 files flagged the 4 bad ones")
+
+
+def test_unparsable_file():
+    """Test that a file the parser cannot handle gets a per-file diagnostic and the run goes on."""
+    signatures = load_signatures()
+    directory = tempfile.mkdtemp()
+    for name, text in (('deep.sail', 'a!forEach(' * 3000), ('ok.sail', 'a!forEach(items: {1}, expression: fv!item)')):
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(text)
+
+    results = {os.path.basename(path): issues for path, issues in lint_paths([directory], signatures, workers=2)}
+    deep_codes = {issue['code'] for issue in results.get('deep.sail', [])}
+    assert deep_codes == {'syntax'} and results.get('ok.sail') == [], f"pool results: {results}"
+
+    for error in (RecursionError('maximum recursion depth exceeded'), ValueError('unexpected token state')):
+        with mock.patch('appian_lint.parse', side_effect=error):
+            results = dict(lint_paths([os.path.join(directory, 'ok.sail')], signatures, workers=1))
+        codes = [issue['code'] for issues in results.values() for issue in issues]
+        assert codes == ['parse'], f"{type(error).__name__} reported as {codes}"
+    print("✓ PASS: deeply nested file linted with syntax errors, parser failures reported as 'parse'")
+
+    with open(os.path.join(directory, 'latin1.sail'), 'wb') as f:
+        f.write(b'\xff\xfe\x00 caf\xe9')
+    results = {os.path.basename(path): issues for path, issues in lint_paths([directory], signatures, workers=2)}
+    undecodable = results.get('latin1.sail', [])
+    assert ([issue['code'] for issue in undecodable] == ['io'] and 'decode' in undecodable[0]['message']
+            and results.get('ok.sail') == []), f"pool results: {results}"
+    print("✓ PASS: undecodable file reported as 'io' without stopping the run")
+
+
+if __name__ == "__main__":
+    print("Testing Appian expression linter...\n")
+
+    all_passed = True
+    for test in (test_lint_rules, test_parallel_lint, test_unparsable_file):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All linter tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
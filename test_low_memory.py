@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test the low-memory run mode: compact records and early parse tree disposal (no network needed)
+"""
+
+import contextlib
+import gc
+import io
+import json
+import sys
+import tracemalloc
+
+from bs4.element import Tag
+
+from appian_records import compact_function, compact_syntax, expand
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, FakeResponse
+
+PAGE_COUNT = 40
+ROWS = ''.join(f'<tr><td>p{j}</td><td>Text</td><td>Parameter {j} description.</td></tr>' for j in range(30))
+PAGES = {BASE_URL: ('<main>' + ''.join(f'<a href="fnc_{i}.html">f{i}()</a>' for i in range(PAGE_COUNT)) +
+                    '</main>').encode()}
+for i in range(PAGE_COUNT):
+    PAGES[f'https://docs.appian.com/suite/help/25.4/fnc_{i}.html'] = (
+        f'<main><h1>f{i}()</h1><p>Returns the item number {i} of the array.</p>'
+        f'<table><tr><th>Keyword</th><th>Type</th><th>Description</th></tr>{ROWS}</table>' +
+        '<p>Filler paragraph.</p>' * 200 + f'<h2>Examples</h2><pre>f{i}(1)</pre></main>').encode()
+
+
+class SyntheticSession:
+    def get(self, url, timeout=None):
+        return FakeResponse(PAGES[url])
+
+
+def _run(low_memory: bool):
+    scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+    scraper.session = SyntheticSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        return scraper.run(low_memory=low_memory)
+
+
+def test_compact_records():
+    """Test that compact records rebuild the exact JSON and take less memory."""
+    with open('appian-functions-docs.json', 'r', encoding='utf-8') as f:
+        raw = f.read()
+    records = json.loads(raw)['functions']
+
+    compact = [compact_function(record) for record in records.values()]
+    exact = all(json.dumps(expand(item)) == json.dumps(record) for item, record in zip(compact, records.values()))
+    syntax = {'keywordSyntax': 'unknown', 'evidence': 'none', 'confidence': 0.076}
+
+    tracemalloc.start()
+    loaded = json.loads(raw)['functions']
+    as_dicts = tracemalloc.get_traced_memory()[0]
+    kept = [compact_function(record) for record in loaded.values()]
+    del loaded
+    as_records = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert exact and expand(compact_syntax(syntax)) == syntax and as_records < as_dicts * 0.8 and kept, \
+        f"exact={exact} dicts={as_dicts} records={as_records}"
+    print(f"✓ PASS: records round-trip exactly; {as_dicts / 1e6:.1f} MB of dicts -> "
+          f"{as_records / 1e6:.1f} MB of __slots__ records")
+
+
+def test_tree_disposal():
+    """Test that low-memory runs leave no parse trees behind and lower peak allocation."""
+    results = {}
+    for low_memory in (False, True):
+        gc.collect()
+        gc.disable()  # Only trees freed by reference counting disappear
+        tracemalloc.start()
+        output = _run(low_memory)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        tags = sum(isinstance(obj, Tag) for obj in gc.get_objects())
+        gc.enable()
+        results[low_memory] = (output, peak, tags)
+
+    normal, low = results[False], results[True]
+    assert json.dumps(normal[0]) == json.dumps(low[0]), "outputs differ between modes"
+    print("✓ PASS: low-memory run writes identical outputs")
+
+    assert low[2] == 0 and normal[2] > 0 and low[1] < normal[1], \
+        f"tags {normal[2]} -> {low[2]}, peak {normal[1]} -> {low[1]}"
+    print(f"✓ PASS: no parse trees left ({normal[2]} tags otherwise); peak "
+          f"{normal[1] / 1e6:.1f} MB -> {low[1] / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    print("Testing low-memory mode...\n")
+
+    all_passed = True
+    for test in (test_compact_records, test_tree_disposal):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All low-memory tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test the precompiled matcher registry against the inline heuristics it replaced (no network needed)
+"""
+
+import json
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+import appian_matchers
+from appian_matchers import DEFAULT_MATCHERS, Matchers, docs_version, matchers_for
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+
+SKIP_PATTERNS = ['share', 'linkedin', 'reddit', 'email', 'copy', 'print', 'privacy', 'disclaimer', '©',
+                 'copyright', 'see also', 'related', 'feedback']
+
+
+def load_functions():
+    with open('appian-functions-docs.json', 'r', encoding='utf-8') as f:
+        return json.load(f)['functions']
+
+
+def test_categories_unchanged():
+    """Test that registry categories match every category in the scraped docs."""
+    functions = load_functions()
+    scraper = EnhancedAppianDocScraper()
+    mismatches = [name for name, info in functions.items()
+                  if scraper._categorize_function(name, info['description']) != info['category']]
+    assert not mismatches, f"{len(mismatches)} categories changed, e.g. {mismatches[:5]}"
+    print(f"✓ PASS: {len(functions)} categories reproduced")
+
+
+def test_description_skip():
+    """Test that the folded skip pattern agrees with the term-by-term scan."""
+    texts = [info['description'] for info in load_functions().values()]
+    texts += ['Share this page on LinkedIn', 'Copyright © 2025 Appian', 'See Also: a!map()', 'Plain text.']
+    disagreements = [text for text in texts if DEFAULT_MATCHERS.is_skipped_description(text.lower()) !=
+                     any(pattern in text.lower() for pattern in SKIP_PATTERNS)]
+    assert not disagreements, f"skip pattern disagrees on {disagreements[:3]}"
+    print(f"✓ PASS: skip pattern agrees on {len(texts)} texts")
+
+
+def test_version_overrides():
+    """Test per-version pattern overrides and version lookup from URLs."""
+    appian_matchers.VERSION_PATTERNS['99.1'] = {'related_heading': r'next steps', 'use_case_hint': ()}
+    try:
+        custom = matchers_for('https://docs.appian.com/suite/help/99.1/fnc_array_append.html')
+        checks = [
+            docs_version('https://docs.appian.com/suite/help/25.4/Appian_Functions.html') == '25.4',
+            matchers_for('25.4') is DEFAULT_MATCHERS,
+            custom is matchers_for('99.1'),  # Compiled once per version
+            custom.related_heading.search('Next Steps') is not None,
+            custom.related_heading.search('See also') is None,
+            not custom.has_use_case_hint('use this when'),
+            custom.categorize('a!textField', '') == DEFAULT_MATCHERS.categorize('a!textField', ''),
+            Matchers(overrides={'description_skip': ('cookie',)}).is_skipped_description('cookie banner'),
+        ]
+    finally:
+        del appian_matchers.VERSION_PATTERNS['99.1']
+        appian_matchers._compiled.pop('99.1', None)
+
+    assert all(checks), f"override checks {checks}"
+    print("✓ PASS: version overrides compile separately and fall back to defaults")
+
+
+def test_heading_scan():
+    """Test that one heading scan finds what a find_all per pattern finds, in less time."""
+    paragraphs = ''.join(f'<p>Filler paragraph {k} with <b>bold</b> words.</p>' for k in range(150))
+    soup = BeautifulSoup(
+        '<main><h1>index()</h1><p>Returns the item of an array at the given position, counting from one.</p>'
+        '<h2>Returns</h2><p>Any Type - the item</p><!-- related notes -->' + paragraphs +
+        '<h2>Usage considerations</h2><p>Use this function when you need a single item from a list.</p>'
+        '<h2>Keywords</h2><ul><li>array</li><li>index</li></ul><h2>Examples</h2><pre>index({1}, 1)</pre>'
+        '<h2>See also</h2><ul><li><a>a!forEach()</a></li><li><a>length()</a></li></ul></main>', 'lxml')
+    matchers = DEFAULT_MATCHERS
+
+    def separate():
+        return {kind: soup.find_all(string=getattr(matchers, kind)) for kind in appian_matchers.HEADING_KINDS}
+
+    assert separate() == matchers.scan_headings(soup), \
+        f"heading scan differs: {matchers.scan_headings(soup)} != {separate()}"
+
+    timings = {}
+    for label, scan in (('separate', separate), ('single', lambda: matchers.scan_headings(soup))):
+        best = float('inf')
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(20):
+                scan()
+            best = min(best, (time.perf_counter() - start) * 1000 / 20)
+        timings[label] = best
+
+    assert timings['single'] < timings['separate'], f"single heading scan not faster ({timings})"
+    print(f"✓ PASS: heading scan {timings['separate']:.2f} ms -> {timings['single']:.2f} ms per page")
+
+
+if __name__ == "__main__":
+    print("Testing matcher registry...\n")
+
+    all_passed = True
+    for test in (test_categories_unchanged, test_description_skip, test_version_overrides, test_heading_scan):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All matcher tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
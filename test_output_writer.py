@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test the atomic, deterministic output writer (no network needed)
+"""
+
+import contextlib
+import gzip
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from unittest import mock
+
+from appian_output import canonical_json, write_json
+from appian_pipeline import write_outputs
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, FakeSession
+
+
+def _scrape(workers: int, low_memory: bool):
+    scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+    scraper.session = FakeSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        return scraper.run(workers=workers, low_memory=low_memory, scraped_date='2025-01-01')
+
+
+def _read(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_identical_inputs_identical_bytes():
+    """Test that two scrapes (1 worker, and 4 workers in low-memory mode) write byte-identical files and .gz copies."""
+    with tempfile.TemporaryDirectory() as root:
+        written = []
+        for run, (workers, low_memory) in enumerate(((1, False), (4, True))):
+            files = {name: os.path.join(root, f"{run}-{name}.json") for name in ('docs', 'syntax', 'examples')}
+            written.append(write_outputs(_scrape(workers, low_memory), files, ['gzip']))
+        contents = [[_read(path) for path in paths] for paths in written]
+        docs = json.loads(contents[0][0])
+        assert (len(written[0]) == 6 and contents[0] == contents[1]
+                and gzip.decompress(contents[0][1]) == contents[0][0] and docs['functions']), \
+            f"differing files {[a for a, x, y in zip(written[0], *contents) if x != y]}"
+        print(f"✓ PASS: {len(written[0])} files byte-identical across runs, .gz round-trips")
+
+
+def test_canonical_key_order():
+    """Test that built order is kept (parameters stay positional) and sort_keys canonicalizes unordered maps."""
+    record = {'name': 'index', 'parameters': {'array': {}, 'index': {}, 'default': {}}, 'description': 'ü'}
+    content = canonical_json(record)
+    forward = {'b': 1, 'a': {'d': [3, {'y': 1, 'x': 2}]}}
+    backward = {'a': {'d': [3, {'x': 2, 'y': 1}]}, 'b': 1}
+    assert (json.loads(content) == record and list(json.loads(content)['parameters']) == ['array', 'index', 'default']
+            and content.endswith(b'\n') and 'ü'.encode('utf-8') in content
+            and canonical_json(forward, sort_keys=True) == canonical_json(backward, sort_keys=True)), f"{content!r}"
+    print("✓ PASS: parameters keep positional order, UTF-8 kept, sort_keys orders unordered maps")
+
+
+def test_crash_keeps_previous_file():
+    """Test that a write failing before the rename leaves the old file intact and no temp files behind."""
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, 'appian-functions-docs.json')
+        write_json(path, {'version': 1})
+        failures = 0
+        with mock.patch('os.replace', side_effect=OSError('disk full')):
+            try:
+                write_json(path, {'version': 2})
+            except OSError:
+                failures += 1
+        try:
+            write_json(path, {'version': object()})  # Not serializable: fails before anything is written
+        except TypeError:
+            failures += 1
+        assert (failures == 2 and json.loads(_read(path)) == {'version': 1}
+                and os.listdir(root) == [os.path.basename(path)]), \
+            f"failures={failures} files={os.listdir(root)} content={_read(path)!r}"
+        print("✓ PASS: failed writes left the previous file intact and no temp files")
+
+
+def _writer(args):
+    path, job = args
+    payload = {'job': job, 'functions': {f"f{index}": 'x' * 200 for index in range(2000)}}
+    for _ in range(10):
+        write_json(path, payload)
+
+
+def test_concurrent_writers():
+    """Test that readers only ever see a complete file while 4 processes rewrite it."""
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, 'appian-functions-complete.json')
+        write_json(path, {'job': None})
+        torn = reads = 0
+        with multiprocessing.Pool(4) as pool:
+            pending = pool.map_async(_writer, [(path, job) for job in range(4)])
+            while not pending.ready():
+                reads += 1
+                try:
+                    json.loads(_read(path))
+                except ValueError:
+                    torn += 1
+            pending.get()
+        final = json.loads(_read(path))
+        assert not torn and final['job'] in range(4) and os.listdir(root) == [os.path.basename(path)], \
+            f"torn={torn}/{reads} files={os.listdir(root)}"
+        print(f"✓ PASS: {reads} reads during 40 concurrent rewrites, none saw a partial file")
+
+
+if __name__ == "__main__":
+    print("Testing the output writer\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_identical_inputs_identical_bytes, test_canonical_key_order, test_crash_keeps_previous_file,
+                 test_concurrent_writers):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
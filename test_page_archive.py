@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test the content-addressed raw page archive and replay mode (no network needed)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from appian_archive import PageArchive, page_hash
+from scrape_appian_docs import AppianDocScraper
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, PAGES, FakeSession
+
+
+def test_dedup_across_runs():
+    """Test that identical pages are stored once across runs and round-trip intact."""
+    with tempfile.TemporaryDirectory() as root:
+        first = PageArchive(root, compression='gzip')
+        digest = first.put('https://example.com/a', b'<html>same</html>')
+        first.put('https://example.com/b', b'<html>same</html>')
+        first.save_manifest(source=BASE_URL, run_id='run-1')
+
+        second = PageArchive(root, compression='gzip')
+        second.put('https://example.com/a', b'<html>same</html>')
+        second.put('https://example.com/c', b'<html>new</html>')
+        second.save_manifest(source=BASE_URL, run_id='run-2')
+
+        blobs = sum(len(files) for _, _, files in os.walk(second.blob_dir))
+        pages = dict(second.iter_pages('latest'))
+        assert (blobs == 2 and first.stats['stored'] == 1 and second.stats['reused'] == 1
+                and digest == page_hash(b'<html>same</html>') and second.list_runs() == ['run-1', 'run-2']
+                and pages == {'https://example.com/a': b'<html>same</html>',
+                              'https://example.com/c': b'<html>new</html>'}), \
+            f"blobs={blobs} stats={first.stats} {second.stats} runs={second.list_runs()}"
+        print("✓ PASS: unchanged pages stored once across runs; manifests replay the exact bytes")
+
+
+def test_scrape_then_replay():
+    """Test that both scrapers archive pages and that replay needs no network."""
+    with tempfile.TemporaryDirectory() as root:
+        archive = PageArchive(root, compression='gzip')
+        scraper = EnhancedAppianDocScraper(base_url=BASE_URL, archive=archive)
+        scraper.session = FakeSession()
+        live = scraper.run()
+
+        replay_archive = PageArchive(root)
+        replay_archive.start_replay('latest')
+        replayer = EnhancedAppianDocScraper(base_url=BASE_URL, archive=replay_archive)
+        replayer.session = FakeSession()
+        replayed = replayer.run()
+
+        snippet_archive = PageArchive(root)
+        snippet_archive.start_replay('latest')
+        snippets = AppianDocScraper(base_url=BASE_URL, archive=snippet_archive)
+        snippets.session = FakeSession()
+        snippet_output = snippets.run()
+
+        assert (len(archive.pages) == 2 and replayer.session.fetches == 0 and snippets.session.fetches == 0
+                and replayed['docs']['functions'] == live['docs']['functions']
+                and 'Appian append()' in snippet_output), \
+            f"archived={len(archive.pages)} fetches={replayer.session.fetches}"
+        print("✓ PASS: scrape archives raw pages; replay reproduces outputs without fetching")
+
+        start = time.perf_counter()
+        for _ in range(100):
+            for url in PAGES:
+                replay_archive.lookup(url)
+        per_page_ms = (time.perf_counter() - start) * 1000 / (100 * len(PAGES))
+        assert per_page_ms < 5, f"archive lookups took {per_page_ms:.3f} ms each"
+        print(f"✓ PASS: archived pages served in {per_page_ms:.3f} ms each")
+
+
+if __name__ == "__main__":
+    print("Testing raw page archive...\n")
+
+    all_passed = True
+    for test in (test_dedup_across_runs, test_scrape_then_replay):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All page archive tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
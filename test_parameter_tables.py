@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test header-aware parameter table extraction (no network needed)
+"""
+
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from appian_tables import ParameterTableExtractor, column_mapping, normalize_header
+from scrape_appian_docs import AppianDocScraper
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+
+# UI component layout with a nested table inside a description cell, a second
+# parameter table, and tables that are not parameter tables
+PAGE_HTML = '''<main><h1>a!textField()</h1>
+<table><thead><tr><th>Name</th><th>Keyword</th><th>Types</th><th>Description</th></tr></thead>
+<tbody>
+<tr><td>Label</td><td>label</td><td>Text</td><td>Text to display as the field label.</td></tr>
+<tr><td>Align</td><td>align</td><td>Text</td><td>Determines alignment. Valid values:
+  <table><tr><th>Value</th><th>Meaning</th></tr><tr><td>LEFT</td><td>Left aligned</td></tr></table></td></tr>
+</tbody></table>
+<table><tr><th>Parameter</th><th>Data Type</th><th>Description</th><th>Required?</th></tr>
+<tr><td>saveInto</td><td>List of Save</td><td>Saves the value.</td><td>No</td></tr>
+<tr><td>value</td><td>Text</td><td>Value to display.</td><td>Yes</td></tr></table>
+<table><tr><th>Expression</th><th>Result</th></tr><tr><td>a!textField()</td><td>-</td></tr></table>
+</main>'''
+
+THREE_COLUMN_HTML = '''<main><table><tr><th>Keyword</th><th>Type</th><th>Description</th></tr>
+<tr><td>array</td><td>Any Type Array</td><td>The array to append to. Required.</td></tr>
+<tr><td>value</td><td>Any Type</td><td>The value to append.</td></tr></table></main>'''
+
+# Name/description listing with no type or keyword column (e.g. related functions)
+NAME_DESCRIPTION_HTML = '''<main><table><tr><th>Name</th><th>Description</th></tr>
+<tr><td>a!textField</td><td>Displays a single line of text.</td></tr>
+<tr><td>a!paragraphField</td><td>Displays multiple lines of text.</td></tr></table></main>'''
+
+
+def test_column_mapping():
+    """Test header normalization and signature classification."""
+    cases = [
+        (('name', 'keyword', 'types', 'description'), {'keyword': 1, 'name': 0, 'dataType': 2, 'description': 3}),
+        (('keyword', 'type', 'description'), {'keyword': 0, 'name': 0, 'dataType': 1, 'description': 2}),
+        (('expression', 'result'), None),
+        (('value', 'meaning'), None),
+        (('name', 'description'), None),
+        (('keyword', 'description'), {'keyword': 0, 'name': 0, 'description': 1}),
+    ]
+    assert normalize_header(' Required? ') == 'required' and normalize_header('Data-Type') == 'data type', \
+        "header normalization"
+    for signature, expected in cases:
+        assert column_mapping(signature) == expected, \
+            f"{signature} -> {column_mapping(signature)} (expected {expected})"
+        print(f"✓ PASS: {signature} -> {expected}")
+
+
+def test_page_extraction():
+    """Test that every parameter table is read with its own column layout."""
+    extractor = ParameterTableExtractor()
+    rows = extractor.extract(BeautifulSoup(PAGE_HTML, 'lxml'), 'page.html')
+    keywords = [(row['keyword'], row['dataType'], row['required']) for row in rows]
+    expected = [('label', 'Text', False), ('align', 'Text', False),
+                ('saveInto', 'List of Save', False), ('value', 'Text', True)]
+    assert keywords == expected, f"rows {keywords}"
+    print("✓ PASS: 'Types'/'Data Type' headers mapped; both tables read; nested table rows ignored")
+
+    report = extractor.shape_report()
+    unrecognized = [shape['headers'] for shape in report['unrecognized']]
+    assert (sorted(unrecognized) == [['expression', 'result'], ['value', 'meaning']]
+            and report['unrecognized'][0]['example'] == 'page.html'), f"unrecognized {unrecognized}"
+    print("✓ PASS: unrecognized table shapes reported with an example page")
+
+    extractor = ParameterTableExtractor()
+    rows = extractor.extract(BeautifulSoup(NAME_DESCRIPTION_HTML, 'lxml'), 'related.html')
+    unrecognized = [shape['headers'] for shape in extractor.shape_report()['unrecognized']]
+    assert rows == [] and unrecognized == [['name', 'description']], \
+        f"rows {rows}, unrecognized {unrecognized}"
+    print("✓ PASS: 'Name | Description' table without type or keyword columns is not read as parameters")
+
+    enhanced = EnhancedAppianDocScraper()
+    parameters = enhanced._extract_parameter_details(BeautifulSoup(THREE_COLUMN_HTML, 'lxml'))
+    assert parameters == {
+        'array': {'type': 'array', 'dataType': 'Any Type Array', 'description': 'The array to append to. Required.',
+                  'required': True},
+        'value': {'type': 'value', 'dataType': 'Any Type', 'description': 'The value to append.', 'required': False}
+    }, f"enhanced parameters {parameters}"
+    print("✓ PASS: 3-column records keep the existing docs format")
+
+    basic = AppianDocScraper()._extract_parameters(BeautifulSoup(PAGE_HTML, 'lxml'))
+    assert basic[0] == {'name': 'label', 'type': 'Text', 'description': 'Text to display as the field label.'}, \
+        f"basic parameters {basic[:1]}"
+    print("✓ PASS: snippet scraper uses the keyword (not display name) for 4-column tables")
+
+
+def test_signature_cache():
+    """Test that each shape is classified once across many pages."""
+    extractor = ParameterTableExtractor()
+    soup = BeautifulSoup(PAGE_HTML, 'lxml')
+
+    start = time.perf_counter()
+    for _ in range(200):
+        extractor.extract(soup)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert extractor.cache_misses == 4 and extractor.cache_hits == 200 * 4 - 4, \
+        f"hits={extractor.cache_hits} misses={extractor.cache_misses}"
+    print(f"✓ PASS: 4 shapes classified once over 200 pages ({elapsed_ms / 200:.2f} ms/page)")
+
+
+if __name__ == "__main__":
+    print("Testing parameter table extraction...\n")
+
+    all_passed = True
+    for test in (test_column_mapping, test_page_extraction, test_signature_cache):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All parameter table tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
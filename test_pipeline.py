@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test that the unified pipeline builds every output from one fetch per page (no network needed)
+"""
+
+import json
+import sys
+
+from appian_pipeline import ScrapePipeline
+from scrape_appian_docs import AppianDocScraper, SnippetEmitter
+from scrape_appian_docs_enhanced import DocsEmitter, EnhancedAppianDocScraper
+from tests_support import BASE_URL, PAGES, FakeResponse, FakeSession
+
+FUNCTION_PAGES = {
+    BASE_URL: b'<main><a href="fnc_a.html">first()</a><a href="fnc_b.html">second()</a>'
+              b'<a href="fnc_c.html">third()</a></main>',
+}
+for letter, name in zip('abc', ['first', 'second', 'third']):
+    FUNCTION_PAGES[f'https://docs.appian.com/suite/help/25.4/fnc_{letter}.html'] = (
+        f'<main><h1>{name}()</h1><p>Returns the {name} item of the given array.</p>'
+        f'<table><tr><th>Keyword</th><th>Type</th><th>Description</th></tr>'
+        f'<tr><td>array</td><td>Any Type Array</td><td>The array.</td></tr></table>'
+        f'<h2>Examples</h2><pre>{name}({{1, 2, 3}})</pre></main>').encode()
+
+
+class ThreeFunctionSession(FakeSession):
+    def get(self, url, timeout=None):
+        self.fetches += 1
+        return FakeResponse(FUNCTION_PAGES[url])
+
+
+def test_single_fetch_all_outputs():
+    """Test that one pass produces snippets, docs, syntax and examples."""
+    snippet_scraper = AppianDocScraper(base_url=BASE_URL)
+    docs_scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+    docs_scraper.session = FakeSession()
+    pipeline = ScrapePipeline(BASE_URL, [SnippetEmitter(snippet_scraper), DocsEmitter(docs_scraper)],
+                              fetch=docs_scraper.fetch_page)
+    outputs = pipeline.run()
+
+    assert (sorted(outputs) == ['docs', 'examples', 'snippets', 'syntax']
+            and docs_scraper.session.fetches == len(PAGES)), \
+        f"outputs={sorted(outputs)} fetches={docs_scraper.session.fetches}"
+    print(f"✓ PASS: all 4 outputs from {docs_scraper.session.fetches} fetches ({len(PAGES)} pages)")
+
+    # The front-ends must produce the same artifacts on their own
+    separate_snippets = AppianDocScraper(base_url=BASE_URL)
+    separate_snippets.session = FakeSession()
+    separate_docs = EnhancedAppianDocScraper(base_url=BASE_URL)
+    separate_docs.session = FakeSession()
+    snippets = separate_snippets.run()
+    docs = separate_docs.run()
+
+    assert (snippets == outputs['snippets'] and docs['docs'] == outputs['docs']
+            and docs['syntax'] == outputs['syntax'] and docs['examples'] == outputs['examples']), \
+        f"front-end outputs differ\n  {snippets}\n  {outputs['snippets']}"
+    print("✓ PASS: front-ends produce identical outputs to the combined run")
+
+
+def test_parallel_output_order():
+    """Test that parallel runs write functions in listing order, identical to a sequential run."""
+    results = []
+    for workers in (1, 4):
+        scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+        scraper.session = ThreeFunctionSession()
+        results.append(scraper.run(workers=workers))
+
+    sequential, parallel = results
+    assert (list(parallel['docs']['functions']) == ['first', 'second', 'third']
+            and json.dumps(parallel, sort_keys=False) == json.dumps(sequential, sort_keys=False)), \
+        f"order {list(parallel['docs']['functions'])}"
+    print("✓ PASS: 4-worker run matches the sequential run byte for byte")
+
+
+if __name__ == "__main__":
+    print("Testing unified scrape pipeline...\n")
+
+    all_passed = True
+    for test in (test_single_fetch_all_outputs, test_parallel_output_order):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All pipeline tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
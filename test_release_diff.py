@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test the semantic diff between two scraped releases (no network needed)
+"""
+
+import copy
+import json
+import sys
+import time
+
+from appian_diff import diff_history, diff_releases, functions_to_rebuild, load_release, render_markdown
+
+
+def _next_release(release: dict, version: str) -> dict:
+    """Simulate a new release by editing a copy of the scraped corpus."""
+    new = copy.deepcopy(release)
+    new['version'] = version
+    functions = new['functions']
+
+    functions['a!newFunction'] = {'name': 'a!newFunction', 'description': 'Brand new.', 'parameters': {},
+                                  'returnType': 'Text', 'deprecated': False}
+    del functions['a!formLayoutColumns']
+    functions['append']['deprecated'] = True
+    functions['append']['parameters']['value']['dataType'] = 'Any Type'
+    functions['a!forEach']['parameters']['sortBy'] = {'type': 'sortBy', 'dataType': 'Text',
+                                                      'description': 'Sort order.', 'required': False}
+    functions['a!forEach']['returnType'] = 'Any Type Array'
+    new['syntax'] = dict(new['syntax'], length={'keywordSyntax': True, 'evidence': 'keywords_section'})
+    return new
+
+
+def test_diff_releases():
+    """Test that each kind of change is reported."""
+    old = load_release('appian-functions-docs.json', 'appian-function-syntax.json')
+    new = _next_release(old, '26.0')
+    changelog = diff_releases(old, new)
+    checks = [
+        ('added function', changelog['added'] == ['a!newFunction']),
+        ('removed function', changelog['removed'] == ['a!formLayoutColumns']),
+        ('deprecated function', changelog['deprecated'] == ['append']),
+        ('parameter type change',
+         changelog['changed'].get('append', {}).get('parameters', {}).get('changed', {}).get('value') ==
+         {'dataType': {'old': 'Any Type or Any Type Array', 'new': 'Any Type'}}),
+        ('new parameter', changelog['changed'].get('a!forEach', {}).get('parameters', {}).get('added') == ['sortBy']),
+        ('return type change', 'returnType' in changelog['changed'].get('a!forEach', {})),
+        ('keyword syntax change', changelog['changed'].get('length', {}).get('keywordSyntax') ==
+         {'old': False, 'new': True}),
+        ('unchanged count', changelog['unchanged'] == len(old['functions']) - 4),
+        ('rebuild list', functions_to_rebuild(changelog) == ['a!forEach', 'a!newFunction', 'append', 'length']),
+    ]
+    summary = json.dumps({k: v for k, v in changelog.items() if k != 'changed'}, indent=2)
+    for label, passed in checks:
+        assert passed, f"{label}\n{summary}"
+        print(f"✓ PASS: {label}")
+
+
+def test_fingerprint_only_changes():
+    """Test that changes outside the compared fields are still reported and rebuilt."""
+    old = load_release('appian-functions-docs.json', 'appian-function-syntax.json')
+    new = copy.deepcopy(old)
+    new['functions']['now']['returnDescription'] = 'The current date and time.'
+    new['functions']['today']['useCase'] = 'Stamping records with the current date.'
+    new['functions']['left']['parameters']['num_chars']['description'] = 'Characters to keep.'
+    new['syntax']['sum'] = dict(new['syntax']['sum'], evidence='keywords_section', confidence=0.9)
+    new['functions']['pi']['url'] = 'https://docs.appian.com/pi'  # A field no comparison covers
+    changelog = diff_releases(old, new)
+    changed = changelog['changed']
+    assert (changed.get('now') == {'returnDescription': True} and changed.get('today') == {'useCase': True}
+            and changed.get('left') == {'parameters': {'described': ['num_chars']}}
+            and changed.get('sum') == {'syntaxEvidence': True} and changed.get('pi') == {'other': True}
+            and functions_to_rebuild(changelog) == ['left', 'now', 'pi', 'sum', 'today']
+            and changelog['unchanged'] == len(old['functions']) - 5), f"changed: {json.dumps(changed)}"
+    markdown = render_markdown([changelog])
+    assert 'Parameter descriptions updated: `num_chars`' in markdown and 'Return description updated' in markdown, \
+        markdown
+    print("✓ PASS: return description, use case, parameter description, syntax evidence and other fields rebuilt")
+
+
+def test_history_and_markdown():
+    """Test a multi-release history runs quickly and renders Markdown."""
+    first = load_release('appian-functions-docs.json', 'appian-function-syntax.json')
+    second = _next_release(first, '26.0')
+    third = copy.deepcopy(second)
+    third['version'] = '26.1'
+
+    start = time.perf_counter()
+    changelogs = diff_history([first, second, third])
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    markdown = render_markdown(changelogs)
+
+    assert (len(changelogs) == 2 and not changelogs[1]['changed'] and '## 25.4 → 26.0' in markdown
+            and '`value` dataType' in markdown and elapsed_ms < 2000), \
+        f"history ({elapsed_ms:.0f} ms):\n{markdown[:500]}"
+    print(f"✓ PASS: 3-release history diffed in {elapsed_ms:.0f} ms and rendered as Markdown")
+
+
+if __name__ == "__main__":
+    print("Testing release diff...\n")
+
+    all_passed = True
+    for test in (test_diff_releases, test_fingerprint_only_changes, test_history_and_markdown):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All release diff tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test the targeted repair of broken records in existing outputs (no network needed)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from appian_repair import repair, select_repairs
+from tests_support import BASE_URL, PAGES, FakeResponse
+
+LENGTH_URL = 'https://docs.appian.com/suite/help/25.4/fnc_array_length.html'
+APPEND_URL = 'https://docs.appian.com/suite/help/25.4/fnc_array_append.html'
+SITE = dict(PAGES, **{
+    BASE_URL: b'<main><p><a href="fnc_array_length.html">length()</a> Returns the number of items.</p>'
+              b'<p><a href="fnc_array_append.html">append()</a> Appends values to an array.</p></main>',
+    LENGTH_URL: b'<main><h1>length()</h1><p>Returns the number of items in an array.</p></main>',
+})
+
+DOCS = {'metadata': {'source': BASE_URL}, 'functions': {
+    'length': {'name': 'length', 'description': 'Returns the number of items in an array.',
+               'parameters': {'array': {'type': 'Array'}}, 'returnType': 'Integer', 'examples': [],
+               'category': 'Array Functions'},
+    'append': {'name': 'append', 'description': '', 'parameters': {}, 'returnType': '', 'examples': [],
+               'category': 'Other'},
+}}
+SYNTAX = {'metadata': {}, 'functions': {
+    'length': {'keywordSyntax': 'unknown', 'evidence': 'none'},
+    'append': {'keywordSyntax': 'unknown', 'evidence': 'fetch_error'},
+}}
+SNIPPETS = {
+    'Appian length()': {'prefix': ['length()', 'length'], 'body': ['length(', '  array: ${1:array (Array)}', ')'],
+                        'description': 'length(): Returns the number of items in an array.'},
+    'Appian append()': {'prefix': ['append()', 'append'], 'body': ['append(', '  ${1:/* parameters */}', ')'],
+                        'description': 'append(): append()'},
+}
+EXAMPLES = {'metadata': {}, 'examples': {}, 'functions': {'length': []}}
+
+
+class DocsSiteSession:
+    """Serves SITE, records every URL requested and fails the first `failures[url]` requests for a URL."""
+    def __init__(self, failures=None):
+        self.urls = []
+        self.failures = dict(failures or {})
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        if self.failures.get(url, 0) > 0:
+            self.failures[url] -= 1
+            raise ConnectionError(f"connection reset: {url}")
+        return FakeResponse(SITE[url])
+
+
+def _write_outputs(directory: str):
+    files = {}
+    for name, data in (('snippets', SNIPPETS), ('docs', DOCS), ('syntax', SYNTAX), ('examples', EXAMPLES)):
+        files[name] = os.path.join(directory, f"{name}.json")
+        with open(files[name], 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    return files
+
+
+def _read(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_selection():
+    """Test that only fetch errors, empty descriptions and empty parameters are selected."""
+    selected = select_repairs(SNIPPETS, DOCS, SYNTAX)
+    only_failures = select_repairs(SNIPPETS, DOCS, SYNTAX, checks=['fetch_error'])
+    assert (selected == {'append': ['fetch_error', 'empty_description', 'no_parameters']}
+            and list(only_failures) == ['append']), f"selected={selected} only_failures={only_failures}"
+    print("✓ PASS: broken records selected, healthy ones left alone")
+
+
+def test_patch_in_place():
+    """Test that only the broken page is re-fetched and its records are patched where they stand."""
+    with tempfile.TemporaryDirectory() as directory:
+        files = _write_outputs(directory)
+        session = DocsSiteSession()
+        report = repair(files, session=session, workers=2, retry_delay=0)
+        docs, syntax = _read(files['docs']), _read(files['syntax'])
+        snippets, examples = _read(files['snippets']), _read(files['examples'])
+
+    append = docs['functions']['append']
+    assert (session.urls == [BASE_URL, APPEND_URL] and report['fetches'] == 2 and report['repaired'] == ['append']
+            and list(docs['functions']) == ['length', 'append']
+            and docs['functions']['length'] == DOCS['functions']['length']
+            and append['description'].startswith('Appends a value')
+            and syntax['functions']['append']['evidence'] != 'fetch_error'
+            and 'Appends values' in snippets['Appian append()']['description']
+            and snippets['Appian length()'] == SNIPPETS['Appian length()']
+            and len(examples['functions']['append']) == 1
+            and list(examples['examples'].values())[0]['functions'] == ['append']), \
+        f"urls={session.urls} report={report} docs={docs} examples={examples}"
+    print("✓ PASS: 1 page re-fetched (+1 discovery fetch); record patched in place, others untouched")
+
+
+def test_retries_and_persistent_failures():
+    """Test that transient failures are retried and pages that keep failing keep their old record."""
+    with tempfile.TemporaryDirectory() as directory:
+        files = _write_outputs(directory)
+        flaky = DocsSiteSession(failures={APPEND_URL: 2})
+        recovered = repair(files, session=flaky, retries=3, retry_delay=0)
+
+        files = _write_outputs(directory)
+        down = DocsSiteSession(failures={APPEND_URL: 10})
+        failed = repair(files, session=down, retries=2, retry_delay=0)
+        docs = _read(files['docs'])
+
+    assert (recovered['repaired'] == ['append'] and flaky.urls.count(APPEND_URL) == 3 and recovered['fetches'] == 4
+            and failed['repaired'] == [] and failed['stillFailing'] == ['append']
+            and down.urls.count(APPEND_URL) == 3 and docs == DOCS and failed['written'] == []), \
+        f"recovered={recovered} flaky={flaky.urls} failed={failed} down={down.urls}"
+    print("✓ PASS: transient failures retried; a page that stays down keeps its old record")
+
+
+if __name__ == "__main__":
+    print("Testing targeted repair of broken records\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_selection, test_patch_in_place, test_retries_and_persistent_failures):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test the longest-first work-stealing scheduler (no network needed)
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from appian_scheduler import WorkStealingScheduler, estimate_costs, load_costs, save_costs
+
+
+def test_plan_longest_first():
+    """Test that heavy tasks are dealt first and loads are balanced."""
+    costs = {'a!gridField': 8.0, 'a!queryRecordType': 6.0, 'now': 1.0, 'today': 1.0, 'pi': 1.0, 'len': 1.0}
+    queues = WorkStealingScheduler(workers=2).plan(costs)
+    heads = sorted(queue[0] for queue in queues)
+    loads = sorted(sum(costs[key] for key in queue) for queue in queues)
+    assert heads == ['a!gridField', 'a!queryRecordType'] and loads == [9.0, 9.0], \
+        f"queues {[list(queue) for queue in queues]}"
+    print(f"✓ PASS: heavy pages start first on separate workers; loads {loads}")
+
+
+def test_makespan_with_stale_costs():
+    """Test that stealing keeps the run near total work / workers even when estimates are wrong."""
+    # History says every page costs the same, so the tasks are dealt round robin and both
+    # heavy pages (first and fifth) land on one worker: only stealing can run them side by side
+    actual = {'a!gridField': 0.06}
+    actual.update({f"page{i}": 0.002 for i in range(3)})
+    actual['a!queryRecordType'] = 0.05
+    actual.update({f"page{i}": 0.002 for i in range(3, 40)})
+    estimates = estimate_costs(list(actual), {})
+
+    scheduler = WorkStealingScheduler(workers=4)
+    stats = scheduler.run(estimates, lambda key: time.sleep(actual[key]))
+    # Measured work, not the nominal sleeps: a loaded host oversleeps every short task
+    ideal = max(stats['ideal'], max(actual.values()))
+    assert stats['tasks'] == len(actual) and stats['steals'] > 0 and stats['makespan'] < ideal * 1.6, \
+        f"stats {stats} (ideal {ideal:.3f}s)"
+    print(f"✓ PASS: makespan {stats['makespan'] * 1000:.0f} ms vs ideal {ideal * 1000:.0f} ms "
+          f"({stats['steals']} steals)")
+
+
+def test_makespan_with_history():
+    """Test that with last run's costs the heavy pages start first and the tail disappears."""
+    actual = {f"page{i}": 0.002 for i in range(40)}
+    actual['a!gridField'] = 0.06
+    actual['a!queryRecordType'] = 0.05
+
+    stats = WorkStealingScheduler(workers=4).run(dict(actual), lambda key: time.sleep(actual[key]))
+    ideal = max(sum(actual.values()) / 4, max(actual.values()))
+    assert stats['makespan'] < ideal * 1.3, f"stats {stats} (ideal {ideal:.3f}s)"
+    print(f"✓ PASS: with cost history makespan {stats['makespan'] * 1000:.0f} ms vs ideal {ideal * 1000:.0f} ms")
+
+
+def test_cost_history_round_trip():
+    """Test that measured costs are saved and reused to order the next run."""
+    with tempfile.TemporaryDirectory() as directory:
+        stats_file = os.path.join(directory, 'stats.json')
+        save_costs(stats_file, {'https://x/grid': 2.5, 'https://x/now': 0.1}, {'workers': 4})
+        save_costs(stats_file, {'https://x/now': 0.2}, {'workers': 4})
+        costs = load_costs(stats_file)
+        estimated = estimate_costs(['https://x/grid', 'https://x/now', 'https://x/new'], costs)
+        assert costs == {'https://x/grid': 2.5, 'https://x/now': 0.2} and estimated['https://x/new'] == 1.35, \
+            f"costs {costs} estimated {estimated}"
+        print("✓ PASS: per-URL costs merge across runs; unseen pages get the mean")
+
+
+def _save_job(args):
+    stats_file, job = args
+    for index in range(10):
+        save_costs(stats_file, {f"https://x/{job}/{index}": 0.1}, {'workers': 1})
+
+
+def test_parallel_jobs_keep_all_costs():
+    """Test that jobs saving costs to the same stats file at once never drop each other's pages."""
+    with tempfile.TemporaryDirectory() as directory:
+        stats_file = os.path.join(directory, 'stats.json')
+        with multiprocessing.Pool(4) as pool:
+            pool.map(_save_job, [(stats_file, job) for job in range(4)])
+        costs = load_costs(stats_file)
+        assert len(costs) == 40, f"{len(costs)} of 40 pages kept"
+        print("✓ PASS: 4 parallel jobs merged all 40 page costs into one stats file")
+
+
+if __name__ == "__main__":
+    print("Testing work-stealing scheduler...\n")
+
+    all_passed = True
+    for test in (test_plan_longest_first, test_makespan_with_stale_costs, test_makespan_with_history,
+                 test_cost_history_round_trip, test_parallel_jobs_keep_all_costs):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All scheduler tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test the heading-indexed section map and the extractors that read from it (no network needed)
+"""
+
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from appian_sections import SectionMap
+from scrape_appian_docs import AppianDocScraper
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+
+# "Returns" and "example" both appear in prose before their sections
+PAGE_HTML = '''<main><h1>index()</h1>
+<p>Returns the value of an array at the given index. For example, index of a list of customers.</p>
+<pre>a!queryRecordType(recordType: "Customer")</pre>
+<h2>Syntax</h2><pre><code>index( data, index, default )</code></pre>
+<h2>Returns</h2><p>Any Type - the value at the index</p>
+<h2>Usage considerations</h2><p>Use index() when a missing index should fall back to a default value.</p>
+<h3>Using index with records</h3><p>Record fields work the same way.</p>
+<h2>Examples</h2>
+<pre>a!localVariables(local!x: {10, 20}, index(local!x, 2))</pre>
+<h2>See also</h2><ul><li><a>a!forEach()</a></li><li><a>property()</a></li></ul>
+</main>'''
+
+
+def test_section_ranges():
+    """Test heading levels, kinds and the elements each section covers."""
+    sections = SectionMap(BeautifulSoup(PAGE_HTML, 'lxml').find('main'))
+    usage = sections.first('usage')
+    checks = [
+        [section['title'] for section in sections.outline()] ==
+        ['index()', 'Syntax', 'Returns', 'Usage considerations', 'Using index with records', 'Examples', 'See also'],
+        sections.get('see ALSO') is sections.first('related'),
+        [block.name for block in usage.blocks()] == ['p', 'h3', 'p'],  # Subsections belong to their parent
+        [block.name for block in sections.get('Using index with records').blocks()] == ['p'],
+        [pre.get_text() for pre in sections.first('examples').find_all('pre')] ==
+        ['a!localVariables(local!x: {10, 20}, index(local!x, 2))'],
+        sections.of_kind('keywords') == [],
+    ]
+    assert all(checks), f"section checks {checks}"
+    print("✓ PASS: sections cover their heading's range, including subsections")
+
+
+def test_prose_mentions_ignored():
+    """Test that extractors read real sections instead of the first prose match."""
+    main_content = BeautifulSoup(PAGE_HTML, 'lxml').find('main')
+    scraper = EnhancedAppianDocScraper()
+    details = scraper._build_function_details({'name': 'index', 'url': ''}, main_content)
+    examples = AppianDocScraper()._extract_examples(BeautifulSoup(PAGE_HTML, 'lxml'))
+
+    assert (details['returnType'], details['returnDescription']) == ('Any Type', 'the value at the index'), \
+        f"return type {details['returnType']!r} / {details['returnDescription']!r}"
+    print("✓ PASS: return type read from the Returns section, not the description")
+
+    assert examples == ['a!localVariables(local!x: {10, 20}, index(local!x, 2))'], f"snippet examples {examples}"
+    print("✓ PASS: snippet examples come from the Examples section only")
+
+    assert details['useCase'].startswith('Use index()') and details['relatedFunctions'] == ['a!forEach', 'property'], \
+        f"use case {details['useCase']!r}, related {details['relatedFunctions']}"
+    print("✓ PASS: use case and related functions found by section kind")
+
+
+def test_fallback_without_headings():
+    """Test pages that label sections with bold text instead of headings."""
+    main_content = BeautifulSoup('<main><h1>now()</h1><p><strong>Returns</strong></p><p>DateTime - the current time</p>'
+                                 '<p><b>Keywords:</b></p><ul><li>time</li></ul></main>', 'lxml').find('main')
+    scraper = EnhancedAppianDocScraper()
+    sections = SectionMap(main_content, scraper.matchers)
+    return_info = scraper._extract_return_type(main_content, sections)
+    keywords = scraper._extract_keywords_section(main_content, sections)
+
+    assert return_info == {'type': 'DateTime', 'description': 'the current time'} and keywords == ['time'], \
+        f"fallback return {return_info}, keywords {keywords}"
+    print("✓ PASS: labelled text is used when the page has no matching heading")
+
+
+def test_shared_map_speed():
+    """Benchmark one shared section map against each extractor indexing the page itself."""
+    page = PAGE_HTML.replace('</main>', ''.join(f'<p>Filler paragraph {k} with <b>bold</b> words.</p>'
+                                                for k in range(150)) + '</main>')
+    main_content = BeautifulSoup(page, 'lxml').find('main')
+    scraper = EnhancedAppianDocScraper()
+
+    def extract(sections_for):
+        return (scraper._extract_return_type(main_content, sections_for()),
+                scraper._extract_use_case(main_content, '', sections_for()),
+                scraper._extract_related_functions(main_content, sections_for()),
+                scraper._extract_keywords_section(main_content, sections_for()),
+                len(scraper._extract_structured_examples(main_content, sections_for())))
+
+    def separate():
+        return extract(lambda: None)
+
+    def shared():
+        sections = SectionMap(main_content, scraper.matchers)
+        return extract(lambda: sections)
+
+    assert separate() == shared(), f"shared map changes results: {shared()} != {separate()}"
+
+    timings = {}
+    for label, run in (('separate', separate), ('shared', shared)):
+        best = float('inf')
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(10):
+                run()
+            best = min(best, (time.perf_counter() - start) * 1000 / 10)
+        timings[label] = best
+
+    assert timings['shared'] < timings['separate'], f"shared section map not faster ({timings})"
+    print(f"✓ PASS: section lookups {timings['separate']:.2f} ms -> {timings['shared']:.2f} ms per page")
+
+
+if __name__ == "__main__":
+    print("Testing section map...\n")
+
+    all_passed = True
+    for test in (test_section_ranges, test_prose_mentions_ignored, test_fallback_without_headings,
+                 test_shared_map_speed):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All section map tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
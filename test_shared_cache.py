@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test the fetch cache shared by concurrent scraper processes (no network needed)
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from appian_fetch_cache import SharedFetchCache
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, PAGES, FakeSession
+
+URLS = [f"https://docs.appian.com/suite/help/25.4/fnc_{index}.html" for index in range(6)]
+
+
+def _slow_download(log_path: str, url: str) -> bytes:
+    """Simulated page download: logs the URL (one line per network request) and takes 100 ms."""
+    with open(log_path, 'a', encoding='utf-8') as f:
+        f.write(url + '\n')
+    time.sleep(0.1)
+    return f"<main>{url}</main>".encode('utf-8')
+
+
+def _job(args):
+    """One scrape job: fetch every URL through the shared cache (runs in its own process)."""
+    root, log_path, threads = args
+    cache = SharedFetchCache(root)
+    results = {}
+
+    def work(urls):
+        for url in urls:
+            results[url] = cache.fetch(url, lambda: _slow_download(log_path, url))
+
+    workers = [threading.Thread(target=work, args=(URLS[index::threads],)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results, cache.stats
+
+
+def _downloads(log_path: str):
+    if not os.path.exists(log_path):
+        return []
+    with open(log_path, 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_parallel_jobs_download_once():
+    """Test that 4 concurrent processes fetching the same pages download each page once."""
+    with tempfile.TemporaryDirectory() as root:
+        log_path = os.path.join(root, 'downloads.log')
+        with multiprocessing.Pool(4) as pool:
+            jobs = pool.map(_job, [(os.path.join(root, 'cache'), log_path, 3)] * 4)
+        downloads = _downloads(log_path)
+        expected = {url: f"<main>{url}</main>".encode('utf-8') for url in URLS}
+        waited = sum(stats['coalesced'] for _, stats in jobs)
+        assert sorted(downloads) == sorted(URLS) and all(results == expected for results, _ in jobs), \
+            f"downloads={len(downloads)} stats={[stats for _, stats in jobs]}"
+        print(f"✓ PASS: 4 jobs x {len(URLS)} pages -> {len(downloads)} downloads ({waited} fetches waited "
+              f"for another job's download)")
+
+
+def test_failures_and_expiry():
+    """Test that failed downloads are not cached and expired pages are downloaded again."""
+    with tempfile.TemporaryDirectory() as root:
+        cache = SharedFetchCache(root, ttl=0.2)
+        try:
+            cache.fetch(URLS[0], lambda: (_ for _ in ()).throw(IOError('503')))
+            failed_cached = True
+        except IOError:
+            failed_cached = cache.lookup(URLS[0]) is not None
+        calls = []
+        first = cache.fetch(URLS[0], lambda: calls.append(1) or b'v1')
+        cached = cache.fetch(URLS[0], lambda: calls.append(2) or b'v2')
+        time.sleep(0.3)
+        expired = cache.fetch(URLS[0], lambda: calls.append(3) or b'v3')
+        assert not failed_cached and (first, cached, expired) == (b'v1', b'v1', b'v3') and calls == [1, 3], \
+            f"failed_cached={failed_cached} values={(first, cached, expired)} calls={calls}"
+        print("✓ PASS: errors not cached; pages older than the TTL re-downloaded")
+
+
+def _throttled_job(args):
+    root, offset = args
+    cache = SharedFetchCache(root, rate_limit=20)
+    starts = []
+    for url in URLS[offset::2]:
+        cache.fetch(url, lambda: starts.append(time.time()) or b'page')
+    return starts
+
+
+def test_rate_limit_across_processes():
+    """Test that the host-wide rate limit spaces request starts across processes."""
+    with tempfile.TemporaryDirectory() as root:
+        with multiprocessing.Pool(2) as pool:
+            starts = sorted(start for job in pool.map(_throttled_job, [(root, 0), (root, 1)]) for start in job)
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        # Start slots are 50 ms apart; a single gap can shrink by how late the sleep before it woke
+        mean = (starts[-1] - starts[0]) / (len(starts) - 1)
+        assert len(starts) == len(URLS) and mean >= 0.045 and min(gaps) >= 0.025, f"gaps={gaps}"
+        print(f"✓ PASS: {len(starts)} downloads from 2 processes {mean * 1000:.0f} ms apart on average, "
+              f"at least {min(gaps) * 1000:.0f} ms (20/s)")
+
+
+def test_scraper_through_shared_cache():
+    """Test that a second scraper on the same cache makes no network requests."""
+    with tempfile.TemporaryDirectory() as root:
+        sessions = []
+        for _ in range(2):
+            scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+            sessions.append(FakeSession())
+            scraper.session = SharedFetchCache(root).session(sessions[-1])
+            docs = scraper.run()['docs']
+        assert sessions[0].fetches == len(PAGES) and sessions[1].fetches == 0 and 'append' in docs['functions'], \
+            f"fetches={[session.fetches for session in sessions]}"
+        print(f"✓ PASS: first job fetched {sessions[0].fetches} pages, second job none")
+
+
+if __name__ == "__main__":
+    print("Testing the shared fetch cache\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_parallel_jobs_download_once, test_failures_and_expiry, test_rate_limit_across_processes,
+                 test_scraper_through_shared_cache):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
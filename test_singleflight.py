@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test request coalescing, the parsed-page LRU and duplicate download stats (no network needed)
+"""
+
+import sys
+import threading
+import time
+
+from appian_pipeline import ScrapePipeline
+from appian_singleflight import SingleFlight
+from scrape_appian_docs import AppianDocScraper, SnippetEmitter
+from scrape_appian_docs_enhanced import DocsEmitter, EnhancedAppianDocScraper
+from tests_support import BASE_URL, PAGES, FakeSession
+
+URL = 'https://docs.appian.com/suite/help/25.4/fnc_array_append.html'
+
+
+class CountingFetch:
+    """Slow fake page fetch that records every download."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str):
+        with self._lock:
+            self.urls.append(url)
+        time.sleep(self.delay)
+        return None if self.fail else {'url': url}
+
+
+def test_concurrent_requests_share_one_download():
+    """Test that concurrent fetches of one URL (in different spellings) share a single download."""
+    fetch = CountingFetch(delay=0.1)
+    flight = SingleFlight(fetch)
+    spellings = [URL, URL + '#examples', URL.replace('docs.appian.com', 'DOCS.appian.com'), URL + '?lang=en']
+    results = [None] * 8
+
+    def request(index):
+        results[index] = flight(spellings[index % len(spellings)])
+
+    threads = [threading.Thread(target=request, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(fetch.urls) == 1 and all(result is results[0] for result in results) and flight.stats['shared'] == 7, \
+        f"downloads={fetch.urls} stats={flight.stats}"
+    print("✓ PASS: 8 concurrent requests -> 1 download, 7 shared the in-flight result")
+
+
+def test_lru_and_duplicates():
+    """Test that repeats are served from the LRU and an evicted page counts as a duplicate download."""
+    fetch = CountingFetch()
+    flight = SingleFlight(fetch, max_pages=2)
+    for url in ('https://x/a.html', 'https://x/b.html', 'https://x/a.html', 'https://x/c.html', 'https://x/b.html'):
+        flight(url)
+    stats = flight.summary()
+    assert (fetch.urls == ['https://x/a.html', 'https://x/b.html', 'https://x/c.html', 'https://x/b.html']
+            and stats['cacheHits'] == 1 and stats['duplicateDownloads'] == 1 and stats['cachedPages'] == 2), \
+        f"downloads={fetch.urls} stats={stats}"
+    print("✓ PASS: repeat served from the LRU; re-download after eviction counted as a duplicate")
+
+
+def test_failures_not_cached():
+    """Test that a failed fetch is shared by its waiters but retried by the next request."""
+    fetch = CountingFetch(fail=True)
+    flight = SingleFlight(fetch)
+    first, second = flight(URL), flight(URL)
+    assert first is None and second is None and len(fetch.urls) == 2 and flight.stats['failed'] == 2, \
+        f"downloads={fetch.urls} stats={flight.stats}"
+    print("✓ PASS: failed fetches are not cached, so retries reach the network")
+
+
+def test_pipeline_run_stats():
+    """Test that a pipeline run reports zero duplicate downloads and serves repeats from the LRU."""
+    snippet_scraper = AppianDocScraper(base_url=BASE_URL)
+    docs_scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+    docs_scraper.session = FakeSession()
+    pipeline = ScrapePipeline(BASE_URL, [SnippetEmitter(snippet_scraper), DocsEmitter(docs_scraper)],
+                              fetch=docs_scraper.fetch_page, fetch_raw=docs_scraper.fetch_raw, workers=2)
+    pipeline.run()
+    stats = pipeline.run_stats['fetch']
+    repeat = pipeline.fetch(URL + '#syntax')
+    assert (stats['duplicateDownloads'] == 0 and stats['downloads'] == len(PAGES) and repeat is not None
+            and docs_scraper.session.fetches == len(PAGES)), f"stats={stats} fetches={docs_scraper.session.fetches}"
+    print(f"✓ PASS: run stats {stats}; a later request for a scraped page needed no download")
+
+
+if __name__ == "__main__":
+    print("Testing request coalescing\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_concurrent_requests_share_one_download, test_lru_and_duplicates, test_failures_not_cached,
+                 test_pipeline_run_stats):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite corpus store and its query helpers (no network needed)
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from appian_query import find_functions, get_function, get_syntax, open_store, referenced_by, search
+from appian_store import CorpusStore, build_store, connect
+from appian_syntax import keyword_confidence
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, FakeSession
+
+
+def test_round_trip_and_queries():
+    """Test that stored records match the JSON and that indexed filters agree with a JSON walk."""
+    with open('appian-functions-docs.json', 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+    with open('appian-function-syntax.json', 'r', encoding='utf-8') as f:
+        syntax = json.load(f)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'functions.db')
+        start = time.perf_counter()
+        written = build_store(docs, syntax, path)
+        build_ms = (time.perf_counter() - start) * 1000
+        conn = open_store(path)
+
+        record = get_function(conn, 'append')
+        expected = dict(docs['functions']['append'])
+        expected['relatedFunctions'] = list(dict.fromkeys(expected.get('relatedFunctions', [])))
+        assert written == len(docs['functions']) and record == expected, f"written={written} record={record}"
+        print(f"✓ PASS: {written} functions stored in {build_ms:.0f} ms; records round-trip")
+
+        stored = get_syntax(conn, 'a!forEach')
+        assert stored is not None and {key: stored[key] for key in ('keywordSyntax', 'evidence')} == \
+            {key: syntax['functions']['a!forEach'][key] for key in ('keywordSyntax', 'evidence')}, f"syntax {stored}"
+        print("✓ PASS: syntax evidence stored per function")
+
+        walked = sorted(name for name, info in docs['functions'].items()
+                        if info.get('category') == 'Text Functions' and not info.get('deprecated'))
+        assert find_functions(conn, category='Text Functions', deprecated=False) == walked, \
+            "category/deprecation filter"
+        print(f"✓ PASS: indexed filter matches JSON walk ({len(walked)} functions)")
+
+        dates = find_functions(conn, parameter_type='Date')
+        plan = ' '.join(row[3] for row in conn.execute(
+            'EXPLAIN QUERY PLAN SELECT name FROM functions WHERE category = ?', ('x',)))
+        assert dates and 'idx_functions_category' in plan, f"dates={dates[:3]} plan={plan}"
+        print("✓ PASS: parameter type filter and category index in use")
+
+        results = search(conn, 'time zone')
+        related = referenced_by(conn, docs['functions']['append']['relatedFunctions'][0]) \
+            if docs['functions']['append'].get('relatedFunctions') else ['append']
+        assert results and 'append' in related, f"search={results} related={related}"
+        print(f"✓ PASS: full-text search ({results[0]} first) and reverse related lookups")
+        conn.close()
+
+
+def test_syntax_confidence():
+    """Test that keyword syntax confidences are stored (scored when the syntax map predates them) and queryable."""
+    with open('appian-functions-docs.json', 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+    with open('appian-function-syntax.json', 'r', encoding='utf-8') as f:
+        syntax = json.load(f)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'functions.db')
+        build_store(docs, syntax, path)
+        conn = open_store(path)
+        expected = {}
+        for name, record in docs['functions'].items():
+            if name in syntax['functions']:
+                expected[name] = syntax['functions'][name].get('confidence') or keyword_confidence(
+                    name, record['parameters'], record['examples'], syntax['functions'][name]['evidence'])
+        confident = find_functions(conn, min_confidence=0.8, keyword_syntax='true')
+        stored = get_syntax(conn, 'a!forEach')
+        assert (stored['confidence'] == expected['a!forEach'] and confident
+                and set(confident) <= {name for name, value in expected.items() if value >= 0.8}), \
+            f"stored={stored} confident={confident[:5]}"
+        conn.close()
+
+        # A store written before the confidence column gains it when reopened
+        old_path = os.path.join(directory, 'old.db')
+        old = sqlite3.connect(old_path)
+        old.execute('CREATE TABLE syntax (functionId INTEGER PRIMARY KEY, keywordSyntax TEXT NOT NULL, evidence TEXT)')
+        old.close()
+        columns = [row['name'] for row in connect(old_path).execute('PRAGMA table_info(syntax)')]
+        assert columns[-1] == 'confidence', f"columns={columns}"
+        print(f"✓ PASS: confidence stored per function; {len(confident)} confident keyword-syntax functions; "
+              f"old stores migrated")
+
+
+def test_scraper_writes_store():
+    """Test that the scraper writes the store in batches during a run."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'functions.db')
+        store = CorpusStore(path, batch_size=1)
+        scraper = EnhancedAppianDocScraper(base_url=BASE_URL, store=store)
+        scraper.session = FakeSession()
+        result = scraper.run()
+        store.close()
+
+        conn = open_store(path)
+        record = get_function(conn, 'append')
+        conn.close()
+        assert record == result['docs']['functions']['append'], f"stored {record}"
+        print("✓ PASS: scraper run writes matching records to SQLite")
+
+
+if __name__ == "__main__":
+    print("Testing SQLite corpus store...\n")
+
+    all_passed = True
+    for test in (test_round_trip_and_queries, test_syntax_confidence, test_scraper_writes_store):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All SQLite store tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold start of the read-only commands and check that requests/bs4/lxml
+load only when a fetch or parse actually runs (no network needed)
+"""
+
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ('requests', 'bs4', 'lxml', 'urllib3')
+# Importing any of these must not pull in a heavy dependency
+LIGHT_MODULES = ['appian_cli', 'appian_validate', 'appian_index', 'appian_diff', 'appian_syntax', 'appian_query',
+                 'appian_lint', 'appian_lsp', 'appian_repair', 'appian_pipeline', 'scrape_appian_docs',
+                 'scrape_appian_docs_enhanced']
+# Read-only commands and the cold start target
+COMMANDS = [
+    ['appian_cli.py', '--help'],
+    ['appian_cli.py', 'validate', '--help'],
+    ['appian_cli.py', 'index', '--help'],
+    ['appian_cli.py', 'scrape', '--help'],
+    ['appian_repair.py', '--help'],
+    ['scrape_appian_docs.py', '--help'],
+]
+TARGET_MS = 100
+SLOW_RATIO = 3.0  # Only a command this many times slower than the bare interpreter fails
+RUNS = 5
+
+
+def _loaded_heavy(code: str) -> str:
+    """Heavy modules in sys.modules after running code in a fresh interpreter."""
+    probe = f"import sys\n{code}\nprint(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True)
+    if result.returncode != 0:
+        return f"error: {result.stderr.strip().splitlines()[-1]}"
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+
+
+def _cold_start_ms(args) -> float:
+    """Best wall time of a fresh interpreter running the command."""
+    best = float('inf')
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, capture_output=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def test_imports_are_light():
+    """Test that no module imports requests, bs4 or lxml at import time."""
+    heavy = {module: _loaded_heavy(f"import {module}") for module in LIGHT_MODULES}
+    heavy = {module: loaded for module, loaded in heavy.items() if loaded}
+    assert not heavy, f"heavy imports {heavy}"
+    print(f"✓ PASS: {len(LIGHT_MODULES)} modules import without requests/bs4/lxml")
+
+
+def test_loaded_on_first_use():
+    """Test that bs4 loads on the first parse and requests only on the first network fetch."""
+    parse_only = _loaded_heavy(
+        "from tests_support import BASE_URL, FakeSession\n"
+        "from scrape_appian_docs_enhanced import EnhancedAppianDocScraper\n"
+        "scraper = EnhancedAppianDocScraper(base_url=BASE_URL)\n"
+        "scraper.session = FakeSession()\n"
+        "assert scraper.run()['docs']['functions']")
+    network = _loaded_heavy(
+        "from appian_pipeline import LazySession\n"
+        "session = LazySession({'User-Agent': 'test'})\n"
+        "try:\n"
+        "    session.get('http://127.0.0.1:9/', timeout=0.5)\n"
+        "except Exception:\n"
+        "    pass\n"
+        "assert session.headers['User-Agent'] == 'test'")
+    assert 'bs4' in parse_only and 'requests' not in parse_only and 'requests' in network, \
+        f"parse_only='{parse_only}' network='{network}'"
+    print(f"✓ PASS: offline scrape loaded only '{parse_only}'; first request loaded '{network}'")
+
+
+def test_cold_start():
+    """Benchmark cold start of the read-only commands against the 100 ms target.
+
+    Wall-clock times vary with host load, so the target is only reported; the
+    check fails just for a command several times slower than `python -c pass`,
+    which means a heavy import crept back in (test_imports_are_light says which).
+    """
+    baseline = _cold_start_ms(['-c', 'pass'])
+    print(f"  bare interpreter: {baseline:.0f} ms")
+    slow = []
+    for args in COMMANDS:
+        elapsed = _cold_start_ms(args)
+        print(f"  {' '.join(args):32s} {elapsed:5.0f} ms{'  (over target)' if elapsed >= TARGET_MS else ''}")
+        if elapsed >= baseline * SLOW_RATIO:
+            slow.append(' '.join(args))
+    assert not slow, f"over {SLOW_RATIO:.0f}x the bare interpreter: {slow}"
+    print(f"✓ PASS: every read-only command starts within {SLOW_RATIO:.0f}x the bare interpreter "
+          f"(target {TARGET_MS} ms)")
+
+
+if __name__ == "__main__":
+    print("Testing cold start and lazy imports\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_imports_are_light, test_loaded_on_first_use, test_cold_start):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test keyword syntax confidence scoring, the labeled-set report and weight fitting (no network needed)
+"""
+
+import json
+import sys
+import time
+
+from appian_syntax import (DEFAULT_LABELS, confidence, decide, evaluate, example_calls, extract_signals,
+                           fit_weights, score_corpus)
+from scrape_appian_docs_enhanced import EnhancedAppianDocScraper
+from tests_support import BASE_URL, FakeSession
+
+UI_PARAMETERS = {'Label': {'type': 'label', 'dataType': 'Text'}, 'Value': {'type': 'value', 'dataType': 'Text'}}
+PLAIN_PARAMETERS = {'array': {'type': 'array', 'dataType': 'Any Type Array'}}
+
+
+def _load(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_signals():
+    """Test that only the function's own calls count and that UI-component tables are recognized."""
+    counts = example_calls(['a!forEach(items: local!x, expression: length(fv!item))',
+                            'length({1, 2})', 'length(array: {1})'], 'length')
+    ui = extract_signals('a!textField', UI_PARAMETERS, [])
+    plain = extract_signals('append', PLAIN_PARAMETERS, ['append({1}, 2)'])
+    assert (counts == (1, 2) and ui['ui_table'] == 1.0 and ui['a_prefix'] == 1.0
+            and plain['ui_table'] == 0.0 and plain['positional_examples'] == 1.0), \
+        f"counts={counts} ui={ui} plain={plain}"
+    print("✓ PASS: example calls of other functions ignored; Name/Keyword tables detected")
+
+
+def test_evidence_strength():
+    """Test that page evidence, not the a! prefix alone, decides either way."""
+    keywords_section = confidence(extract_signals('a!match', {}, [], keywords_section=True))
+    ui_component = confidence(extract_signals('a!textField', UI_PARAMETERS, ['a!textField(label: "Name")']))
+    keyword_calls = confidence(extract_signals('webservicequery', {}, ['webservicequery(config: c, data: d)'] * 2))
+    bare_a = confidence(extract_signals('a!queryEntity', {}, []))
+    one_colon = confidence(extract_signals('sum', {}, ['sum(a!forEach(items: {1}, expression: fv!item))']))
+    a_positional = confidence(extract_signals('a!defaultValue', {}, ['a!defaultValue(null, 1)'] * 2))
+    positional = confidence(extract_signals('append', PLAIN_PARAMETERS, ['append({1}, 2)', 'append({}, 1)']))
+    ordered = (keywords_section > keyword_calls and ui_component > keyword_calls > bare_a > 0.5
+               > max(one_colon, a_positional) and min(one_colon, a_positional) > positional)
+    decisions = [decide(value) for value in (ui_component, keyword_calls, bare_a, a_positional, positional)]
+    assert ordered and decisions == [True, True, 'unknown', False, False], \
+        (f"keywords={keywords_section} ui={ui_component} calls={keyword_calls} bare={bare_a} colon={one_colon} "
+         f"a_positional={a_positional} positional={positional} decisions={decisions}")
+    print(f"✓ PASS: UI component {ui_component:.2f} > keyword calls without a! {keyword_calls:.2f} > "
+          f"bare a! {bare_a:.2f} > a! called positionally {a_positional:.2f} > positional examples {positional:.2f}")
+
+
+def test_corpus_accuracy():
+    """Test one-pass scoring of the corpus and accuracy on the labeled set."""
+    docs, syntax = _load('appian-functions-docs.json'), _load('appian-function-syntax.json')
+    labels = _load(DEFAULT_LABELS)['functions']
+    start = time.perf_counter()
+    scores = score_corpus(docs, syntax)
+    elapsed = time.perf_counter() - start
+    report = evaluate(scores, labels, syntax)
+    print(f"  {len(scores)} functions scored in {elapsed * 1000:.0f} ms; labeled accuracy {report['accuracy']:.1%} "
+          f"on {report['decided']}/{report['labeled']} (recorded evidence {report['baseline']['accuracy']:.1%})")
+    # The labeled set has counterexamples both ways, so the a! prefix alone cannot score it
+    prefix_only = [name for name in labels if labels[name] != name.startswith('a!')]
+    assert (len(scores) == len(docs['functions']) and not report['missing'] and report['accuracy'] >= 0.95
+            and report['decided'] >= 30 and report['accuracy'] > report['baseline']['accuracy'] and elapsed < 2.0
+            and len(prefix_only) >= 5 and scores['webservicequery']['keywordSyntax'] is True
+            and scores['a!listType']['keywordSyntax'] is False), \
+        f"report={ {key: report[key] for key in ('missing', 'accuracy', 'decided', 'errors')} }"
+    print(f"✓ PASS: whole corpus scored in one pass; labeled set ({len(prefix_only)} against the a! prefix) "
+          f"beats the single-evidence rule")
+
+
+def test_fit_weights():
+    """Test that fitting on labeled rows learns the direction of each signal."""
+    rows, truths = [], []
+    for prefix in (0.0, 1.0):
+        for positional in (0.0, 2.0):
+            signals = {'keywords_section': 0.0, 'ui_table': 0.0, 'keyword_examples': 0.0,
+                       'positional_examples': positional, 'a_prefix': prefix}
+            rows.extend([signals] * 5)
+            truths.extend([prefix == 1.0 and (positional == 0.0 or index < 2) for index in range(5)])
+    weights = fit_weights(rows, truths)
+    report = evaluate({str(index): {'confidence': confidence(signals, weights)} for index, signals in enumerate(rows)},
+                      {str(index): truth for index, truth in enumerate(truths)})
+    assert weights['a_prefix'] > 1.0 and weights['positional_examples'] < 0 and report['brier'] < 0.15, \
+        f"weights={weights} report={report}"
+    print(f"✓ PASS: fitted a_prefix {weights['a_prefix']}, positional_examples {weights['positional_examples']} "
+          f"(Brier {report['brier']})")
+
+
+def test_scraper_records_confidence():
+    """Test that the enhanced scraper stores a confidence next to the tri-state syntax."""
+    scraper = EnhancedAppianDocScraper(base_url=BASE_URL)
+    scraper.session = FakeSession()
+    syntax = scraper.run()['syntax']['functions']['append']
+    assert syntax['keywordSyntax'] is False and 0.0 < syntax['confidence'] < 0.2, f"syntax={syntax}"
+    print(f"✓ PASS: append() recorded as positional with confidence {syntax['confidence']}")
+
+
+if __name__ == "__main__":
+    print("Testing keyword syntax confidence scoring\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_signals, test_evidence_strength, test_corpus_accuracy, test_fit_weights,
+                 test_scraper_records_confidence):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test the compiled snippet trie: prefix, camel-hump and fuzzy lookups (no network needed)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from appian_trie import build_trie, camel_humps, load_trie, save_trie, within_one_edit
+
+TARGET_US = 100
+SLOW_RATIO = 2.0  # The trie normally beats a linear scan several times over
+
+
+def test_lookups():
+    """Test each query mode against the generated snippets file."""
+    trie = build_trie(['appian-functions-complete.json'])
+
+    checks = [
+        ("prefix 'a!forE'", 'a!forEach', trie.prefix('a!forE')),
+        ("prefix 'forE'", 'a!forEach', trie.prefix('forE')),
+        ("prefix 'appen'", 'append', trie.prefix('appen')),
+        ("camel 'qRT'", 'a!queryRecordType', trie.camel('qRT')),
+        ("camel 'queRecTy'", 'a!queryRecordType', trie.camel('queRecTy')),
+        ("camel 'lv'", 'a!localVariables', trie.camel('lv')),
+        ("fuzzy 'apend'", 'append', [name for name, _ in trie.fuzzy('apend')]),
+        ("fuzzy 'a!forEahc'", 'a!forEach', [name for name, _ in trie.fuzzy('a!forEahc', 2)]),
+        ("lookup 'a!txtField'", 'a!textField', trie.lookup('a!txtField')),
+    ]
+
+    for label, expected, results in checks:
+        assert expected in results, f"{label} -> {results[:5]} (expected {expected})"
+        print(f"✓ PASS: {label} -> {expected}")
+
+    assert camel_humps('a!queryRecordType') == ['query', 'record', 'type'], \
+        f"camel humps: {camel_humps('a!queryRecordType')}"
+    print("✓ PASS: camel humps split correctly")
+
+
+def _per_call_us(calls, repeat: int = 200) -> float:
+    """Mean microseconds per call over repeat rounds of calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for call in calls:
+            call()
+    return (time.perf_counter() - start) * 1_000_000 / (repeat * len(calls))
+
+
+def test_round_trip_and_speed():
+    """Test that a saved trie reloads, and benchmark lookups against scanning every name.
+
+    Wall-clock times vary with host load, so the 100 µs target is only reported;
+    a check fails just when the trie is SLOW_RATIO times slower than a linear
+    scan over the same names timed in this process.
+    """
+    trie_file = os.path.join(tempfile.mkdtemp(), 'trie.pkl')
+    save_trie(build_trie(['appian-functions-complete.json']), trie_file)
+    trie = load_trie(trie_file)
+
+    assert len(trie) >= 700, f"reloaded trie has {len(trie)} functions"
+    print(f"✓ PASS: reloaded trie has {len(trie)} functions")
+
+    names = [name.lower() for name in trie.hump_map]
+    queries = ['a!forE', 'appe', 'text', 'a!query', 'len']
+    typos = ['apend', 'a!txtField']
+    assert trie.prefix('a!forE', limit=10) == ['a!forEach'] and ('append', 1) in trie.fuzzy('apend'), \
+        "reloaded trie lookups"
+    benchmarks = [
+        ('prefix lookup',
+         [lambda query=query: [name for name in names if name.startswith(query.lower())][:10] for query in queries],
+         [lambda query=query: trie.prefix(query, limit=10) for query in queries]),
+        ('distance-1 fuzzy lookup',
+         [lambda query=query: [name for name in names if within_one_edit(query.lower(), name)] for query in typos],
+         [lambda query=query: trie.fuzzy(query) for query in typos]),
+    ]
+    for label, scan_calls, trie_calls in benchmarks:
+        baseline_us = _per_call_us(scan_calls)
+        elapsed_us = _per_call_us(trie_calls)
+        print(f"  {label}: {elapsed_us:.1f} µs (linear scan {baseline_us:.1f} µs)"
+              f"{'  (over target)' if elapsed_us >= TARGET_US else ''}")
+        assert elapsed_us < baseline_us * SLOW_RATIO, \
+            f"{label} takes {elapsed_us:.1f} µs, over {SLOW_RATIO:.0f}x a linear scan ({baseline_us:.1f} µs)"
+        print(f"✓ PASS: {label} within {SLOW_RATIO:.0f}x a linear scan (target {TARGET_US} µs)")
+
+
+if __name__ == "__main__":
+    print("Testing snippet trie...\n")
+
+    all_passed = True
+    for test in (test_lookups, test_round_trip_and_speed):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All trie tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
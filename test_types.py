@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test data type normalization, the type lattice and the returns/accepts indexes (no network needed)
+"""
+
+import json
+import pickle
+import sys
+import time
+
+from appian_index import build_index
+from appian_lsp import AppianLanguageServer
+from appian_types import TypeIndex, parse_type, type_ref
+
+DOCS = {'metadata': {}, 'functions': {
+    'length': {'name': 'length', 'returnType': 'Integer',
+               'parameters': {'array': {'type': 'array', 'dataType': 'Any Type Array'}}},
+    'sum': {'name': 'sum', 'returnType': 'Decimal',
+            'parameters': {'addends': {'type': 'addends', 'dataType': 'List of Number (Decimal)'}}},
+    'toboolean': {'name': 'toboolean', 'returnType': 'Boolean',
+                  'parameters': {'value': {'type': 'value', 'dataType': 'Any Type'}}},
+    'a!urlForSite': {'name': 'a!urlForSite', 'returnType': 'Text',
+                     'parameters': {'urlStub': {'type': 'urlStub', 'dataType': 'Text'},
+                                    'urlParameters': {'type': 'urlParameters', 'dataType': 'Map'}}},
+    'a!textField': {'name': 'a!textField', 'returnType': '',
+                    'parameters': {'showWhen': {'type': 'showWhen', 'dataType': 'Boolean'},
+                                   'characterLimit': {'type': 'characterLimit', 'dataType': 'Number (Integer)'}}},
+}}
+
+
+def test_normalization():
+    """Test that the docs' spellings of a type normalize to the same interned values."""
+    cases = {
+        'Any Type Array': ['Any Type Array'],
+        'List of Variant': ['Any Type Array'],
+        'Number (Integer)': ['Integer'],
+        'Number(Integer)': ['Integer'],
+        'List of Text String': ['Text Array'],
+        'Text orValidation MessageArray': ['Text', 'Validation Message Array'],
+        'List of User or Group': ['User Array', 'Group Array'],
+        'List ofa!gridColumn()': ['a!gridColumn() Array'],
+        'Date or Date and Time': ['Date', 'Date and Time'],
+        'Array of Links': ['Link Array'],
+        'SafeURI': ['Safe URI'],
+        'See also': [],
+        'The data store entity to query.': [],
+    }
+    wrong = {text: [str(ref) for ref in parse_type(text)] for text, expected in cases.items()
+             if [str(ref) for ref in parse_type(text)] != expected}
+    interned = parse_type('Integer')[0] is parse_type('Number (Integer)')[0] is type_ref('Integer')
+    unpickled = pickle.loads(pickle.dumps(parse_type('List of Text')))[0] is type_ref('Text', True)
+    assert not wrong and interned and unpickled, f"wrong={wrong} interned={interned} unpickled={unpickled}"
+    print(f"✓ PASS: {len(cases)} type spellings normalized; values interned (also across pickling)")
+
+
+def test_lattice():
+    """Test the subtype order: Integer/Decimal are Numbers, Any Type accepts everything of matching shape."""
+    integer, number, any_type = type_ref('Integer'), type_ref('Number'), type_ref('Any Type')
+    checks = [
+        integer.is_a(number), not number.is_a(integer), integer.is_a(any_type),
+        type_ref('Text', True).is_a(any_type), type_ref('Text', True).is_a(type_ref('Any Type', True)),
+        not integer.is_a(type_ref('Any Type', True)), not integer.is_a(type_ref('Number', True)),
+    ]
+    assert all(checks), f"lattice checks {checks}"
+    print("✓ PASS: lattice orders Integer < Number < Any Type, arrays kept apart")
+
+
+def test_reverse_indexes():
+    """Test 'functions returning T' and 'functions accepting T' lookups."""
+    types = TypeIndex.from_docs(DOCS)
+    returning_number = types.returning('Number')
+    returning_boolean = types.returning('Boolean')
+    accepting_map = types.accepting('Map')
+    accepting_integer = types.accepting('Integer')
+    accepting_integer_any = types.accepting('Integer', include_any=True)
+    assert (returning_number == ['length', 'sum'] and returning_boolean == ['toboolean']
+            and accepting_map == {'a!urlForSite': ['urlParameters']}
+            and accepting_integer == {'a!textField': ['characterLimit']}
+            and set(accepting_integer_any) == {'a!textField', 'toboolean'}
+            and types.accepting('Decimal Array') == {'sum': ['addends']}), \
+        (f"number={returning_number} boolean={returning_boolean} map={accepting_map} "
+         f"integer={accepting_integer} any={accepting_integer_any}")
+    print("✓ PASS: returning Number -> length, sum; accepting Map -> a!urlForSite(urlParameters)")
+
+
+def test_type_driven_completion():
+    """Test that a keyword argument's value completes functions returning the parameter's type first."""
+    server = AppianLanguageServer(build_index(DOCS))
+    text = 'a!textField(showWhen: '
+    offered = [item['label'] for item in server.complete(text, 0, len(text))]
+    text = 'a!textField(characterLimit: '
+    numbers = [item['label'] for item in server.complete(text, 0, len(text))]
+    text = 'a!textField(showWhen: to'
+    ranked = {item['label']: item['sortText'][0] for item in server.complete(text, 0, len(text))}
+    assert offered == ['toboolean'] and numbers == ['length'] and ranked.get('toboolean') == '0', \
+        f"offered={offered} numbers={numbers} ranked={ranked}"
+    print("✓ PASS: showWhen: offers Boolean-returning functions first")
+
+
+def test_corpus_lookups():
+    """Test the indexes over the scraped corpus and that lookups are fast."""
+    with open('appian-functions-docs.json', 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+    start = time.perf_counter()
+    types = TypeIndex.from_docs(docs)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        types.accepting('Map')
+        types.returning('Boolean')
+    lookup = (time.perf_counter() - start) / 2000
+    summary = types.summary()
+    print(f"  {summary['typedFunctions']} typed functions, {summary['parameterTypes']} parameter types, "
+          f"built in {build * 1000:.1f} ms, {lookup * 1e6:.1f} µs per lookup")
+    assert summary['typedFunctions'] > 500 and 'a!urlForSite' in types.accepting('Map') and lookup < 0.001, \
+        f"summary={summary} lookup={lookup}"
+    print("✓ PASS: corpus types indexed; lookups take microseconds")
+
+
+if __name__ == "__main__":
+    print("Testing type normalization and type indexes\n")
+    print("=" * 60)
+
+    all_passed = True
+    for test in (test_normalization, test_lattice, test_reverse_indexes, test_type_driven_completion,
+                 test_corpus_lookups):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✓ All tests passed!")
+    else:
+        print("\n✗ Some tests failed")
+    sys.exit(0 if all_passed else 1)
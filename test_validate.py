@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test the offline quality report and release gate over generated outputs (no network needed)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from appian_validate import gate_failures, validate
+
+DOCS = {'metadata': {}, 'functions': {
+    'append': {'name': 'append', 'description': 'Appends a value or values to the given array.',
+               'parameters': {'array': {'type': 'array'}, 'value': {'type': 'value'}}, 'deprecated': False},
+    'now': {'name': 'now', 'description': 'Returns the current date and time.', 'parameters': {},
+            'deprecated': False},
+    'today': {'name': 'today', 'description': '', 'parameters': {}, 'deprecated': False},
+    'a!httpQuery': {'name': 'a!httpQuery', 'description': '', 'parameters': {}, 'deprecated': False},
+    'length': {'name': 'length', 'description': 'Returns the number of items in the array, and this is...',
+               'parameters': {'array': {'type': 'array'}}, 'deprecated': False},
+}}
+SNIPPETS = {
+    'Appian append()': {'prefix': ['append()'], 'body': ['append(', '  array: ${1:array},', '  value: ${2:value}', ')'],
+                        'description': 'append(): Appends a value or values to the given array.'},
+    'Appian now()': {'prefix': ['now()'], 'body': ['1now(', '  ${1:/* parameters */}', ')'],
+                     'description': 'now(): now()'},
+    'Appian today()': {'prefix': ['today()'], 'body': ['today(', ')'], 'description': 'today(): today()'},
+    'Appian a!httpQuery()': {'prefix': ['a!httpQuery()'], 'body': ['a!httpQuery(', '  {x}', ')'],
+                             'description': 'a!httpQuery(): Queries an HTTP endpoint.'},
+    'Appian extra()': {'prefix': ['extra()'], 'body': ['extra(', ')'], 'description': 'extra(): Extra.'},
+}
+SYNTAX = {'metadata': {}, 'functions': {
+    'append': {'keywordSyntax': True, 'evidence': 'examples'},
+    'now': {'keywordSyntax': 'unknown', 'evidence': 'none'},
+    'today': {'keywordSyntax': 'unknown', 'evidence': 'none'},
+    'a!httpQuery': {'keywordSyntax': 'unknown', 'evidence': 'fetch_error'},
+}}
+
+
+def _write_outputs(directory: str):
+    paths = []
+    for name, data in (('snippets.json', SNIPPETS), ('docs.json', DOCS), ('syntax.json', SYNTAX)):
+        path = os.path.join(directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        paths.append(path)
+    return paths
+
+
+def test_checks_and_ranking():
+    """Test each check's flags and the worst-first ranking."""
+    with tempfile.TemporaryDirectory() as directory:
+        report = validate(*_write_outputs(directory))
+    issues = {row['name']: row['issues'] for row in report['ranked']}
+    expected = {
+        'append': [],
+        'now': ['no_parameters', 'suspicious_signature'],
+        'today': ['empty_description', 'placeholder_description', 'no_parameters'],
+        'a!httpQuery': ['fetch_error', 'empty_description', 'no_parameters', 'malformed_body'],
+        'length': ['missing_snippet', 'missing_syntax', 'truncated_description'],
+        'extra': ['missing_docs', 'missing_syntax'],
+    }
+    order = [row['name'] for row in report['ranked']]
+    scores = [row['score'] for row in report['ranked']]
+    assert (issues == expected and order == ['a!httpQuery', 'length', 'extra', 'now', 'today', 'append']
+            and scores == [0, 30, 40, 45, 45, 100] and report['perfect'] == 1), \
+        f"issues {issues}, order {order}, scores {scores}"
+    print(f"✓ PASS: checks flag the expected issues; ranked {order}")
+
+
+def test_release_gate():
+    """Test the min-score and fail-on gates."""
+    with tempfile.TemporaryDirectory() as directory:
+        report = validate(*_write_outputs(directory))
+    checks = [
+        gate_failures(report) == [],
+        len(gate_failures(report, min_score=50)) == 1,
+        gate_failures(report, fail_on=['fetch_error']) == ['1 functions fail fetch_error'],
+        gate_failures(report, min_score=0, fail_on=['missing_docs', 'fetch_error']) ==
+        ['1 functions fail missing_docs', '1 functions fail fetch_error'],
+    ]
+    assert all(checks), f"gate checks {checks}"
+    print("✓ PASS: release gate reports score and check failures")
+
+
+def test_full_corpus_speed():
+    """Test that the shipped outputs are scored well within a second."""
+    report = validate('appian-functions-complete.json', 'appian-functions-docs.json', 'appian-function-syntax.json')
+    placeholders = report['checks']['placeholder_description']['failing']
+    assert (report['functions'] == 713 and report['checks']['suspicious_signature']['failing'] >= 1
+            and placeholders < 20 and report['seconds'] < 1.0), \
+        f"{report['functions']} functions in {report['seconds']}s, {placeholders} placeholder descriptions"
+    print(f"✓ PASS: {report['functions']} functions scored in {report['seconds'] * 1000:.0f} ms "
+          f"(mean score {report['meanScore']})")
+
+
+if __name__ == "__main__":
+    print("Testing quality validation...\n")
+
+    all_passed = True
+    for test in (test_checks_and_ranking, test_release_gate, test_full_corpus_speed):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ FAIL: {e}")
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All validation tests passed!")
+    else:
+        print("✗ Some tests failed")
+    print("=" * 60)
+
+    sys.exit(0 if all_passed else 1)
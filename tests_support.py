@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Shared offline fixtures for the tests: a two-page docs site and a fake requests session
+"""
+
+BASE_URL = 'https://docs.appian.com/suite/help/25.4/Appian_Functions.html'
+PAGES = {
+    BASE_URL: b'<main><a href="fnc_array_append.html">append()</a></main>',
+    'https://docs.appian.com/suite/help/25.4/fnc_array_append.html':
+        b'<main><h1>append()</h1><p>Appends a value or values to the given array, and returns the resulting '
+        b'array.</p><h2>Syntax</h2><pre>append( array, value )</pre>'
+        b'<h2>Examples</h2><pre>append({10, 20}, 30)</pre></main>',
+}
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Stands in for requests.Session and counts network fetches."""
+    def __init__(self):
+        self.fetches = 0
+
+    def get(self, url, timeout=None):
+        self.fetches += 1
+        return FakeResponse(PAGES[url])